@@ -0,0 +1,259 @@
+"""
+벤치마크 공통 기능
+
+- 환경 설정: src 모듈을 불러오기 전에 DB/업로드 경로 등 환경 변수를 지정해야 한다 (설정은 최초 import 시 고정).
+- 시드 데이터: 앱 N개 × 버전 M개 (설치 파일은 하나를 공유, 해시는 실제 파일 기준)
+- 서버: main.py의 app을 같은 프로세스의 별도 스레드에서 uvicorn으로 실행
+  요청마다 실행된 SQL 문 수를 X-Bench-Scenario 헤더 기준으로 집계한다.
+"""
+import hashlib
+import http.client
+import json
+import math
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+BENCH_APP_PREFIX = "bench.app"
+SCENARIO_HEADER = b"x-bench-scenario"
+
+
+def configure_environment(
+    database_url: Optional[str],
+    work_dir: Optional[str] = None,
+    rate_limit: bool = False,
+    access_log: bool = False,
+    extra: Optional[Dict[str, str]] = None,
+) -> str:
+    """src import 전에 호출 (작업 디렉토리 경로 반환)"""
+    work_dir = work_dir or tempfile.mkdtemp(prefix="deploy-bench-")
+    os.makedirs(work_dir, exist_ok=True)
+    os.environ["DATABASE_URL"] = database_url or f"sqlite:///{os.path.join(work_dir, 'bench.db')}"
+    os.environ["UPLOAD_DIR"] = os.path.join(work_dir, "uploads")
+    os.environ["RATE_LIMIT_ENABLED"] = "true" if rate_limit else "false"
+    os.environ["ACCESS_LOG_ENABLED"] = "true" if access_log else "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ.pop("STATIC_EXPORT_DIR", None)
+    for key, value in (extra or {}).items():
+        os.environ[key] = value
+    return work_dir
+
+
+def git_revision() -> Optional[str]:
+    """결과 비교용 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=5,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def seed(apps: int, versions: int, file_size: int) -> dict:
+    """마이그레이션 적용 후 벤치마크용 앱/버전 생성 (기존 벤치마크 데이터는 삭제)"""
+    from src.config import get_settings
+    from src.database import SessionLocal
+    from src.migrate import run_migrations
+    from src.models import App, AppVersion, ReleaseChannel
+    from src.startup import ensure_admin_user
+
+    settings = get_settings()
+    run_migrations(configure_logging=False)
+    ensure_admin_user()
+
+    os.makedirs(settings.upload_dir, exist_ok=True)
+    file_path = os.path.join(settings.upload_dir, "bench-setup.bin")
+    payload = os.urandom(file_size)
+    with open(file_path, "wb") as f:
+        f.write(payload)
+    file_hash = hashlib.sha256(payload).hexdigest()
+
+    db = SessionLocal()
+    try:
+        old_ids = [app_id for (app_id,) in db.query(App.id).filter(App.app_id.like(f"{BENCH_APP_PREFIX}%")).all()]
+        if old_ids:
+            db.query(AppVersion).filter(AppVersion.app_id.in_(old_ids)).delete(synchronize_session=False)
+            db.query(App).filter(App.id.in_(old_ids)).delete(synchronize_session=False)
+            db.commit()
+
+        app_ids: List[str] = []
+        for i in range(apps):
+            app = App(
+                app_id=f"{BENCH_APP_PREFIX}{i}",
+                name=f"Benchmark App {i}",
+                description="벤치마크용 앱",
+                detail_html="<p>" + "벤치마크 상세 설명 " * 50 + "</p>",
+                is_public=True,
+            )
+            db.add(app)
+            db.flush()
+            for j in range(versions):
+                db.add(AppVersion(
+                    app_id=app.id,
+                    version=f"1.{j}.0",
+                    channel=ReleaseChannel.STABLE,
+                    release_notes=f"버전 1.{j}.0 변경 사항",
+                    file_name="bench-setup.bin",
+                    file_path=file_path,
+                    file_size=file_size,
+                    file_hash=file_hash,
+                    is_active=True,
+                    is_mandatory=(j % 5 == 4),
+                ))
+            app_ids.append(app.app_id)
+        db.commit()
+
+        version_ids = [
+            version_id for (version_id,) in db.query(AppVersion.id)
+            .join(App, App.id == AppVersion.app_id)
+            .filter(App.app_id.like(f"{BENCH_APP_PREFIX}%"))
+            .all()
+        ]
+    finally:
+        db.close()
+    return {"app_ids": app_ids, "version_ids": version_ids, "file_path": file_path, "file_hash": file_hash}
+
+
+class QueryCounter:
+    """시나리오별 요청당 SQL 문 수 집계 ASGI 래퍼"""
+
+    def __init__(self, app):
+        self.app = app
+        self.counts: Dict[str, List[int]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.counts.clear()
+
+    async def __call__(self, scope, receive, send):
+        scenario = None
+        if scope["type"] == "http":
+            for name, value in scope["headers"]:
+                if name == SCENARIO_HEADER:
+                    scenario = value.decode("latin-1")
+                    break
+        if scenario is None:
+            await self.app(scope, receive, send)
+            return
+
+        from src import query_stats
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                # 응답 시작 시점은 ProfilingMiddleware의 요청 컨텍스트 안이므로 해당 요청의 통계가 보임
+                stats = query_stats.current()
+                if stats is not None:
+                    with self._lock:
+                        self.counts[scenario].append(stats.count)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class BenchServer:
+    """main.py의 app을 백그라운드 스레드에서 실행"""
+
+    def __init__(self, ready_timeout: float = 60.0):
+        import uvicorn
+        from src.main import app
+
+        self.counter = QueryCounter(app)
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self.ready_timeout = ready_timeout
+        self._server = uvicorn.Server(uvicorn.Config(
+            self.counter, host="127.0.0.1", port=self.port,
+            log_level="warning", access_log=False, lifespan="on",
+        ))
+        self._thread = threading.Thread(target=self._server.run, name="bench-server", daemon=True)
+
+    def __enter__(self) -> "BenchServer":
+        self._thread.start()
+        client = HttpClient(self.port)
+        deadline = time.monotonic() + self.ready_timeout
+        while time.monotonic() < deadline:
+            try:
+                if client.request("GET", "/health/ready")[0] == 200:
+                    return self
+            except OSError:
+                pass
+            time.sleep(0.1)
+        self.__exit__(None, None, None)
+        raise RuntimeError("서버가 준비되지 않았습니다 (/health/ready)")
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+class HttpClient:
+    """keep-alive HTTP 클라이언트 (스레드마다 하나씩 사용, 표준 라이브러리만 사용)"""
+
+    def __init__(self, port: int, host: str = "127.0.0.1", timeout: float = 30.0):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        body: Optional[bytes] = None,
+    ) -> Tuple[int, bytes, Dict[str, str]]:
+        for attempt in range(2):
+            if self._conn is None:
+                self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            try:
+                self._conn.request(method, path, body=body, headers=headers or {})
+                response = self._conn.getresponse()
+                data = response.read()
+                return response.status, data, {k.lower(): v for k, v in response.getheaders()}
+            except (http.client.HTTPException, ConnectionError):
+                # 서버가 keep-alive 연결을 닫은 경우 한 번 재연결
+                self.close()
+                if attempt:
+                    raise
+        raise RuntimeError("unreachable")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def percentile(sorted_values: List[float], p: float) -> Optional[float]:
+    """정렬된 값의 백분위수 (최근접 순위)"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def login_token(port: int) -> str:
+    from src.config import get_settings
+
+    settings = get_settings()
+    status, body, _ = HttpClient(port).request(
+        "POST", "/api/auth/login",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        body=urlencode({"username": settings.admin_email, "password": settings.admin_password}).encode(),
+    )
+    if status != 200:
+        raise RuntimeError(f"관리자 로그인 실패: {status}")
+    return json.loads(body)["access_token"]
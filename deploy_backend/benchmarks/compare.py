@@ -0,0 +1,72 @@
+"""
+벤치마크 결과 비교
+
+두 결과 파일(api_benchmark.py, semver_benchmark.py 출력)의 시나리오별 지연 시간/처리량/SQL 문 수를 비교하고,
+허용 범위를 넘게 나빠진 항목이 있으면 종료 코드 1을 반환한다.
+
+    python -m benchmarks.compare base.json new.json --threshold 10
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional, Tuple
+
+# (결과 경로, 표시 이름, 값이 클수록 나쁜지)
+METRICS: List[Tuple[Tuple[str, ...], str, bool]] = [
+    (("latency_ms", "p50"), "p50 ms", True),
+    (("latency_ms", "p95"), "p95 ms", True),
+    (("latency_ms", "p99"), "p99 ms", True),
+    (("throughput_rps",), "req/s", False),
+    (("db_queries", "mean"), "queries", True),
+    (("ops_per_sec",), "ops/s", False),
+]
+
+
+def _get(result: dict, path: Tuple[str, ...]) -> Optional[float]:
+    for key in path:
+        if not isinstance(result, dict):
+            return None
+        result = result.get(key)
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("base", help="기준 결과 JSON")
+    parser.add_argument("new", help="비교할 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=10.0, help="회귀로 판단할 변화율 (%%)")
+    args = parser.parse_args(argv)
+
+    with open(args.base, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(args.new, encoding="utf-8") as f:
+        new = json.load(f)
+
+    print(f"base: {base.get('revision')}  new: {new.get('revision')}")
+    if base.get("params") != new.get("params"):
+        print("주의: 두 결과의 실행 조건(params)이 다릅니다")
+
+    regressions = []
+    for name, new_result in new.get("scenarios", {}).items():
+        base_result = base.get("scenarios", {}).get(name)
+        if base_result is None:
+            continue
+        for path, label, higher_is_worse in METRICS:
+            old_value, new_value = _get(base_result, path), _get(new_result, path)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) / old_value * 100
+            worse = change > args.threshold if higher_is_worse else change < -args.threshold
+            marker = "  <-- 회귀" if worse else ""
+            print(f"{name:<16}{label:<9}{old_value:>10.2f} -> {new_value:>10.2f}  ({change:+.1f}%){marker}")
+            if worse:
+                regressions.append(f"{name} {label}")
+
+    if regressions:
+        print(f"회귀 {len(regressions)}건: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
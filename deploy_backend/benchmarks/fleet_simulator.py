@@ -0,0 +1,406 @@
+"""
+클라이언트 플릿 폴링 시뮬레이터 (용량 산정용)
+
+Python SDK의 AutoUpdater 인스턴스 여러 개를 가상 클라이언트로 실행하여 설치된 클라이언트 전체(플릿)의
+주기적 업데이트 확인을 재현하고, 새 버전 배포 시 확인 → 다운로드가 몰리는 상황을 측정한다.
+
+가상 클라이언트 수(--clients)가 실제 플릿(--fleet-size)보다 적은 만큼 시간을 압축한다.
+예) 플릿 100,000대, 가상 클라이언트 2,000개 → 시간 배율 50 (확인 주기 60분 → 실제 72초)
+이렇게 하면 서버가 받는 초당 요청 수는 실제 플릿과 같다. 단, 파일 전송 시간은 압축되지 않는다.
+
+측정 항목:
+- 서버: DB 풀 사용량, 수락 제어 처리 중/대기 요청 수, 거부(503) 수
+- 클라이언트: 업데이트 확인/다운로드 지연 시간, 429/503 응답 수, 예약 대비 실행 지연
+- 배포 후 플릿의 X%가 업데이트를 마칠 때까지 걸린 시간 (시뮬레이션 시간 기준)
+
+실행 (deploy_backend 디렉토리에서, SDK 의존성 requests 필요):
+    python -m benchmarks.fleet_simulator --fleet-size 100000 --clients 2000 --interval-minutes 60
+"""
+import argparse
+import heapq
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from .common import BenchServer, configure_environment, git_revision, percentile, seed
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SDK_DIR = os.path.join(REPO_DIR, "sdk", "python")
+
+RELEASE_VERSION = "2.0.0"
+
+
+class VirtualClient:
+    """가상 클라이언트 하나 (AutoUpdater 인스턴스, 확인 주기 계산기와 예약 상태)"""
+
+    __slots__ = ("index", "updater", "scheduler", "due", "updated_at")
+
+    def __init__(self, index: int, updater, scheduler):
+        self.index = index
+        self.updater = updater
+        self.scheduler = scheduler
+        self.due = 0.0
+        self.updated_at: Optional[float] = None
+
+
+class FleetStats:
+    """클라이언트 측 측정값 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.check_latencies: List[float] = []
+        self.download_latencies: List[float] = []
+        self.lags: List[float] = []
+        self.outcomes: Counter = Counter()
+
+    def record(self, outcome: str, latency: Optional[float] = None, kind: Optional[str] = None) -> None:
+        with self._lock:
+            self.outcomes[outcome] += 1
+            if kind == "check":
+                self.check_latencies.append(latency)
+            elif kind == "download":
+                self.download_latencies.append(latency)
+
+    def record_lag(self, lag: float) -> None:
+        with self._lock:
+            self.lags.append(lag)
+
+
+class ServerSampler(threading.Thread):
+    """DB 풀/수락 제어 상태를 주기적으로 기록 (서버와 같은 프로세스)"""
+
+    def __init__(self, interval: float):
+        super().__init__(name="fleet-sampler", daemon=True)
+        self.interval = interval
+        self.samples: List[Dict] = []
+        self._stopping = threading.Event()
+        self._begin = time.monotonic()
+
+    def run(self) -> None:
+        from src.admission import admission_controller
+        from src.database import engine
+
+        while not self._stopping.wait(self.interval):
+            stats = admission_controller.stats()
+            self.samples.append({
+                "t": round(time.monotonic() - self._begin, 2),
+                "pool_checked_out": engine.pool.checkedout(),
+                "in_flight": stats["in_flight"],
+                "queued_high": stats["queued"].get("high", 0),
+                "queued_low": stats["queued"].get("low", 0),
+                "shed_high": stats["shed"].get("high", 0),
+            })
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self.join(timeout=5)
+
+
+def publish_release(app_ids: List[str], file_path: str, file_hash: str, file_size: int) -> None:
+    """모든 벤치마크 앱에 새 버전 배포 (버전 업로드와 같은 이벤트 발행)"""
+    from src import events
+    from src.database import SessionLocal
+    from src.models import App, AppVersion, ReleaseChannel
+
+    db = SessionLocal()
+    try:
+        for app in db.query(App).filter(App.app_id.in_(app_ids)).all():
+            db.add(AppVersion(
+                app_id=app.id,
+                version=RELEASE_VERSION,
+                channel=ReleaseChannel.STABLE,
+                release_notes="플릿 시뮬레이션 배포",
+                file_name="bench-setup.bin",
+                file_path=file_path,
+                file_size=file_size,
+                file_hash=file_hash,
+                is_active=True,
+                published_at=datetime.now(timezone.utc),
+            ))
+        db.commit()
+    finally:
+        db.close()
+    for app_id in app_ids:
+        events.publish(events.VERSION_CHANGED, app_id)
+
+
+def _latency_summary(values: List[float]) -> Dict:
+    ordered = sorted(value * 1000 for value in values)
+    if not ordered:
+        return {"count": 0, "p50": None, "p95": None, "p99": None, "max": None}
+    return {
+        "count": len(ordered),
+        "p50": round(percentile(ordered, 50), 3),
+        "p95": round(percentile(ordered, 95), 3),
+        "p99": round(percentile(ordered, 99), 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def _server_summary(samples: List[Dict], pool_capacity: int) -> Dict:
+    if not samples:
+        return {}
+    checked_out = [sample["pool_checked_out"] for sample in samples]
+    queued = [sample["queued_high"] + sample["queued_low"] for sample in samples]
+    return {
+        "pool_capacity": pool_capacity,
+        "pool_checked_out_peak": max(checked_out),
+        "pool_checked_out_mean": round(statistics.fmean(checked_out), 2),
+        "pool_saturated_ratio": round(sum(1 for value in checked_out if value >= pool_capacity) / len(samples), 4),
+        "in_flight_peak": max(sample["in_flight"] for sample in samples),
+        "queue_depth_peak": max(queued),
+        "queue_depth_mean": round(statistics.fmean(queued), 2),
+        "shed_high_priority": samples[-1]["shed_high"],
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="클라이언트 플릿 폴링 시뮬레이터")
+    parser.add_argument("--database-url", help="미지정 시 임시 SQLite 파일 사용")
+    parser.add_argument("--work-dir", help="SQLite 파일/업로드 파일 위치 (미지정 시 임시 디렉토리)")
+    parser.add_argument("--fleet-size", type=int, default=100000, help="재현할 실제 설치 클라이언트 수")
+    parser.add_argument("--clients", type=int, default=2000, help="가상 클라이언트 수 (AutoUpdater 인스턴스)")
+    parser.add_argument("--interval-minutes", type=float, default=60, help="클라이언트 auto_check_interval_minutes")
+    parser.add_argument("--jitter", type=float, default=0.1, help="클라이언트 auto_check_jitter (확인 주기 편차 비율)")
+    parser.add_argument("--check-on-start", action="store_true",
+                        help="클라이언트 auto_check_on_start (모든 클라이언트가 시작 직후 확인, 시작이 몰리는 상황)")
+    parser.add_argument("--release-after-minutes", type=float, help="새 버전 배포 시각 (기본: 확인 주기 1회 후)")
+    parser.add_argument("--max-minutes", type=float, help="배포 후 최대 시뮬레이션 시간 (기본: 확인 주기 3회)")
+    parser.add_argument("--targets", default="50,90,99", help="업데이트 완료 비율 목표 (%%, 콤마 구분)")
+    parser.add_argument("--apps", type=int, default=5, help="앱 수 (클라이언트를 고르게 배분)")
+    parser.add_argument("--file-size", type=int, default=256 * 1024, help="설치 파일 크기 (bytes)")
+    parser.add_argument("--client-threads", type=int, default=64, help="가상 클라이언트 요청을 실행할 스레드 수")
+    parser.add_argument("--db-pool-size", type=int, help="서버 DB_POOL_SIZE")
+    parser.add_argument("--db-max-overflow", type=int, help="서버 DB_MAX_OVERFLOW")
+    parser.add_argument("--rate-limit", action="store_true", help="서버 요청 수 제한 사용")
+    parser.add_argument("--sample-interval", type=float, default=0.5, help="서버 상태 기록 간격 (초)")
+    parser.add_argument("--seed", type=int, default=1, help="시작 시각 분산 난수 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (미지정 시 표준 출력)")
+    args = parser.parse_args(argv)
+
+    if args.clients <= 0 or args.fleet_size < args.clients:
+        parser.error("--clients는 1 이상, --fleet-size 이하여야 합니다")
+    targets = sorted(float(value) for value in args.targets.split(",") if value.strip())
+
+    if SDK_DIR not in sys.path:
+        sys.path.insert(0, SDK_DIR)
+    try:
+        from deploy_helper import AutoUpdater, ServerBusyError
+        from deploy_helper.scheduler import PollScheduler
+    except ImportError as e:
+        print(f"Python SDK를 불러올 수 없습니다 ({e}). pip install requests 후 다시 실행하세요.", file=sys.stderr)
+        return 2
+
+    # 서버 권장 확인 주기도 같은 값으로 (클라이언트는 응답의 poll_interval_seconds를 따름)
+    extra = {"UPDATE_POLL_INTERVAL_SECONDS": str(max(1, round(args.interval_minutes * 60)))}
+    if args.db_pool_size is not None:
+        extra["DB_POOL_SIZE"] = str(args.db_pool_size)
+    if args.db_max_overflow is not None:
+        extra["DB_MAX_OVERFLOW"] = str(args.db_max_overflow)
+    work_dir = configure_environment(args.database_url, args.work_dir, rate_limit=args.rate_limit, extra=extra)
+    from src.config import get_settings
+    from src.database import engine
+
+    settings = get_settings()
+    data = seed(args.apps, 3, args.file_size)
+    current_version = "1.2.0"
+
+    # 시간 배율: 가상 클라이언트 하나가 실제 클라이언트 time_scale대를 대신함
+    time_scale = args.fleet_size / args.clients
+    interval = args.interval_minutes * 60 / time_scale  # 실제 초
+    release_after = (args.release_after_minutes if args.release_after_minutes is not None
+                     else args.interval_minutes) * 60 / time_scale
+    max_after_release = (args.max_minutes if args.max_minutes is not None
+                         else args.interval_minutes * 3) * 60 / time_scale
+
+    download_root = os.path.join(work_dir, "fleet-downloads")
+    stats = FleetStats()
+    rng = random.Random(args.seed)
+    heap: List = []
+    heap_cond = threading.Condition()
+    stop = threading.Event()
+    release_time: List[float] = []
+
+    with BenchServer() as server:
+        clients = []
+        for index in range(args.clients):
+            download_dir = os.path.join(download_root, str(index))
+            os.makedirs(download_dir, exist_ok=True)
+            clients.append(VirtualClient(index, AutoUpdater(
+                server_url=server.base_url,
+                app_id=data["app_ids"][index % len(data["app_ids"])],
+                current_version=current_version,
+                client_id=f"fleet-{index}",
+                download_path=download_dir,
+                max_retries=1,
+            ), PollScheduler(interval, jitter=args.jitter, rng=random.Random(rng.random()),
+                             check_on_start=args.check_on_start)))
+
+        def schedule(client: VirtualClient, at: float) -> None:
+            client.due = at
+            with heap_cond:
+                heapq.heappush(heap, (at, client.index))
+                heap_cond.notify()
+
+        def cycle(client: VirtualClient) -> None:
+            """
+            AutoUpdater 자동 확인 1회 (업데이트가 있으면 다운로드 후 설치한 것으로 간주)
+
+            다음 확인 시각은 SDK 자동 확인과 같은 PollScheduler로 계산한다 (서버 권장 주기는 시간 배율 적용).
+            """
+            stats.record_lag(time.monotonic() - client.due)
+            try:
+                started = time.perf_counter()
+                info = client.updater.check_for_update()
+                stats.record("check_ok", time.perf_counter() - started, "check")
+                server_interval = info.poll_interval_seconds / time_scale if info.poll_interval_seconds else None
+                delay = client.scheduler.success(server_interval)
+                if info.update_available:
+                    started = time.perf_counter()
+                    file_path = client.updater.download_update(info)
+                    stats.record("download_ok", time.perf_counter() - started, "download")
+                    os.remove(file_path)
+                    client.updater.config.current_version = info.latest_version
+                    client.updated_at = time.monotonic()
+            except ServerBusyError as e:
+                status = e.response.status_code if e.response is not None else "client"
+                stats.record(f"busy_{status}")
+                delay = client.scheduler.failure(e.retry_after)
+            except Exception as e:
+                stats.record(f"error_{type(e).__name__}")
+                delay = client.scheduler.failure()
+            if not stop.is_set():
+                schedule(client, time.monotonic() + delay)
+
+        sampler = ServerSampler(args.sample_interval)
+        sampler.start()
+        started_at = time.monotonic()
+        for client in clients:
+            # 첫 확인 시각도 SDK 자동 확인과 같은 방식으로
+            schedule(client, started_at + client.scheduler.initial_delay())
+
+        def updated_ratio() -> float:
+            return sum(1 for client in clients if client.updated_at is not None) / len(clients)
+
+        with ThreadPoolExecutor(max_workers=args.client_threads) as pool:
+            while True:
+                now = time.monotonic()
+                if not release_time and now - started_at >= release_after:
+                    publish_release(data["app_ids"], data["file_path"], data["file_hash"], args.file_size)
+                    release_time.append(time.monotonic())
+                    print(f"released {RELEASE_VERSION} at +{now - started_at:.1f}s", file=sys.stderr)
+                if release_time and (updated_ratio() * 100 >= targets[-1]
+                                     or now - release_time[0] >= max_after_release):
+                    break
+
+                with heap_cond:
+                    if not heap:
+                        heap_cond.wait(timeout=0.1)
+                        continue
+                    due, index = heap[0]
+                    wait = due - time.monotonic()
+                    if wait > 0:
+                        heap_cond.wait(timeout=min(wait, 0.1))
+                        continue
+                    heapq.heappop(heap)
+                pool.submit(cycle, clients[index])
+            stop.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        finished_at = time.monotonic()
+        sampler.stop()
+
+    shutil.rmtree(download_root, ignore_errors=True)
+
+    release_at = release_time[0]
+    update_offsets = sorted(
+        (client.updated_at - release_at) * time_scale / 60
+        for client in clients if client.updated_at is not None
+    )
+    time_to_target = {}
+    for target in targets:
+        needed = int(-(-target * len(clients) // 100))  # 올림
+        time_to_target[f"{target:g}%"] = (
+            round(update_offsets[needed - 1], 2) if 0 < needed <= len(update_offsets) else None
+        )
+
+    elapsed = finished_at - started_at
+    pool_capacity = settings.db_pool_size + settings.db_max_overflow
+    lags = sorted(stats.lags)
+    report = {
+        "benchmark": "fleet",
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": engine.dialect.name,
+        },
+        "params": {
+            "fleet_size": args.fleet_size,
+            "clients": args.clients,
+            "time_scale": round(time_scale, 3),
+            "interval_minutes": args.interval_minutes,
+            "jitter": args.jitter,
+            "check_on_start": args.check_on_start,
+            "apps": args.apps,
+            "file_size": args.file_size,
+            "client_threads": args.client_threads,
+            "db_pool_size": settings.db_pool_size,
+            "db_max_overflow": settings.db_max_overflow,
+            "rate_limit": args.rate_limit,
+        },
+        "load": {
+            "expected_check_rps": round(args.fleet_size / (args.interval_minutes * 60), 2),
+            "observed_check_rps": round(len(stats.check_latencies) / elapsed, 2) if elapsed else None,
+            "elapsed_real_s": round(elapsed, 2),
+            "release_at_real_s": round(release_at - started_at, 2),
+        },
+        "outcomes": dict(sorted(stats.outcomes.items())),
+        "latency_ms": {
+            "check": _latency_summary(stats.check_latencies),
+            "download": _latency_summary(stats.download_latencies),
+        },
+        # 예약 시각 대비 실제 실행 지연 (크면 시뮬레이터 쪽 스레드가 부족한 것이므로 --client-threads 증가)
+        "client_lag_ms": {
+            "p95": round(percentile(lags, 95) * 1000, 3) if lags else None,
+            "max": round(lags[-1] * 1000, 3) if lags else None,
+        },
+        "server": _server_summary(sampler.samples, pool_capacity),
+        "rollout": {
+            "updated_ratio": round(len(update_offsets) / len(clients), 4),
+            "minutes_to_target": time_to_target,
+        },
+    }
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    server_summary = report["server"]
+    print(
+        f"fleet {args.fleet_size} @ {args.interval_minutes:g}min: "
+        f"{report['load']['observed_check_rps']} checks/s (expected {report['load']['expected_check_rps']}), "
+        f"pool peak {server_summary.get('pool_checked_out_peak')}/{pool_capacity}, "
+        f"queue peak {server_summary.get('queue_depth_peak')}, "
+        f"rollout {time_to_target}",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
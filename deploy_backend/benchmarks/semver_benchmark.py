@@ -0,0 +1,145 @@
+"""
+버전 파싱/비교 마이크로벤치마크 (src/semver.py)
+
+서버나 DB 없이 실행한다. 결과 형식은 api_benchmark.py와 같아 compare.py로 비교할 수 있다.
+
+    python -m benchmarks.semver_benchmark --output semver.json
+"""
+import argparse
+import bisect
+import json
+import platform
+import random
+import sys
+import timeit
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+from .common import git_revision
+
+PRERELEASE_TAGS = ("alpha", "beta", "rc")
+
+
+def _legacy_parse(version: str) -> tuple:
+    """기존 라우터별 파서 (비교 기준)"""
+    try:
+        return tuple(int(p) for p in version.split("."))
+    except (ValueError, AttributeError):
+        return (0, 0, 0)
+
+
+def make_versions(count: int, rng: random.Random) -> List[str]:
+    """정식/프리릴리스/빌드 메타데이터가 섞인 버전 문자열"""
+    versions = []
+    for _ in range(count):
+        text = f"{rng.randrange(5)}.{rng.randrange(30)}.{rng.randrange(100)}"
+        roll = rng.random()
+        if roll < 0.2:
+            text += f"-{rng.choice(PRERELEASE_TAGS)}.{rng.randrange(20)}"
+        elif roll < 0.25:
+            text += f"+build.{rng.randrange(1000)}"
+        versions.append(text)
+    return versions
+
+
+def _measure(func: Callable[[], None], operations: int, repeat: int) -> Dict:
+    """가장 빠른 회차 기준 초당 연산 수"""
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return {
+        "operations": operations,
+        "best_s": round(best, 6),
+        "ops_per_sec": round(operations / best, 1) if best else None,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="버전 파싱/비교 마이크로벤치마크")
+    parser.add_argument("--count", type=int, default=20000, help="버전 문자열 수")
+    parser.add_argument("--distinct", type=int, default=500, help="캐시 적중 측정 시 서로 다른 버전 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수 (가장 빠른 값 사용)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="결과 JSON 파일 경로 (미지정 시 표준 출력)")
+    args = parser.parse_args(argv)
+
+    from src import semver
+
+    rng = random.Random(args.seed)
+    versions = make_versions(args.count, rng)
+    hot = make_versions(args.distinct, rng)
+    hot_stream = [rng.choice(hot) for _ in range(args.count)]
+    pairs = list(zip(hot_stream, reversed(hot_stream)))
+
+    def parse_uncached():
+        semver._parse_cached.cache_clear()
+        for version in versions:
+            semver.try_parse(version)
+
+    def parse_cached():
+        for version in hot_stream:
+            semver.version_key(version)
+
+    def legacy_parse():
+        for version in versions:
+            _legacy_parse(version)
+
+    def compare_strings():
+        for v1, v2 in pairs:
+            semver.compare(v1, v2)
+
+    keys = [semver.version_key(version) for version in hot_stream]
+    key_pairs = list(zip(keys, reversed(keys)))
+
+    def compare_keys():
+        for k1, k2 in key_pairs:
+            k1 < k2
+
+    def sort_strings():
+        sorted(hot_stream, key=semver.version_key)
+
+    sorted_keys = sorted(keys)
+    probes = [semver.version_key(version) for version in hot[:200]]
+
+    def bisect_keys():
+        for probe in probes:
+            bisect.bisect_right(sorted_keys, probe)
+
+    cases: Dict[str, Dict] = {
+        "parse_uncached": _measure(parse_uncached, len(versions), args.repeat),
+        "parse_cached": _measure(parse_cached, len(hot_stream), args.repeat),
+        "legacy_parse": _measure(legacy_parse, len(versions), args.repeat),
+        "compare_strings": _measure(compare_strings, len(pairs), args.repeat),
+        "compare_keys": _measure(compare_keys, len(key_pairs), args.repeat),
+        "sort_strings": _measure(sort_strings, len(hot_stream), args.repeat),
+        "bisect_keys": _measure(bisect_keys, len(probes), args.repeat),
+    }
+
+    report = {
+        "benchmark": "semver",
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "params": {
+            "count": args.count,
+            "distinct": args.distinct,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "scenarios": cases,
+    }
+
+    for name, result in cases.items():
+        print(f"{name:<18}{result['ops_per_sec']:>14,.0f} ops/s", file=sys.stderr)
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
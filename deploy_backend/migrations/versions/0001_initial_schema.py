@@ -0,0 +1,85 @@
+"""초기 스키마 (users, apps, app_versions)
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("hashed_password", sa.String(length=255), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_admin", sa.Boolean(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_id", "users", ["id"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "apps",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("app_id", sa.String(length=100), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("group", sa.String(length=100), nullable=True),
+        sa.Column("detail_html", sa.Text(), nullable=True),
+        sa.Column("custom_css", sa.Text(), nullable=True),
+        sa.Column("icon_url", sa.String(length=500), nullable=True),
+        sa.Column("is_public", sa.Boolean(), nullable=True),
+        sa.Column("manual_file_path", sa.String(length=500), nullable=True),
+        sa.Column("manual_file_name", sa.String(length=255), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_apps_id", "apps", ["id"])
+    op.create_index("ix_apps_app_id", "apps", ["app_id"], unique=True)
+    op.create_index("ix_apps_group", "apps", ["group"])
+
+    op.create_table(
+        "app_versions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("app_id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.String(length=50), nullable=False),
+        sa.Column("channel", sa.Enum("STABLE", "BETA", "ALPHA", name="releasechannel"), nullable=True),
+        sa.Column("release_notes", sa.Text(), nullable=True),
+        sa.Column("file_name", sa.String(length=255), nullable=False),
+        sa.Column("file_path", sa.String(length=500), nullable=False),
+        sa.Column("file_size", sa.Integer(), nullable=False),
+        sa.Column("file_hash", sa.String(length=64), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.Column("is_mandatory", sa.Boolean(), nullable=True),
+        sa.Column("download_count", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("published_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["app_id"], ["apps.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_app_versions_id", "app_versions", ["id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_app_versions_id", table_name="app_versions")
+    op.drop_table("app_versions")
+    sa.Enum(name="releasechannel").drop(op.get_bind(), checkfirst=True)
+    op.drop_index("ix_apps_group", table_name="apps")
+    op.drop_index("ix_apps_app_id", table_name="apps")
+    op.drop_index("ix_apps_id", table_name="apps")
+    op.drop_table("apps")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_table("users")
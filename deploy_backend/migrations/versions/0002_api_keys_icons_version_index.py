@@ -0,0 +1,73 @@
+"""API 키, 아이콘 메타데이터 테이블 및 app_versions.app_id 인덱스
+
+이전에 create_all로 생성된 DB에는 테이블이 이미 있을 수 있으므로 존재 여부를 확인한다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    if "api_keys" not in tables:
+        op.create_table(
+            "api_keys",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("app_id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.Column("key_prefix", sa.String(length=16), nullable=False),
+            sa.Column("key_hash", sa.String(length=64), nullable=False),
+            sa.Column("scopes", sa.String(length=255), nullable=False),
+            sa.Column("is_active", sa.Boolean(), nullable=True),
+            sa.Column("expires_at", sa.DateTime(timezone=True), nullable=True),
+            sa.Column("created_by", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.ForeignKeyConstraint(["app_id"], ["apps.id"]),
+            sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_api_keys_id", "api_keys", ["id"])
+        op.create_index("ix_api_keys_app_id", "api_keys", ["app_id"])
+        op.create_index("ix_api_keys_key_hash", "api_keys", ["key_hash"], unique=True)
+
+    if "app_icons" not in tables:
+        op.create_table(
+            "app_icons",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("app_id", sa.Integer(), nullable=False),
+            sa.Column("file_path", sa.String(length=500), nullable=False),
+            sa.Column("mime_type", sa.String(length=50), nullable=False),
+            sa.Column("file_hash", sa.String(length=64), nullable=False),
+            sa.Column("file_size", sa.Integer(), nullable=False),
+            sa.Column("variant_sizes", sa.String(length=100), nullable=True),
+            sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+            sa.ForeignKeyConstraint(["app_id"], ["apps.id"]),
+            sa.PrimaryKeyConstraint("id"),
+            sa.UniqueConstraint("app_id"),
+        )
+        op.create_index("ix_app_icons_id", "app_icons", ["id"])
+
+    version_indexes = {index["name"] for index in inspector.get_indexes("app_versions")}
+    if "ix_app_versions_app_id" not in version_indexes:
+        op.create_index("ix_app_versions_app_id", "app_versions", ["app_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_app_versions_app_id", table_name="app_versions")
+    op.drop_index("ix_app_icons_id", table_name="app_icons")
+    op.drop_table("app_icons")
+    op.drop_index("ix_api_keys_key_hash", table_name="api_keys")
+    op.drop_index("ix_api_keys_app_id", table_name="api_keys")
+    op.drop_index("ix_api_keys_id", table_name="api_keys")
+    op.drop_table("api_keys")
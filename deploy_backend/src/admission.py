@@ -0,0 +1,179 @@
+"""
+DB 커넥션 풀 기반 요청 수락 제어 (load shedding)
+
+커넥션 풀이 포화되면 요청이 pool_timeout 동안 대기하다 실패하고, 그동안 워커는
+계속 새 요청을 받아 상황이 악화된다. 이를 막기 위해 DB를 사용하는 요청을 우선순위별로
+수락/대기/거부한다.
+
+- HIGH (업데이트 확인, 다운로드): 풀 전체 용량까지 즉시 수락, 초과 시 짧게 대기 후 503
+- LOW (대시보드, 히스토리 등): 풀 용량의 일부까지만 사용, 초과 시 제한된 크기의 큐에서 대기.
+  큐가 가득 차거나 대기 시간이 지나면 바로 503 + Retry-After
+
+대기 중인 요청은 HIGH가 항상 먼저 깨어난다. 상태는 워커(이벤트 루프)별로 관리한다.
+수락 제어를 거치지 않는 요청이 커넥션을 반납해도 release()가 불리지 않으므로,
+대기 중인 요청은 짧은 간격으로 풀 상태를 다시 확인한다.
+"""
+import asyncio
+import math
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict
+
+from fastapi import HTTPException, status
+
+from .config import get_settings
+
+settings = get_settings()
+
+# 대기 중 풀 상태 재확인 간격 (초)
+RECHECK_INTERVAL = 0.05
+
+
+class Priority(str, Enum):
+    HIGH = "high"
+    LOW = "low"
+
+
+class AdmissionController:
+    """우선순위별 동시 DB 사용 요청 수 제한"""
+
+    def __init__(
+        self,
+        capacity: int,
+        low_priority_limit: int,
+        queue_size: int,
+        queue_timeout: float,
+        high_priority_timeout: float,
+    ):
+        self.capacity = capacity
+        self.limits = {Priority.HIGH: capacity, Priority.LOW: max(1, low_priority_limit)}
+        self.queue_size = queue_size
+        self.timeouts = {Priority.HIGH: high_priority_timeout, Priority.LOW: queue_timeout}
+        self.in_flight = 0
+        self.shed: Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._waiters: Dict[Priority, Deque[asyncio.Future]] = {priority: deque() for priority in Priority}
+
+    def _pool_checked_out(self) -> int:
+        from .database import engine
+
+        checkedout = getattr(engine.pool, "checkedout", None)
+        return checkedout() if checkedout else 0
+
+    def _can_admit(self, priority: Priority) -> bool:
+        # 수락 제어를 거치지 않는 요청(관리 API, 백그라운드 작업)이 사용하는 커넥션도 반영
+        busy = max(self.in_flight, self._pool_checked_out())
+        return busy < self.limits[priority]
+
+    def queue_depth(self, priority: Priority) -> int:
+        return len(self._waiters[priority])
+
+    def _reject(self, priority: Priority, reason: str) -> HTTPException:
+        self.shed[priority] += 1
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"서버가 혼잡합니다 ({reason}). 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(max(1, math.ceil(self.timeouts[priority])))},
+        )
+
+    async def acquire(self, priority: Priority) -> None:
+        """슬롯 획득 (대기 후에도 획득하지 못하면 503)"""
+        waiting_ahead = self._waiters[Priority.HIGH] or (priority == Priority.LOW and self._waiters[Priority.LOW])
+        if not waiting_ahead and self._can_admit(priority):
+            self.in_flight += 1
+            return
+
+        waiters = self._waiters[priority]
+        if priority == Priority.LOW and len(waiters) >= self.queue_size:
+            raise self._reject(priority, "대기열 초과")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters.append(future)
+        deadline = loop.time() + self.timeouts[priority]
+        try:
+            # _wake()에서 슬롯을 넘겨받으면 결과가 설정됨 (in_flight는 이미 증가된 상태)
+            while not future.done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError()
+                await asyncio.wait({future}, timeout=min(RECHECK_INTERVAL, remaining))
+                self._wake()
+        except asyncio.TimeoutError:
+            if future.done() and not future.cancelled():
+                # 시간 초과와 동시에 슬롯을 넘겨받은 경우 반납
+                self.release()
+            else:
+                future.cancel()
+            self._discard(waiters, future)
+            raise self._reject(priority, "대기 시간 초과")
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+            self._discard(waiters, future)
+            raise
+
+    @staticmethod
+    def _discard(waiters: Deque[asyncio.Future], future: asyncio.Future) -> None:
+        try:
+            waiters.remove(future)
+        except ValueError:
+            pass
+
+    def release(self) -> None:
+        """슬롯 반납 후 대기 중인 요청에 우선순위 순으로 전달"""
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """수락 가능한 만큼 대기 중인 요청에 우선순위 순으로 슬롯 전달"""
+        for priority in (Priority.HIGH, Priority.LOW):
+            waiters = self._waiters[priority]
+            while waiters and self._can_admit(priority):
+                future = waiters.popleft()
+                if future.done():
+                    continue
+                self.in_flight += 1
+                future.set_result(None)
+            if waiters:
+                # 높은 우선순위가 대기 중이면 낮은 우선순위는 깨우지 않음
+                break
+
+    def stats(self) -> dict:
+        return {
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "pool_checked_out": self._pool_checked_out(),
+            "queued": {priority.value: self.queue_depth(priority) for priority in Priority},
+            "shed": {priority.value: count for priority, count in self.shed.items()},
+        }
+
+
+admission_controller = AdmissionController(
+    capacity=settings.db_pool_size + settings.db_max_overflow,
+    low_priority_limit=int((settings.db_pool_size + settings.db_max_overflow) * settings.admission_low_priority_ratio),
+    queue_size=settings.admission_queue_size,
+    queue_timeout=settings.admission_queue_timeout_seconds,
+    high_priority_timeout=settings.admission_high_priority_timeout_seconds,
+)
+
+
+def admit(priority: Priority):
+    """
+    DB를 사용하는 라우트의 수락 제어 의존성 생성
+
+    사용 예시:
+        @router.get("/dashboard", dependencies=[Depends(admit(Priority.LOW))])
+    """
+    async def dependency():
+        if not settings.admission_enabled:
+            yield
+            return
+        await admission_controller.acquire(priority)
+        try:
+            yield
+        finally:
+            admission_controller.release()
+
+    return dependency
@@ -1,20 +1,48 @@
-from datetime import datetime, timedelta
-from typing import Optional
+import asyncio
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Union
 
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
+from . import events
+from .cache import get_cache
 from .config import get_settings
 from .database import get_db
-from .models import User
+from .models import ApiKey, App, User
 from .schemas import TokenData
 
 settings = get_settings()
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+
+# API 키 접두어 (Bearer 토큰과 구분용)
+API_KEY_PREFIX = "dh_"
+
+# 토큰 subject(이메일) → 사용자 스냅샷 캐시
+user_cache = get_cache(
+    "users",
+    maxsize=settings.user_cache_max_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+
+# API 키 해시 → (키 스냅샷, 앱 문자열 ID) 캐시
+api_key_cache = get_cache(
+    "api_keys",
+    maxsize=settings.user_cache_max_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,6 +55,159 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+class PasswordHashExecutor:
+    """
+    bcrypt 전용 스레드 풀
+
+    해시/검증은 수백 ms 동안 CPU를 점유하므로 이벤트 루프에서 직접 실행하지 않는다.
+    대기 작업 수를 제한하고, 작업이 실행되기까지 기다린 시간을 집계한다.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    async def run(self, func: Callable, *args):
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="인증 요청이 많습니다. 잠시 후 다시 시도해주세요",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+
+        submitted_at = time.perf_counter()
+
+        def task():
+            waited = time.perf_counter() - submitted_at
+            with self._lock:
+                self.total_wait_seconds += waited
+                if waited > self.max_wait_seconds:
+                    self.max_wait_seconds = waited
+            return func(*args)
+
+        def done(_future):
+            # 호출한 요청이 취소되어도 스레드의 해시 작업이 실제로 끝난(또는 실행 전 취소된) 시점에 감소
+            with self._lock:
+                self._pending -= 1
+                self.completed += 1
+
+        future = self._executor.submit(task)
+        future.add_done_callback(done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "pending": self._pending,
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 3) if self.completed else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+password_hash_executor = PasswordHashExecutor(
+    max_workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (해시 스레드 풀에서 실행)"""
+    return await password_hash_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해시 (해시 스레드 풀에서 실행)"""
+    return await password_hash_executor.run(get_password_hash, password)
+
+
+class LoginThrottle:
+    """계정/IP별 로그인 실패 횟수 제한 (슬라이딩 윈도우)"""
+
+    def __init__(self, window_seconds: int, max_per_account: int, max_per_ip: int):
+        self.window_seconds = window_seconds
+        self.max_per_account = max_per_account
+        self.max_per_ip = max_per_ip
+        self._failures = get_cache("login_failures", maxsize=10000, ttl=window_seconds)
+        self._lock = threading.Lock()
+
+    def _recent(self, key: tuple, now: float) -> list:
+        attempts = self._failures.get(key) or []
+        return [t for t in attempts if now - t < self.window_seconds]
+
+    @staticmethod
+    def _keys(email: str, ip: Optional[str]) -> list:
+        keys = [("account", email.lower())]
+        if ip:
+            keys.append(("ip", ip))
+        return keys
+
+    def check(self, email: str, ip: Optional[str]) -> float:
+        """
+        허용 횟수를 초과했으면 429 발생, 아니면 시도 1회를 실패로 미리 기록 (bcrypt 실행 전에 호출)
+
+        동시에 들어온 요청들이 모두 검사를 통과한 뒤 실패를 기록하는 식으로 제한을 우회하지 못하도록
+        검사와 기록을 한 번에 처리한다. 성공하거나 검증을 하지 못했으면 release()로 되돌린다.
+
+        Returns:
+            float: 기록한 시도 (release()에 전달)
+        """
+        now = time.monotonic()
+        with self._lock:
+            limits = zip(self._keys(email, ip), (self.max_per_account, self.max_per_ip))
+            recents = []
+            for key, limit in limits:
+                recent = self._recent(key, now)
+                if len(recent) >= limit:
+                    retry_after = int(self.window_seconds - (now - recent[0])) + 1
+                    raise HTTPException(
+                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                        detail="로그인 시도 횟수를 초과했습니다. 잠시 후 다시 시도해주세요",
+                        headers={"Retry-After": str(retry_after)},
+                    )
+                recents.append((key, recent))
+            for key, recent in recents:
+                recent.append(now)
+                self._failures.set(key, recent)
+        return now
+
+    def release(self, email: str, ip: Optional[str], attempt: float, succeeded: bool = False) -> None:
+        """
+        check()에서 기록한 시도 취소
+
+        Args:
+            succeeded: 로그인 성공 (계정 실패 기록도 초기화)
+        """
+        now = time.monotonic()
+        with self._lock:
+            for key in self._keys(email, ip):
+                if succeeded and key[0] == "account":
+                    self._failures.invalidate(key)
+                    continue
+                recent = self._recent(key, now)
+                if attempt in recent:
+                    recent.remove(attempt)
+                    self._failures.set(key, recent)
+
+
+login_throttle = LoginThrottle(
+    window_seconds=settings.login_attempt_window_seconds,
+    max_per_account=settings.login_max_failures_per_account,
+    max_per_ip=settings.login_max_failures_per_ip,
+)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """액세스 토큰 생성"""
     to_encode = data.copy()
@@ -39,16 +220,103 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
-    """사용자 인증"""
-    user = db.query(User).filter(User.email == email).first()
-    if not user:
-        return None
-    if not verify_password(password, user.hashed_password):
+async def authenticate_user(
+    db: Session,
+    email: str,
+    password: str,
+    client_ip: Optional[str] = None
+) -> Optional[User]:
+    """사용자 인증 (시도 횟수 제한 + 해시 스레드 풀 사용)"""
+    attempt = login_throttle.check(email, client_ip)
+    
+    try:
+        user = db.query(User).filter(User.email == email).first()
+        verified = user is not None and await verify_password_async(password, user.hashed_password)
+    except BaseException:
+        # 검증하지 못한 시도(해시 풀 포화, 요청 취소 등)는 실패로 세지 않음
+        login_throttle.release(email, client_ip, attempt)
+        raise
+    
+    if not verified:
         return None
+    
+    login_throttle.release(email, client_ip, attempt, succeeded=True)
     return user
 
 
+def _snapshot(instance):
+    """세션과 분리된 ORM 객체 스냅샷 생성 (캐시 저장용)"""
+    model = type(instance)
+    columns = {attr.key: getattr(instance, attr.key) for attr in sa_inspect(model).column_attrs}
+    snapshot = model(**columns)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def invalidate_user_cache(email: Optional[str]) -> None:
+    """사용자 캐시 무효화 (다른 워커에도 전파)"""
+    if email:
+        events.publish(events.USER_CHANGED, email)
+
+
+events.subscribe(events.USER_CHANGED, user_cache.invalidate)
+events.subscribe(events.RESYNC, lambda key: user_cache.clear())
+
+
+def generate_api_key() -> str:
+    """새 API 키 평문 생성"""
+    return API_KEY_PREFIX + secrets.token_urlsafe(32)
+
+
+def hash_api_key(api_key: str) -> str:
+    """API 키 해시 (서버 시크릿 기반 HMAC-SHA256, bcrypt 불필요)"""
+    return hmac.new(settings.secret_key.encode(), api_key.encode(), hashlib.sha256).hexdigest()
+
+
+def invalidate_api_key_cache(key_hash: str) -> None:
+    """API 키 캐시 무효화 (다른 워커에도 전파)"""
+    events.publish(events.API_KEY_CHANGED, key_hash)
+
+
+events.subscribe(events.API_KEY_CHANGED, api_key_cache.invalidate)
+events.subscribe(events.RESYNC, lambda key: api_key_cache.clear())
+
+
+def verify_api_key(db: Session, api_key: str, app_id: str, scope: str) -> ApiKey:
+    """API 키 검증 (캐시 또는 해시 인덱스 단일 조회)"""
+    invalid_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="API 키가 유효하지 않습니다",
+    )
+    key_hash = hash_api_key(api_key)
+    
+    cached = api_key_cache.get(key_hash)
+    if cached is None:
+        row = db.query(ApiKey, App.app_id).join(App, ApiKey.app_id == App.id).filter(
+            ApiKey.key_hash == key_hash
+        ).first()
+        if row is None:
+            raise invalid_exception
+        cached = (_snapshot(row[0]), row[1])
+        api_key_cache.set(key_hash, cached)
+    
+    key, key_app_id = cached
+    if not key.is_active:
+        raise invalid_exception
+    
+    if key.expires_at is not None:
+        now = datetime.now(timezone.utc) if key.expires_at.tzinfo else datetime.utcnow()
+        if key.expires_at <= now:
+            raise invalid_exception
+    
+    if key_app_id != app_id or scope not in key.scopes.split(","):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="API 키에 해당 작업 권한이 없습니다",
+        )
+    return key
+
+
 async def get_current_user(
     token: Optional[str] = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
@@ -82,11 +350,19 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    cached = user_cache.get(token_data.email)
+    if cached is not None:
+        # 조회 없이 현재 세션에 연결
+        return db.merge(cached, load=False)
+    
     try:
         user = db.query(User).filter(User.email == token_data.email).first()
         if user is None:
             raise credentials_exception
+        user_cache.set(token_data.email, _snapshot(user))
         return user
+    except HTTPException:
+        raise
     except Exception as e:
         # 데이터베이스 오류를 명확하게 처리
         raise HTTPException(
@@ -107,3 +383,27 @@ async def get_current_admin_user(current_user: User = Depends(get_current_active
     if not current_user.is_admin:
         raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
     return current_user
+
+
+def require_app_scope(scope: str):
+    """
+    앱 단위 작업 권한 의존성
+
+    Bearer JWT(활성 사용자) 또는 해당 앱/권한 범위를 가진 API 키를 허용한다.
+    API 키는 X-API-Key 헤더 또는 Authorization: Bearer dh_... 로 전달할 수 있다.
+    """
+    async def dependency(
+        app_id: str,
+        token: Optional[str] = Depends(oauth2_scheme),
+        api_key: Optional[str] = Depends(api_key_header),
+        db: Session = Depends(get_db)
+    ) -> Union[User, ApiKey]:
+        if api_key is None and token and token.startswith(API_KEY_PREFIX):
+            api_key = token
+        if api_key:
+            return verify_api_key(db, api_key, app_id, scope)
+        
+        user = await get_current_user(token, db)
+        return await get_current_active_user(user)
+    
+    return dependency
@@ -0,0 +1,113 @@
+"""
+응답 압축 (gzip / br)
+
+JSON, 텍스트 응답만 일정 크기 이상일 때 압축한다. 설치 파일 다운로드(application/octet-stream),
+아이콘 이미지 등 이진 응답과 스트리밍 응답은 그대로 전달한다.
+brotli 패키지가 설치되어 있고 클라이언트가 br을 지원하면 br, 아니면 gzip을 사용한다.
+"""
+import gzip
+from typing import Optional
+
+from .config import get_settings
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip만 사용
+    brotli = None
+
+settings = get_settings()
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "text/",
+    "application/javascript",
+    "image/svg+xml",
+)
+
+# br은 동적 응답에서 CPU 대비 효율이 좋은 중간 품질 사용
+BROTLI_QUALITY = 4
+
+
+def _choose_encoding(accept_encoding: str) -> Optional[str]:
+    encodings = {part.split(";")[0].strip().lower() for part in accept_encoding.split(",")}
+    if brotli is not None and "br" in encodings:
+        return "br"
+    if "gzip" in encodings:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.compression_level)
+
+
+class CompressionMiddleware:
+    """JSON/텍스트 응답 압축 ASGI 미들웨어"""
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+        encoding = _choose_encoding(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = {name.lower(): value for name, value in message.get("headers", [])}
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                if b"content-encoding" in headers or not content_type.startswith(COMPRESSIBLE_TYPES):
+                    passthrough = True
+                    await send(message)
+                else:
+                    # 본문 크기를 확인할 때까지 헤더 전송 보류
+                    start_message = message
+                return
+
+            if message["type"] == "http.response.body" and start_message is not None:
+                body = message.get("body", b"")
+                if message.get("more_body", False) or len(body) < self.minimum_size:
+                    # 스트리밍 응답이거나 작은 응답은 압축하지 않음
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                compressed = _compress(body, encoding)
+                headers = [
+                    (name, value) for name, value in start_message.get("headers", [])
+                    if name.lower() != b"content-length"
+                ]
+                headers.append((b"content-encoding", encoding.encode("latin-1")))
+                headers.append((b"content-length", str(len(compressed)).encode("latin-1")))
+                headers.append((b"vary", b"Accept-Encoding"))
+                start_message["headers"] = headers
+                passthrough = True
+                await send(start_message)
+                await send({"type": "http.response.body", "body": compressed})
+                return
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -4,6 +4,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 import logging
 
+from . import query_stats
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -15,10 +16,14 @@ engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,  # 연결 전 ping으로 연결 유효성 확인
     pool_recycle=3600,   # 1시간마다 연결 재사용
-    pool_size=10,        # 연결 풀 크기
-    max_overflow=20,     # 최대 오버플로우
+    pool_size=settings.db_pool_size,        # 연결 풀 크기
+    max_overflow=settings.db_max_overflow,  # 최대 오버플로우
+    pool_timeout=settings.db_pool_timeout_seconds,  # 기본값(30초)보다 빨리 실패
     echo=False           # SQL 로깅 비활성화
 )
+# 요청별 SQL 실행 통계 수집
+query_stats.install(engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -0,0 +1,196 @@
+"""
+변경 알림 버스
+
+- 같은 프로세스 내 구독자에게는 즉시 전달
+- PostgreSQL LISTEN/NOTIFY로 다른 워커/컨테이너에도 전달 (로컬 캐시 무효화용)
+  NOTIFY는 전송 스레드가 모아서 보내므로 발행하는 쪽(이벤트 루프)은 DB 연결을 기다리지 않는다.
+"""
+import json
+import logging
+import os
+import select
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Callable, Dict, List
+
+from sqlalchemy import text
+
+from .database import engine
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "deploy_helper_events"
+
+# 이벤트 종류
+USER_CHANGED = "user-changed"
+API_KEY_CHANGED = "api-key-changed"
+APP_CHANGED = "app-changed"  # 앱 생성/수정/삭제, 아이콘/설명서 변경 (키: 앱 ID)
+VERSION_CHANGED = "version-changed"  # 버전 업로드/수정/활성화/비활성화/삭제 (키: 앱 ID)
+# 알림 연결이 (재)수립됨. 연결이 끊긴 동안 놓친 알림이 있을 수 있으므로 로컬 캐시 전체를 비움 (키: "")
+RESYNC = "resync"
+
+# 자기 자신이 보낸 알림을 구분하기 위한 워커 식별자
+WORKER_ID = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+_handlers: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+_local_handlers: Dict[str, List[Callable[[str], None]]] = defaultdict(list)
+_listener_thread: threading.Thread = None
+_stop_event = threading.Event()
+_listening = threading.Event()
+
+# 다른 워커에 보낼 알림 (전송 스레드는 보낼 알림이 있을 때만 실행)
+_outbox: List[str] = []
+_outbox_lock = threading.Lock()
+_sender_thread: threading.Thread = None
+
+
+def subscribe(event: str, handler: Callable[[str], None], local_only: bool = False) -> None:
+    """
+    이벤트 구독 (handler는 변경된 대상의 키를 인자로 받음)
+
+    local_only=True이면 이 워커에서 발행한 이벤트만 받는다 (한 번만 수행할 후처리용)
+    """
+    (_local_handlers if local_only else _handlers)[event].append(handler)
+
+
+def _dispatch(event: str, key: str, local: bool = False) -> None:
+    """로컬 구독자에게 이벤트 전달"""
+    handlers = list(_handlers.get(event, ()))
+    if local:
+        handlers.extend(_local_handlers.get(event, ()))
+    for handler in handlers:
+        try:
+            handler(key)
+        except Exception as e:
+            logger.error(f"Event handler error ({event}): {str(e)}")
+
+
+def _is_postgres() -> bool:
+    return engine.dialect.name == "postgresql"
+
+
+def publish(event: str, key: str) -> None:
+    """
+    이벤트 발행
+
+    DB 커밋 이후에 호출해야 함. 로컬 구독자에게 먼저 전달하고,
+    PostgreSQL이면 전송 스레드가 NOTIFY로 다른 워커에도 알린다.
+    """
+    global _sender_thread
+    _dispatch(event, key, local=True)
+
+    if not _is_postgres():
+        return
+
+    payload = json.dumps({"event": event, "key": key, "origin": WORKER_ID, "ts": time.time()})
+    with _outbox_lock:
+        _outbox.append(payload)
+        if _sender_thread is None:
+            _sender_thread = threading.Thread(target=_send_loop, name="event-sender", daemon=True)
+            _sender_thread.start()
+
+
+def _send_loop() -> None:
+    """쌓인 알림을 한 트랜잭션으로 보내고, 더 보낼 알림이 없으면 종료"""
+    global _sender_thread
+    while True:
+        with _outbox_lock:
+            payloads = list(_outbox)
+            _outbox.clear()
+            if not payloads:
+                _sender_thread = None
+                return
+        try:
+            with engine.connect() as conn:
+                for payload in payloads:
+                    conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": payload})
+                conn.commit()
+        except Exception as e:
+            # 알림 실패 시에도 다른 워커는 TTL 만료로 결국 갱신됨
+            logger.error(f"Failed to publish {len(payloads)} event(s): {str(e)}")
+
+
+def _handle_notification(payload: str) -> None:
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        return
+    if message.get("origin") == WORKER_ID:
+        return
+    event = message.get("event")
+    if message.get("ts"):
+        from .metrics import event_delivery_seconds
+
+        event_delivery_seconds.labels(event).observe(max(0.0, time.time() - message["ts"]))
+    _dispatch(event, message.get("key"))
+
+
+def _listen_loop() -> None:
+    """LISTEN 전용 연결을 유지하며 알림 수신 (연결 끊김 시 재접속)"""
+    while not _stop_event.is_set():
+        conn = None
+        try:
+            # 풀 슬롯을 점유하지 않도록 풀에서 분리한 전용 연결 사용
+            conn = engine.raw_connection()
+            conn.detach()
+            dbapi_conn = conn.dbapi_connection
+            dbapi_conn.autocommit = True
+            cursor = dbapi_conn.cursor()
+            cursor.execute(f"LISTEN {CHANNEL}")
+            logger.info(f"Listening for change events on '{CHANNEL}'")
+            _dispatch(RESYNC, "")
+            _listening.set()
+
+            while not _stop_event.is_set():
+                if select.select([dbapi_conn], [], [], 1.0) == ([], [], []):
+                    continue
+                dbapi_conn.poll()
+                while dbapi_conn.notifies:
+                    notify = dbapi_conn.notifies.pop(0)
+                    _handle_notification(notify.payload)
+        except Exception as e:
+            _listening.clear()
+            logger.error(f"Event listener error: {str(e)}")
+            _stop_event.wait(1.0)
+        finally:
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+
+def start_listener() -> None:
+    """다른 워커의 변경 알림 수신 시작 (PostgreSQL 전용)"""
+    global _listener_thread
+    if not _is_postgres() or _listener_thread is not None:
+        return
+    _stop_event.clear()
+    _listener_thread = threading.Thread(target=_listen_loop, name="event-listener", daemon=True)
+    _listener_thread.start()
+
+
+def wait_until_listening(timeout: float) -> bool:
+    """
+    알림 수신 연결이 수립될 때까지 대기 (PostgreSQL이 아니면 즉시 반환)
+
+    연결 직후 RESYNC로 로컬 캐시가 비워지므로 캐시 예열은 이후에 수행해야 한다.
+    """
+    if not _is_postgres() or _listener_thread is None:
+        return True
+    return _listening.wait(timeout)
+
+
+def stop_listener() -> None:
+    """알림 수신 중지 (보내는 중인 알림은 잠시 기다림)"""
+    global _listener_thread
+    sender = _sender_thread
+    if sender is not None:
+        sender.join(timeout=2.0)
+    _stop_event.set()
+    _listening.clear()
+    if _listener_thread is not None:
+        _listener_thread.join(timeout=2.0)
+        _listener_thread = None
@@ -0,0 +1,258 @@
+"""
+앱 아이콘 저장/서빙
+
+- 업로드 시 스트리밍 저장 + SHA256 계산, 리사이즈 변형(32/64/128px 등) 미리 생성
+- 메타데이터(경로, MIME, 해시)는 app_icons 테이블에 저장하고 서빙 시에는 캐시에서 조회
+- 해시가 포함된 URL(?v=...)은 변경 불가 리소스로 장기 캐시 헤더를 붙인다
+"""
+import hashlib
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from fastapi import HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+from sqlalchemy.orm import Session
+
+from . import events
+from .cache import get_cache
+from .config import get_settings
+from .models import App, AppIcon
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow 미설치 시 원본만 서빙
+    Image = None
+
+ICON_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon'
+}
+
+# 리사이즈 가능한 래스터 형식
+RESIZABLE_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.gif', '.webp'}
+
+MAX_ICON_SIZE = 5 * 1024 * 1024  # 5MB
+CHUNK_SIZE = 64 * 1024
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "public, max-age=300, must-revalidate"
+
+VARIANT_SIZES = tuple(sorted(int(s) for s in settings.icon_variant_sizes.split(",") if s.strip()))
+
+
+@dataclass
+class IconInfo:
+    """서빙에 필요한 아이콘 정보 (캐시 저장용)"""
+    is_public: bool
+    file_path: str
+    mime_type: str
+    file_hash: str
+    variants: Dict[int, str] = field(default_factory=dict)  # 크기 → 파일 경로
+
+
+# 앱 문자열 ID → IconInfo
+icon_cache = get_cache("icons", maxsize=4096, ttl=60 * 60)
+events.subscribe(events.APP_CHANGED, icon_cache.invalidate)
+events.subscribe(events.RESYNC, lambda key: icon_cache.clear())
+
+
+def icon_url(app_id: str, file_hash: str) -> str:
+    """해시로 버전이 지정된 아이콘 URL"""
+    return f"/api/apps/{app_id}/icon?v={file_hash[:12]}"
+
+
+def _variant_path(icon_dir: str, size: int) -> str:
+    return os.path.join(icon_dir, f"icon_{size}.png")
+
+
+async def save_icon_upload(file: UploadFile, file_path: str) -> tuple:
+    """
+    업로드 파일을 청크 단위로 저장하며 해시/크기 계산
+
+    Returns:
+        tuple: (SHA256 해시, 파일 크기)
+    """
+    sha256 = hashlib.sha256()
+    size = 0
+    tmp_path = file_path + ".uploading"
+    try:
+        with open(tmp_path, "wb") as buffer:
+            while True:
+                chunk = await file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_ICON_SIZE:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="파일 크기가 너무 큽니다. 최대 5MB까지 업로드 가능합니다."
+                    )
+                sha256.update(chunk)
+                buffer.write(chunk)
+        os.replace(tmp_path, file_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return sha256.hexdigest(), size
+
+
+def generate_variants(file_path: str) -> Dict[int, str]:
+    """리사이즈 변형 생성 (원본보다 큰 크기는 만들지 않음)"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if Image is None or ext not in RESIZABLE_EXTENSIONS:
+        return {}
+
+    icon_dir = os.path.dirname(file_path)
+    variants = {}
+    try:
+        with Image.open(file_path) as image:
+            image.seek(0)
+            source = image.convert("RGBA")
+        for size in VARIANT_SIZES:
+            if size >= max(source.size):
+                continue
+            resized = source.copy()
+            resized.thumbnail((size, size), Image.LANCZOS)
+            path = _variant_path(icon_dir, size)
+            resized.save(path, format="PNG", optimize=True)
+            variants[size] = path
+    except Exception as e:
+        # 변형 생성 실패 시 원본만 서빙
+        logger.warning(f"Icon variant generation failed ({file_path}): {str(e)}")
+    return variants
+
+
+def build_icon_record(app: App, file_path: str, file_hash: str, file_size: int, variants: Dict[int, str]) -> AppIcon:
+    """아이콘 메타데이터 생성/갱신 (커밋은 호출자가 수행)"""
+    record = app.icon or AppIcon(app_id=app.id)
+    record.file_path = file_path
+    record.mime_type = ICON_MIME_TYPES.get(os.path.splitext(file_path)[1].lower(), 'image/png')
+    record.file_hash = file_hash
+    record.file_size = file_size
+    record.variant_sizes = ",".join(str(size) for size in sorted(variants))
+    app.icon = record
+    return record
+
+
+def remove_icon_files(icon_dir: str, keep: Optional[str] = None) -> None:
+    """아이콘 디렉토리 내 모든 파일 삭제 (원본 + 변형, keep 파일 제외)"""
+    if not os.path.exists(icon_dir):
+        return
+    for file_name in os.listdir(icon_dir):
+        file_path = os.path.join(icon_dir, file_name)
+        if file_name != keep and os.path.isfile(file_path):
+            os.remove(file_path)
+
+
+def _find_legacy_icon(app_id: str) -> Optional[str]:
+    """메타데이터 없이 저장된 기존 아이콘 파일 찾기"""
+    icon_dir = os.path.join(settings.upload_dir, app_id, "icon")
+    if not os.path.exists(icon_dir):
+        return None
+    for file_name in os.listdir(icon_dir):
+        file_path = os.path.join(icon_dir, file_name)
+        if os.path.isfile(file_path) and file_name.startswith('icon.'):
+            return file_path
+    return None
+
+
+def _hash_file(file_path: str) -> str:
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+async def get_icon_info(db: Session, app_id: str) -> IconInfo:
+    """
+    아이콘 정보 조회 (캐시 → DB, 메타데이터가 없는 기존 아이콘은 한 번만 등록)
+
+    캐시에 없으면 DB 조회와 기존 아이콘 등록(해시 계산, 리사이즈, 커밋)을 스레드 풀에서 수행한다.
+    """
+    info = icon_cache.get(app_id)
+    if info is not None:
+        return info
+    return await run_in_threadpool(_load_icon_info, db, app_id)
+
+
+def _load_icon_info(db: Session, app_id: str) -> IconInfo:
+    app = db.query(App).filter(App.app_id == app_id).first()
+    if not app:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="앱을 찾을 수 없습니다"
+        )
+
+    if not app.icon_url or not app.icon_url.startswith('/api/apps/'):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="등록된 아이콘이 없습니다"
+        )
+
+    record = app.icon
+    if record is None or not os.path.exists(record.file_path):
+        file_path = _find_legacy_icon(app_id)
+        if not file_path:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="아이콘 파일을 찾을 수 없습니다"
+            )
+        record = build_icon_record(
+            app, file_path, _hash_file(file_path), os.path.getsize(file_path), generate_variants(file_path)
+        )
+        db.commit()
+
+    variants = {}
+    if record.variant_sizes:
+        icon_dir = os.path.dirname(record.file_path)
+        variants = {int(size): _variant_path(icon_dir, int(size)) for size in record.variant_sizes.split(",")}
+
+    info = IconInfo(
+        is_public=bool(app.is_public),
+        file_path=record.file_path,
+        mime_type=record.mime_type,
+        file_hash=record.file_hash,
+        variants=variants
+    )
+    icon_cache.set(app_id, info)
+    return info
+
+
+def icon_response(info: IconInfo, size: Optional[int], version: Optional[str], if_none_match: Optional[str]) -> Response:
+    """
+    아이콘 응답 생성
+
+    - size: 요청 크기 이상인 가장 작은 변형 사용 (없으면 원본)
+    - version: URL의 v 파라미터가 현재 해시와 일치하면 장기 캐시
+    """
+    file_path, media_type, etag_suffix = info.file_path, info.mime_type, ""
+    if size:
+        for variant_size in sorted(info.variants):
+            if variant_size >= size:
+                file_path, media_type, etag_suffix = info.variants[variant_size], "image/png", f"-{variant_size}"
+                break
+
+    etag = f'"{info.file_hash[:32]}{etag_suffix}"'
+    cache_control = (
+        IMMUTABLE_CACHE_CONTROL
+        if version and info.file_hash.startswith(version)
+        else REVALIDATE_CACHE_CONTROL
+    )
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+
+    if if_none_match and etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return FileResponse(file_path, media_type=media_type, headers=headers)
@@ -0,0 +1,196 @@
+"""
+구조화(JSON) 로깅 설정
+
+- 모든 로그는 큐에 넣고 별도 스레드(QueueListener)에서 포맷/출력하므로
+  이벤트 루프에서는 I/O와 traceback 포맷 비용이 발생하지 않는다.
+- 큐가 가득 차면 INFO 이하 로그는 버리고(개수 집계), WARNING 이상은 크기 제한 없는 별도 큐로
+  넘겨 절대 버리지 않는다. 어느 경우에도 로그를 남기는 쪽(이벤트 루프)은 기다리지 않는다.
+- 접근 로그는 요청당 한 줄 (route, status, latency, app_id, version). 대량의 2xx
+  업데이트 확인 로그는 샘플링하고, 4xx는 INFO로 남겨 과부하 시 버릴 수 있게 한다 (5xx만 ERROR).
+"""
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Optional
+from urllib.parse import parse_qs
+
+from .config import get_settings
+
+settings = get_settings()
+
+access_logger = logging.getLogger("deploy_helper.access")
+
+# 표준 LogRecord 속성 (이외의 속성은 extra 필드로 출력)
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+# 대량 호출되는 클라이언트 업데이트 확인 라우트 (2xx 로그 샘플링 대상)
+HIGH_VOLUME_ROUTES = {"/api/update/check"}
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                data[key] = value
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    큐에 레코드만 넣는 핸들러
+
+    포맷(메시지 조합, traceback 문자열화)은 리스너 스레드에서 수행한다.
+    큐가 가득 차면 WARNING 미만 레코드는 버리고, 그 이상은 크기 제한 없는 overflow 큐에 넣는다.
+    (자리가 날 때까지 기다리면 4xx/429가 몰릴 때 이벤트 루프 전체가 멈춤)
+    """
+
+    def __init__(self, log_queue: queue.Queue, overflow_queue: queue.SimpleQueue):
+        super().__init__(log_queue)
+        self.overflow_queue = overflow_queue
+        self.dropped = 0
+        self.overflowed = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 인자만 미리 합쳐 두고 exc_info는 그대로 전달 (포맷은 리스너에서)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                self.overflowed += 1
+                self.overflow_queue.put_nowait(record)
+            else:
+                self.dropped += 1
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_overflow_listener: Optional[logging.handlers.QueueListener] = None
+queue_handler: Optional[NonBlockingQueueHandler] = None
+
+
+def setup_logging() -> None:
+    """루트 로거를 큐 기반 핸들러로 구성하고 출력 스레드 시작"""
+    global _listener, _overflow_listener, queue_handler
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if settings.log_format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.log_queue_size)
+    overflow_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = NonBlockingQueueHandler(log_queue, overflow_queue)
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(settings.log_level.upper())
+
+    if settings.access_log_enabled:
+        # uvicorn 기본 접근 로그 대신 구조화 접근 로그 사용
+        uvicorn_access = logging.getLogger("uvicorn.access")
+        uvicorn_access.handlers = []
+        uvicorn_access.propagate = False
+        uvicorn_access.disabled = True
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    # 큐가 가득 찼을 때 넘어온 WARNING 이상 로그 출력 (StreamHandler는 자체 잠금으로 두 스레드가 함께 써도 안전)
+    _overflow_listener = logging.handlers.QueueListener(overflow_queue, stream_handler, respect_handler_level=True)
+    _overflow_listener.start()
+
+
+def shutdown_logging() -> None:
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener, _overflow_listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _overflow_listener is not None:
+        _overflow_listener.stop()
+        _overflow_listener = None
+
+
+def _should_log(route: str, status_code: int) -> bool:
+    if status_code >= 500:
+        return True
+    if status_code >= 400:
+        rate = settings.access_log_client_error_sample_rate
+        return rate >= 1.0 or random.random() < rate
+    rate = settings.access_log_check_sample_rate if route in HIGH_VOLUME_ROUTES else settings.access_log_sample_rate
+    return rate >= 1.0 or random.random() < rate
+
+
+class AccessLogMiddleware:
+    """요청당 한 줄 구조화 접근 로그 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = route.path if route is not None else scope["path"]
+            if _should_log(route_path, status_code):
+                self._log(scope, route_path, status_code, time.perf_counter() - start)
+
+    @staticmethod
+    def _log(scope, route_path: str, status_code: int, elapsed: float) -> None:
+        path_params = scope.get("path_params") or {}
+        query = parse_qs(scope.get("query_string", b"").decode("latin-1")) if scope.get("query_string") else {}
+        client = scope.get("client")
+
+        extra = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route_path,
+            "status": status_code,
+            "latency_ms": round(elapsed * 1000, 3),
+            "client": client[0] if client else None,
+        }
+        app_id = path_params.get("app_id") or (query.get("app_id") or [None])[0]
+        if app_id:
+            extra["app_id"] = app_id
+        version = path_params.get("version_id") or (query.get("current_version") or [None])[0]
+        if version:
+            extra["version"] = version
+
+        # 4xx는 클라이언트 쪽 문제이고 429처럼 한꺼번에 몰리므로 INFO (큐가 가득 차면 버려짐)
+        level = logging.ERROR if status_code >= 500 else logging.INFO
+        access_logger.log(level, f"{scope['method']} {scope['path']} {status_code}", extra=extra)
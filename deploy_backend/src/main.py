@@ -1,81 +1,74 @@
+import asyncio
 import logging
-import traceback
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.exc import SQLAlchemyError
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
 
-from .database import Base, engine, SessionLocal
-from .models import User
-from .auth import get_password_hash
+from . import compression, events, logging_config, metrics, profiling, startup, static_export
+from .responses import FastJSONResponse
 from .config import get_settings
-from .routers import auth, apps, versions, update, stats, users
+from .routers import auth, apps, versions, update, stats, users, api_keys
+from .routers import profiling as profiling_router
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# 로깅 설정 (큐 기반, 출력은 백그라운드 스레드에서)
+logging_config.setup_logging()
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
 
-def init_db():
-    """데이터베이스 초기화 및 관리자 계정 생성"""
-    Base.metadata.create_all(bind=engine)
-    
-    db = SessionLocal()
-    try:
-        # 관리자 계정 확인 및 생성
-        admin = db.query(User).filter(User.email == settings.admin_email).first()
-        if not admin:
-            admin = User(
-                email=settings.admin_email,
-                hashed_password=get_password_hash(settings.admin_password),
-                is_active=True,
-                is_admin=True
-            )
-            db.add(admin)
-            db.commit()
-            print(f"관리자 계정 생성됨: {settings.admin_email}")
-    finally:
-        db.close()
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
     # 시작 시
-    print("Deploy Helper API 서버 시작...")
-    init_db()
+    logger.info("Deploy Helper API 서버 시작...")
+    # 스키마 생성/관리자 계정/캐시 예열은 기다리지 않음 (준비 완료는 /health/ready로 확인)
+    events.start_listener()
+    static_export.setup()
+    startup_task = asyncio.create_task(startup.run_startup_tasks())
     yield
     # 종료 시
-    print("Deploy Helper API 서버 종료...")
+    startup_task.cancel()
+    events.stop_listener()
+    logger.info("Deploy Helper API 서버 종료...")
+    logging_config.shutdown_logging()
 
 
 app = FastAPI(
     title="Deploy Helper API",
     description="Windows 프로그램 배포 및 자동 업데이트 시스템",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # 전역 예외 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """전역 예외 핸들러 - 모든 예외를 로깅하고 적절한 응답 반환"""
+    # traceback 문자열화는 로그 출력 스레드에서 수행
     logger.error(
-        f"Unhandled exception: {type(exc).__name__}: {str(exc)}\n"
-        f"Path: {request.url.path}\n"
-        f"Method: {request.method}\n"
-        f"Traceback: {traceback.format_exc()}"
+        f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
+        exc_info=exc,
+        extra={"path": request.url.path, "method": request.method},
     )
     
+    # 커넥션 풀 대기 시간 초과 (일시적 과부하)
+    if isinstance(exc, PoolTimeoutError):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={
+                "detail": "서버가 혼잡합니다. 잠시 후 다시 시도해주세요",
+                "error_type": "PoolTimeout"
+            },
+            headers={"Retry-After": str(settings.db_pool_timeout_seconds)}
+        )
+    
     # SQLAlchemy 에러 처리
     if isinstance(exc, SQLAlchemyError):
-        logger.error(f"Database error: {str(exc)}")
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
@@ -102,6 +95,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (JSON/텍스트, 최소 크기 이상)
+if settings.compression_enabled:
+    app.add_middleware(compression.CompressionMiddleware, minimum_size=settings.compression_min_size)
+
+# 요청별 SQL 통계 및 프로파일러 추적
+app.add_middleware(profiling.ProfilingMiddleware)
+
+# 구조화 접근 로그
+if settings.access_log_enabled:
+    app.add_middleware(logging_config.AccessLogMiddleware)
+
+# 요청 메트릭 (가장 바깥쪽에서 전체 처리 시간 측정)
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(apps.public_router)  # 공개 API (인증 불필요) - 먼저 등록
@@ -110,6 +118,8 @@ app.include_router(versions.router)
 app.include_router(update.router)
 app.include_router(stats.router)
 app.include_router(users.router)
+app.include_router(api_keys.router)
+app.include_router(profiling_router.router)
 
 
 @app.get("/")
@@ -126,3 +136,35 @@ async def root():
 async def health_check():
     """헬스 체크"""
     return {"status": "healthy"}
+
+
+@app.get("/health/live")
+async def liveness_check():
+    """생존 확인 (이벤트 루프가 응답하는지만 확인)"""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """준비 상태 확인 (캐시 예열 완료 및 DB 연결 가능 시 200, 아니면 503)"""
+    if not startup.state.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "starting", **startup.state.to_dict()}
+        )
+    if not await run_in_threadpool(startup.check_database):
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "database_unavailable", **startup.state.to_dict()}
+        )
+    return {"status": "ready", **startup.state.to_dict()}
+
+
+if settings.metrics_enabled:
+    @app.get("/metrics", include_in_schema=False)
+    async def get_metrics():
+        """Prometheus 형식 메트릭"""
+        return PlainTextResponse(
+            metrics.registry.exposition(),
+            media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
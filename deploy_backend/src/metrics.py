@@ -0,0 +1,321 @@
+"""
+Prometheus 형식 메트릭
+
+- 라우트 템플릿별 요청 수/지연 시간 히스토그램, 처리 중 요청 수, 응답 바이트 수
+- DB 커넥션 풀 상태, 캐시 적중률 등은 수집(/metrics 요청) 시점에 계산
+
+기록 경로는 라벨 튜플 dict 조회 + 정수 증가만 수행하도록 단순하게 유지한다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Tuple
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values):
+        """라벨 값에 해당하는 하위 메트릭 (최초 1회만 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def collect(self) -> List[str]:
+        lines = self.header()
+        for values, child in list(self._children.items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}")
+        return lines
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return _Value()
+
+
+class Gauge(_Metric):
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _Value()
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def collect(self) -> List[str]:
+        lines = self.header()
+        for values, child in list(self._children.items()):
+            with child._lock:
+                counts, total_sum, total_count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total_sum)}")
+            lines.append(f"{self.name}_count{labels} {total_count}")
+        return lines
+
+
+class Registry:
+    """메트릭 레지스트리 (수집 시점 콜백 포함)"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def add_collector(self, collector: Callable[[], None]) -> None:
+        """수집 직전에 호출되어 게이지 값을 갱신하는 콜백 등록"""
+        self._collectors.append(collector)
+
+    def exposition(self) -> str:
+        for collector in self._collectors:
+            collector()
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests_total = registry.register(Counter(
+    "deploy_http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "deploy_http_request_duration_seconds", "HTTP 요청 처리 시간(초)", ("method", "route")
+))
+http_requests_in_flight = registry.register(Gauge(
+    "deploy_http_requests_in_flight", "처리 중인 HTTP 요청 수"
+))
+http_response_bytes_total = registry.register(Counter(
+    "deploy_http_response_bytes_total", "응답 본문 바이트 수", ("route",)
+))
+db_pool_connections = registry.register(Gauge(
+    "deploy_db_pool_connections", "DB 커넥션 풀 상태", ("state",)
+))
+cache_requests_total = registry.register(Counter(
+    "deploy_cache_requests_total", "캐시 조회 수", ("cache", "result")
+))
+cache_entries = registry.register(Gauge(
+    "deploy_cache_entries", "캐시 항목 수", ("cache",)
+))
+cache_hit_ratio = registry.register(Gauge(
+    "deploy_cache_hit_ratio", "캐시 적중률 (0~1)", ("cache",)
+))
+password_hash_queue = registry.register(Gauge(
+    "deploy_password_hash_queue", "비밀번호 해시 스레드 풀 상태", ("stat",)
+))
+admission_in_flight = registry.register(Gauge(
+    "deploy_admission_in_flight", "수락 제어를 거쳐 처리 중인 DB 사용 요청 수"
+))
+admission_queue_depth = registry.register(Gauge(
+    "deploy_admission_queue_depth", "수락 대기 중인 요청 수", ("priority",)
+))
+admission_shed_total = registry.register(Counter(
+    "deploy_admission_shed_total", "과부하로 거부(503)된 요청 수", ("priority",)
+))
+event_delivery_seconds = registry.register(Histogram(
+    "deploy_event_delivery_seconds", "다른 워커에서 발행된 변경 알림 수신 지연(초)", ("event",),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+))
+rate_limited_total = registry.register(Counter(
+    "deploy_rate_limited_total", "속도 제한으로 거부된 요청 수", ("limiter",)
+))
+log_records_dropped_total = registry.register(Counter(
+    "deploy_log_records_dropped_total", "로그 큐가 가득 차 버려진 로그 레코드 수"
+))
+log_records_overflow_total = registry.register(Counter(
+    "deploy_log_records_overflow_total", "로그 큐가 가득 차 overflow 큐로 넘긴 WARNING 이상 로그 레코드 수"
+))
+
+_in_flight = http_requests_in_flight.labels()
+
+
+def _collect_db_pool() -> None:
+    from .database import engine
+
+    pool = engine.pool
+    for state, getter in (("size", "size"), ("checked_out", "checkedout"), ("checked_in", "checkedin"), ("overflow", "overflow")):
+        if hasattr(pool, getter):
+            db_pool_connections.labels(state).set(getattr(pool, getter)())
+
+
+def _collect_caches() -> None:
+    from .cache import all_caches
+
+    for name, cache in all_caches().items():
+        hits, misses = cache.hits, cache.misses
+        cache_requests_total.labels(name, "hit").set(hits)
+        cache_requests_total.labels(name, "miss").set(misses)
+        cache_entries.labels(name).set(len(cache))
+        cache_hit_ratio.labels(name).set(hits / (hits + misses) if hits + misses else 0.0)
+
+
+def _collect_password_hash() -> None:
+    from .auth import password_hash_executor
+
+    for stat, value in password_hash_executor.stats().items():
+        password_hash_queue.labels(stat).set(value)
+
+
+def _collect_admission() -> None:
+    from .admission import admission_controller, Priority
+
+    admission_in_flight.labels().set(admission_controller.in_flight)
+    for priority in Priority:
+        admission_queue_depth.labels(priority.value).set(admission_controller.queue_depth(priority))
+        admission_shed_total.labels(priority.value).set(admission_controller.shed[priority])
+
+
+def _collect_rate_limits() -> None:
+    from .rate_limit import update_check_rate_limit, download_rate_limit
+
+    for rate_limit in (update_check_rate_limit, download_rate_limit):
+        for limiter in rate_limit.limiters:
+            rate_limited_total.labels(limiter.name).set(limiter.rejected)
+
+
+def _collect_logging() -> None:
+    from .logging_config import queue_handler
+
+    if queue_handler is not None:
+        log_records_dropped_total.labels().set(queue_handler.dropped)
+        log_records_overflow_total.labels().set(queue_handler.overflowed)
+
+
+registry.add_collector(_collect_db_pool)
+registry.add_collector(_collect_caches)
+registry.add_collector(_collect_password_hash)
+registry.add_collector(_collect_admission)
+registry.add_collector(_collect_rate_limits)
+registry.add_collector(_collect_logging)
+
+
+class MetricsMiddleware:
+    """요청별 메트릭 기록 ASGI 미들웨어 (라우트 템플릿 기준 라벨)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        sent_bytes = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, sent_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                sent_bytes += len(message.get("body", b""))
+            await send(message)
+
+        _in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            _in_flight.dec()
+            # 라우팅 후 scope에 매칭된 라우트가 기록됨 (매칭 실패 시 경로 폭증 방지를 위해 고정 라벨)
+            route = scope.get("route")
+            route_path = route.path if route is not None else "unmatched"
+            method = scope["method"]
+            http_requests_total.labels(method, route_path, status_code).inc()
+            http_request_duration_seconds.labels(method, route_path).observe(elapsed)
+            if sent_bytes:
+                http_response_bytes_total.labels(route_path).inc(sent_bytes)
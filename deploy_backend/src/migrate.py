@@ -0,0 +1,47 @@
+"""
+DB 스키마 마이그레이션 (Alembic)
+
+서버 시작 전에 별도 단계로 실행한다:
+    python -m src.migrate
+
+마이그레이션 도입 전 create_all로 만들어진 DB(alembic_version 테이블 없음)는
+초기 스키마(0001)로 표시한 뒤 이후 마이그레이션만 적용한다.
+"""
+import logging
+import os
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
+
+from .database import engine
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_REVISION = "0001"
+
+
+def _alembic_config() -> Config:
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    return config
+
+
+def run_migrations(configure_logging: bool = True) -> None:
+    """최신 스키마로 업그레이드"""
+    config = _alembic_config()
+    if not configure_logging:
+        # 애플리케이션 로깅 설정을 덮어쓰지 않음
+        config.attributes["skip_logging_config"] = True
+
+    tables = set(inspect(engine).get_table_names())
+    if "alembic_version" not in tables and "apps" in tables:
+        logger.info("Existing schema without migration history, stamping baseline revision")
+        command.stamp(config, BASELINE_REVISION)
+
+    command.upgrade(config, "head")
+
+
+if __name__ == "__main__":
+    run_migrations()
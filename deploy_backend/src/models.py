@@ -13,6 +13,12 @@ class ReleaseChannel(str, enum.Enum):
     ALPHA = "alpha"
 
 
+class ApiKeyScope(str, enum.Enum):
+    """API 키 권한 범위"""
+    PUBLISH = "publish"  # 새 버전 업로드
+    MANAGE = "manage"  # 버전 수정/활성화/비활성화
+
+
 class User(Base):
     """관리자 사용자"""
     __tablename__ = "users"
@@ -50,6 +56,8 @@ class App(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     versions = relationship("AppVersion", back_populates="app", cascade="all, delete-orphan")
+    api_keys = relationship("ApiKey", back_populates="app", cascade="all, delete-orphan")
+    icon = relationship("AppIcon", back_populates="app", uselist=False, cascade="all, delete-orphan")
 
 
 class AppVersion(Base):
@@ -57,7 +65,7 @@ class AppVersion(Base):
     __tablename__ = "app_versions"
     
     id = Column(Integer, primary_key=True, index=True)
-    app_id = Column(Integer, ForeignKey("apps.id"), nullable=False)
+    app_id = Column(Integer, ForeignKey("apps.id"), nullable=False, index=True)
     version = Column(String(50), nullable=False)  # Semantic versioning (예: 1.0.0)
     channel = Column(Enum(ReleaseChannel), default=ReleaseChannel.STABLE)
     release_notes = Column(Text)
@@ -83,3 +91,37 @@ class AppVersion(Base):
     class Config:
         # 같은 앱에서 버전+채널 조합은 유일해야 함
         unique_together = [("app_id", "version", "channel")]
+
+
+class ApiKey(Base):
+    """앱 단위 API 키 (CI 배포 자동화용)"""
+    __tablename__ = "api_keys"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    app_id = Column(Integer, ForeignKey("apps.id"), nullable=False, index=True)
+    name = Column(String(100), nullable=False)  # 용도 설명 (예: GitHub Actions)
+    key_prefix = Column(String(16), nullable=False)  # 식별용 키 앞부분 (평문)
+    key_hash = Column(String(64), unique=True, index=True, nullable=False)  # HMAC-SHA256
+    scopes = Column(String(255), nullable=False)  # 콤마 구분 (예: publish,manage)
+    is_active = Column(Boolean, default=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    app = relationship("App", back_populates="api_keys")
+
+
+class AppIcon(Base):
+    """업로드된 앱 아이콘 메타데이터 (서빙 시 디렉토리 탐색 없이 사용)"""
+    __tablename__ = "app_icons"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    app_id = Column(Integer, ForeignKey("apps.id"), unique=True, nullable=False)
+    file_path = Column(String(500), nullable=False)  # 원본 파일 경로
+    mime_type = Column(String(50), nullable=False)
+    file_hash = Column(String(64), nullable=False)  # SHA256 (URL 버전 및 ETag용)
+    file_size = Column(Integer, nullable=False)
+    variant_sizes = Column(String(100))  # 생성된 리사이즈 크기 (콤마 구분, 예: 32,64,128)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    app = relationship("App", back_populates="icon")
@@ -0,0 +1,88 @@
+"""
+목록 페이지네이션 도우미
+
+- 커서(keyset) 페이지네이션: 마지막 항목의 정렬 키를 불투명 문자열로 전달
+- 전체 개수: exact(COUNT), estimated(PostgreSQL 통계 기반 추정), none(생략)
+"""
+import base64
+import enum
+import json
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlalchemy.orm import Query, Session
+
+
+class TotalMode(str, enum.Enum):
+    """전체 개수 계산 방식"""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+def encode_cursor(last_id: int) -> str:
+    """정렬 키(id)를 커서 문자열로 변환"""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """커서 문자열에서 정렬 키(id) 추출"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다"
+        )
+
+
+def count_total(db: Session, query: Query, mode: TotalMode, table_name: Optional[str] = None) -> Optional[int]:
+    """
+    전체 개수 계산
+
+    estimated는 필터 없는 전체 테이블(table_name 지정)에 대해서만 PostgreSQL 통계를 사용하고,
+    그 외에는 정확한 COUNT로 대체한다.
+    """
+    if mode == TotalMode.NONE:
+        return None
+
+    if mode == TotalMode.ESTIMATED and table_name and db.bind.dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :name"),
+            {"name": table_name}
+        ).scalar()
+        # 한 번도 ANALYZE되지 않은 테이블은 -1 (또는 0)을 반환
+        if estimate is not None and estimate > 0:
+            return int(estimate)
+
+    return query.order_by(None).count()
+
+
+def paginate(query: Query, id_column, skip: int, limit: int, cursor: Optional[str], descending: bool = False) -> tuple:
+    """
+    id 순으로 정렬된 페이지 조회
+
+    cursor가 있으면 keyset(WHERE id > 마지막 id) 방식으로 조회하고 skip은 무시한다.
+    cursor가 없으면 기존처럼 skip(OFFSET)을 사용한다.
+
+    Returns:
+        tuple: (항목 목록, 다음 커서 또는 None)
+    """
+    query = query.order_by(id_column.desc() if descending else id_column.asc())
+    if cursor:
+        last_id = decode_cursor(cursor)
+        query = query.filter(id_column < last_id if descending else id_column > last_id)
+    elif skip:
+        query = query.offset(skip)
+
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    items = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1].id)
+    return items, next_cursor
@@ -0,0 +1,262 @@
+"""
+샘플링 프로파일러 및 느린 요청 수집
+
+- 관리자가 N초 동안(전체 스레드) 또는 X% 요청에 대해 통계적 샘플링을 켤 수 있다.
+  결과는 flame graph 도구(flamegraph.pl, speedscope 등)에서 읽을 수 있는 folded stack 형식이다.
+- 임계 시간보다 오래 걸린 요청은 스택 샘플과 SQL 실행 시간 내역을 자동으로 보관한다.
+
+샘플러 스레드는 sys._current_frames()로 이벤트 루프 스레드의 스택을 읽고,
+현재 실행 중인 asyncio 태스크로 요청을 구분한다.
+"""
+import asyncio
+import random
+import sys
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from . import query_stats
+from .config import get_settings
+
+settings = get_settings()
+
+MAX_STACK_DEPTH = 128
+IDLE_INTERVAL = 0.05
+
+
+def _folded_stack(frame) -> str:
+    """프레임을 root;...;leaf 형식 문자열로 변환"""
+    names: List[str] = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_name}:{frame.f_lineno}")
+        frame = frame.f_back
+    names.reverse()
+    return ";".join(names)
+
+
+def _current_task(loop):
+    """다른 스레드에서 이벤트 루프의 현재 태스크 조회 (지원되지 않으면 None)"""
+    current_tasks = getattr(asyncio.tasks, "_current_tasks", None)
+    if current_tasks is None:
+        return None
+    return current_tasks.get(loop)
+
+
+class RequestTrace:
+    """처리 중인 요청 정보"""
+
+    __slots__ = ("method", "path", "started_at", "start", "sampled", "stacks", "query_stats", "scope")
+
+    def __init__(self, scope, sampled: bool, stats: query_stats.QueryStats):
+        self.scope = scope
+        self.method = scope["method"]
+        self.path = scope["path"]
+        self.started_at = datetime.utcnow()
+        self.start = time.perf_counter()
+        self.sampled = sampled
+        self.stacks: Counter = Counter()
+        self.query_stats = stats
+
+    @property
+    def route(self) -> str:
+        route = self.scope.get("route")
+        return route.path if route is not None else self.path
+
+
+class ProfilerSession:
+    """샘플링 세션"""
+
+    def __init__(self, duration: float, interval: float, sample_rate: Optional[float]):
+        self.started_at = datetime.utcnow()
+        self.ends_at = time.monotonic() + duration
+        self.duration = duration
+        self.interval = interval
+        # None이면 전체 스레드 샘플링, 값이 있으면 해당 비율의 요청만 샘플링
+        self.sample_rate = sample_rate
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+    @property
+    def active(self) -> bool:
+        return time.monotonic() < self.ends_at
+
+    def status(self) -> dict:
+        return {
+            "active": self.active,
+            "mode": "all" if self.sample_rate is None else "requests",
+            "sample_rate": self.sample_rate,
+            "interval_ms": self.interval * 1000,
+            "duration_seconds": self.duration,
+            "started_at": self.started_at.isoformat() + "Z",
+            "samples": self.samples,
+            "unique_stacks": len(self.stacks),
+        }
+
+    def folded(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+
+class Profiler:
+    """샘플러 스레드 + 요청 추적"""
+
+    def __init__(self, slow_threshold_ms: int, slow_log_size: int, slow_sample_interval_ms: int):
+        self.slow_threshold = slow_threshold_ms / 1000
+        self.slow_sample_interval = slow_sample_interval_ms / 1000
+        self.slow_requests: deque = deque(maxlen=slow_log_size)
+        self.session: Optional[ProfilerSession] = None
+        self._active: Dict[object, RequestTrace] = {}
+        self._loop = None
+        self._loop_thread_id: Optional[int] = None
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+
+    # ---- 세션 제어 ----
+
+    def start_session(self, duration: float, interval: float, sample_rate: Optional[float]) -> ProfilerSession:
+        with self._lock:
+            self.session = ProfilerSession(duration, interval, sample_rate)
+        self._ensure_thread()
+        self._wakeup.set()
+        return self.session
+
+    def stop_session(self) -> Optional[ProfilerSession]:
+        with self._lock:
+            if self.session is not None:
+                self.session.ends_at = time.monotonic()
+            return self.session
+
+    # ---- 요청 추적 (미들웨어에서 호출) ----
+
+    def begin_request(self, scope, stats: query_stats.QueryStats) -> Optional[RequestTrace]:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            self._loop_thread_id = threading.get_ident()
+
+        session = self.session
+        sampled = (
+            session is not None and session.active and session.sample_rate is not None
+            and random.random() < session.sample_rate
+        )
+        if not sampled and self.slow_threshold <= 0:
+            return None
+
+        trace = RequestTrace(scope, sampled, stats)
+        task = asyncio.current_task()
+        self._active[task] = trace
+        self._ensure_thread()
+        return trace
+
+    def end_request(self, trace: RequestTrace, status_code: int) -> None:
+        self._active.pop(asyncio.current_task(), None)
+        elapsed = time.perf_counter() - trace.start
+        if self.slow_threshold > 0 and elapsed >= self.slow_threshold:
+            self.slow_requests.append({
+                "method": trace.method,
+                "path": trace.path,
+                "route": trace.route,
+                "status": status_code,
+                "duration_ms": round(elapsed * 1000, 3),
+                "started_at": trace.started_at.isoformat() + "Z",
+                "db": trace.query_stats.to_dict(),
+                "stacks": [f"{stack} {count}" for stack, count in trace.stacks.most_common(20)],
+            })
+
+    # ---- 샘플러 스레드 ----
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while True:
+            session = self.session
+            session_active = session is not None and session.active
+            interval = session.interval if session_active else self.slow_sample_interval
+
+            if not session_active and not self._active:
+                self._wakeup.wait(IDLE_INTERVAL)
+                self._wakeup.clear()
+                continue
+
+            time.sleep(interval)
+            frames = sys._current_frames()
+
+            if session_active and session.sample_rate is None:
+                # 전체 스레드 샘플링
+                for thread_id, frame in frames.items():
+                    if thread_id != own_id:
+                        session.stacks[_folded_stack(frame)] += 1
+                session.samples += 1
+
+            # 이벤트 루프에서 실행 중인 요청 샘플링
+            loop_frame = frames.get(self._loop_thread_id)
+            if loop_frame is None or not self._active:
+                continue
+            trace = self._active.get(_current_task(self._loop))
+            if trace is None:
+                continue
+
+            stack = None
+            if session_active and trace.sampled:
+                stack = _folded_stack(loop_frame)
+                session.stacks[f"{trace.method} {trace.route};{stack}"] += 1
+                session.samples += 1
+            if self.slow_threshold > 0 and time.perf_counter() - trace.start >= self.slow_threshold:
+                trace.stacks[stack or _folded_stack(loop_frame)] += 1
+
+
+profiler = Profiler(
+    slow_threshold_ms=settings.slow_request_threshold_ms,
+    slow_log_size=settings.slow_request_log_size,
+    slow_sample_interval_ms=settings.slow_request_sample_interval_ms,
+)
+
+
+class ProfilingMiddleware:
+    """요청별 SQL 통계 수집 및 프로파일러 추적 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = query_stats.start()
+        trace = profiler.begin_request(scope, stats)
+        if trace is None and not settings.query_debug_headers:
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                query_stats.check_request(scope, stats)
+                query_stats.stop(token)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.query_debug_headers:
+                    # 응답 시작 전까지 실행된 SQL 문 기준 (스트리밍 중 조회는 포함되지 않음)
+                    message["headers"] = list(message.get("headers", [])) + query_stats.debug_headers(stats)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if trace is not None:
+                profiler.end_request(trace, status_code)
+            query_stats.check_request(scope, stats)
+            query_stats.stop(token)
@@ -0,0 +1,49 @@
+"""
+목록 조회용 컬럼 프로젝션
+
+목록 화면에서 쓰지 않는 detail_html, custom_css 같은 대용량 Text 컬럼은 조회하지 않는다.
+fields= 파라미터로 필요한 필드만 지정하면 해당 컬럼만 조회하고 응답에도 그 필드만 포함한다.
+"""
+from typing import Iterable, List, Optional
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import load_only
+
+from .models import App
+from .responses import FastJSONResponse
+from .schemas import AppSummaryResponse
+
+# 목록 응답에서 선택 가능한 필드
+APP_SUMMARY_FIELDS = tuple(AppSummaryResponse.model_fields)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 파라미터(콤마 구분) 검증 (미지정 시 None)"""
+    if not fields:
+        return None
+    names = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in names if name not in APP_SUMMARY_FIELDS]
+    if unknown or not names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 필드입니다: {', '.join(unknown)} (사용 가능: {', '.join(APP_SUMMARY_FIELDS)})"
+        )
+    return names
+
+
+def app_summary_columns(fields: Optional[List[str]] = None):
+    """목록 조회 시 불러올 컬럼만 지정하는 로더 옵션 (id는 커서용으로 항상 포함)"""
+    names = ["id"] + [name for name in (fields or APP_SUMMARY_FIELDS) if name != "id"]
+    return load_only(*[getattr(App, name) for name in names])
+
+
+def sparse_list_response(
+    items: Iterable,
+    fields: List[str],
+    total: Optional[int],
+    next_cursor: Optional[str],
+) -> FastJSONResponse:
+    """지정한 필드만 포함한 목록 응답 (AppListResponse와 같은 구조)"""
+    apps = [{name: getattr(item, name) for name in fields} for item in items]
+    return FastJSONResponse(jsonable_encoder({"apps": apps, "total": total, "next_cursor": next_cursor}))
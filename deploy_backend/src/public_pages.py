@@ -0,0 +1,224 @@
+"""
+공개 상세 페이지 템플릿
+
+detail_html의 플레이스홀더({{APP_NAME}} 등)는 저장 시점에 한 번만 파싱/컴파일하고,
+완성된 공개 페이지 응답은 앱 단위로 캐시한다. 앱/버전 변경 시 무효화된다.
+"""
+import re
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, exists
+from sqlalchemy.orm import Query, Session
+
+from . import events
+from .cache import get_cache
+from .config import get_settings
+from .models import App, AppVersion, ReleaseChannel
+from .schemas import AppPublicResponse, AppSummaryResponse
+from .projections import app_summary_columns
+from .responses import serialize
+from .semver import version_key
+
+settings = get_settings()
+
+PLACEHOLDERS = (
+    "APP_NAME",
+    "APP_DESCRIPTION",
+    "APP_ID",
+    "ICON_URL",
+    "DOWNLOAD_URL",
+    "DOWNLOAD_BUTTON",
+    "MANUAL_DOWNLOAD_URL",
+    "MANUAL_DOWNLOAD_BUTTON",
+    "LATEST_VERSION",
+)
+
+# 플레이스홀더 토큰 (re.split 결과의 홀수 인덱스가 플레이스홀더 이름)
+_PLACEHOLDER_RE = re.compile(r"\{\{(" + "|".join(PLACEHOLDERS) + r")\}\}")
+
+# 아이콘이 없을 때 제거할 아이콘 영역 패턴
+_ICON_BLOCK_PATTERNS = (
+    # id="app-icon-container"가 있는 div
+    re.compile(r'<div[^>]*id="app-icon-container"[^>]*>.*?</div>', re.DOTALL | re.IGNORECASE),
+    # mb-8 클래스를 가진 div 중 "앱 아이콘" 주석과 빈 src img가 있는 경우
+    re.compile(
+        r'<div[^>]*class="[^"]*mb-8[^"]*"[^>]*>\s*<!--\s*앱 아이콘\s*-->.*?<img[^>]*src=""[^>]*>.*?</div>',
+        re.DOTALL | re.IGNORECASE
+    ),
+    # mb-8 클래스를 가진 div 안에 빈 src를 가진 img가 있는 경우
+    re.compile(r'<div[^>]*class="[^"]*mb-8[^"]*"[^>]*>.*?<img[^>]*src=""[^>]*>.*?</div>', re.DOTALL | re.IGNORECASE),
+)
+
+
+class CompiledTemplate:
+    """플레이스홀더 위치가 미리 계산된 상세 페이지 템플릿"""
+
+    def __init__(self, source: str):
+        self.source = source
+        self._with_icon = _PLACEHOLDER_RE.split(source)
+
+        # 아이콘이 없는 경우: 아이콘 URL을 비운 뒤 아이콘 영역을 한 번만 제거해 둔다
+        without_icon = source.replace("{{ICON_URL}}", "")
+        for pattern in _ICON_BLOCK_PATTERNS:
+            without_icon = pattern.sub("", without_icon)
+        self._without_icon = _PLACEHOLDER_RE.split(without_icon)
+
+    def render(self, values: Dict[str, str], has_icon: bool) -> str:
+        """플레이스홀더를 값으로 채운 HTML 반환 (단일 join)"""
+        parts: List[str] = list(self._with_icon if has_icon else self._without_icon)
+        for i in range(1, len(parts), 2):
+            parts[i] = values.get(parts[i], "")
+        return "".join(parts)
+
+
+# 앱 DB ID → 컴파일된 템플릿
+template_cache = get_cache("public_templates", maxsize=1024, ttl=24 * 60 * 60)
+
+# 앱 문자열 ID → 완성된 공개 페이지 응답 (직렬화된 JSON bytes)
+page_cache = get_cache(
+    "public_pages",
+    maxsize=settings.public_page_cache_max_size,
+    ttl=settings.public_page_cache_ttl_seconds,
+)
+
+
+# 공개 앱 전체 목록 (어떤 앱이든 변경되면 무효화)
+PUBLIC_LIST_KEY = "all"
+public_list_cache = get_cache("public_app_list", maxsize=1, ttl=settings.public_page_cache_ttl_seconds)
+
+
+def compile_template(app_db_id: int, detail_html: Optional[str]) -> Optional[CompiledTemplate]:
+    """템플릿 컴파일 후 캐시에 저장 (앱 저장 시 호출)"""
+    if not detail_html:
+        template_cache.invalidate(app_db_id)
+        return None
+    template = CompiledTemplate(detail_html)
+    template_cache.set(app_db_id, template)
+    return template
+
+
+def get_template(app_db_id: int, detail_html: Optional[str]) -> Optional[CompiledTemplate]:
+    """컴파일된 템플릿 조회 (다른 워커에서 저장된 경우 등 원본이 다르면 다시 컴파일)"""
+    if not detail_html:
+        return None
+    template = template_cache.get(app_db_id)
+    if template is None or template.source != detail_html:
+        template = compile_template(app_db_id, detail_html)
+    return template
+
+
+def public_apps_query(db: Session) -> Query:
+    """활성화된 안정 버전이 있는 공개 앱 조회 쿼리"""
+    # EXISTS를 사용하여 활성화된 버전이 있는 공개 앱만 조회 (중복 방지)
+    return db.query(App).filter(
+        App.is_public == True,
+        exists().where(
+            and_(
+                AppVersion.app_id == App.id,
+                AppVersion.is_active == True,
+                AppVersion.channel == ReleaseChannel.STABLE
+            )
+        )
+    )
+
+
+def get_public_apps(db: Session) -> List[AppSummaryResponse]:
+    """공개 앱 전체 목록 (id 순, 상세 HTML/CSS 제외, 캐시)"""
+    apps = public_list_cache.get(PUBLIC_LIST_KEY)
+    if apps is None:
+        rows = public_apps_query(db).options(app_summary_columns()).order_by(App.id).all()
+        apps = [AppSummaryResponse.model_validate(app) for app in rows]
+        public_list_cache.set(PUBLIC_LIST_KEY, apps)
+    return apps
+
+
+def build_public_page(db: Session, app: App) -> AppPublicResponse:
+    """
+    공개 상세 페이지 응답 생성
+
+    - 앱 정보, 상세 HTML(플레이스홀더 치환), 커스텀 CSS
+    - 최신 버전 다운로드 URL 포함
+    """
+    # 최신 활성 버전 조회 (버전 번호 기준)
+    active_versions = db.query(AppVersion).filter(
+        AppVersion.app_id == app.id,
+        AppVersion.channel == ReleaseChannel.STABLE,
+        AppVersion.is_active == True
+    ).all()
+    
+    # 버전 번호 기준으로 최신 버전 선택
+    latest_version = max(active_versions, key=lambda v: version_key(v.version)) if active_versions else None
+    
+    # 설명서 다운로드 URL 생성
+    manual_download_url = None
+    if app.manual_file_path:
+        manual_download_url = f"/api/apps/public/{app.app_id}/manual"
+    
+    # 플레이스홀더 치환 (저장 시 컴파일된 템플릿 사용)
+    detail_html = ""
+    template = get_template(app.id, app.detail_html)
+    if template:
+        # 다운로드 버튼 HTML 생성
+        download_button = ""
+        if latest_version:
+            download_button = f'<a href="/api/update/download/{latest_version.id}" class="inline-flex items-center justify-center px-8 py-3 bg-blue-600 hover:bg-blue-700 text-white rounded-lg font-semibold transition">다운로드</a>'
+        
+        # 설명서 다운로드 버튼 HTML 생성
+        manual_download_button = ""
+        if manual_download_url:
+            manual_download_button = f'<a href="{manual_download_url}" class="inline-flex items-center justify-center px-8 py-3 bg-gray-600 hover:bg-gray-700 text-white rounded-lg font-semibold transition">[사용설명서]</a>'
+        
+        icon_url = app.icon_url or ""
+        values = {
+            "APP_NAME": app.name or "",
+            "APP_DESCRIPTION": app.description or "",
+            "APP_ID": app.app_id or "",
+            "ICON_URL": icon_url,
+            "DOWNLOAD_URL": f"/api/update/download/{latest_version.id}" if latest_version else "",
+            "DOWNLOAD_BUTTON": download_button,
+            "MANUAL_DOWNLOAD_URL": manual_download_url or "",
+            "MANUAL_DOWNLOAD_BUTTON": manual_download_button,
+            "LATEST_VERSION": latest_version.version if latest_version else ""
+        }
+        
+        # 아이콘 URL이 없으면 아이콘 영역이 제거된 템플릿으로 렌더링
+        detail_html = template.render(values, has_icon=bool(icon_url.strip()))
+    
+    return AppPublicResponse(
+        app_id=app.app_id,
+        name=app.name,
+        description=app.description,
+        group=app.group,
+        detail_html=detail_html,
+        custom_css=app.custom_css,
+        icon_url=app.icon_url,
+        latest_version=latest_version.version if latest_version else None,
+        download_url=f"/api/update/download/{latest_version.id}" if latest_version else None,
+        file_size=latest_version.file_size if latest_version else None,
+        manual_download_url=manual_download_url,
+        manual_file_name=app.manual_file_name
+    )
+
+
+def render_public_page(db: Session, app: App) -> bytes:
+    """공개 상세 페이지 응답을 직렬화하여 캐시에 저장"""
+    body = serialize(build_public_page(db, app).model_dump(mode="json"))
+    page_cache.set(app.app_id, body)
+    return body
+
+
+def warm(db: Session) -> int:
+    """공개 목록과 공개 앱 상세 페이지를 미리 생성 (시작 시 호출, 생성한 페이지 수 반환)"""
+    get_public_apps(db)
+    apps = public_apps_query(db).all()
+    for app in apps:
+        render_public_page(db, app)
+    return len(apps)
+
+
+# 앱/버전 변경 시 (다른 워커 포함) 공개 페이지 및 목록 무효화
+for _event in (events.APP_CHANGED, events.VERSION_CHANGED):
+    events.subscribe(_event, page_cache.invalidate)
+    events.subscribe(_event, lambda app_id: public_list_cache.clear())
+events.subscribe(events.RESYNC, lambda key: page_cache.clear())
+events.subscribe(events.RESYNC, lambda key: public_list_cache.clear())
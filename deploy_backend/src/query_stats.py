@@ -0,0 +1,211 @@
+"""
+요청 단위 SQL 실행 통계
+
+SQLAlchemy 엔진 이벤트로 실행된 SQL 문 수와 소요 시간을 현재 요청(ContextVar)에 누적한다.
+
+- 같은 SQL 문(바인드 파라미터만 다른 문)이 한 요청에서 여러 번 실행되면 N+1 조회로 의심하여 경고 로그를 남긴다.
+- QUERY_DEBUG_HEADERS=true이면 응답에 X-Query-Count, X-Query-Time-Ms 헤더를 추가한다.
+- 테스트/스크립트에서는 assert_query_budget()으로 엔드포인트별 SQL 문 수 상한을 검사한다.
+
+    with query_stats.assert_query_budget(3):
+        client.get("/api/update/check", params={...})
+"""
+import logging
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# 요청별로 보관할 느린 SQL 문 수
+MAX_SLOWEST = 5
+
+
+class QueryStats:
+    """요청 하나의 SQL 실행 통계"""
+
+    __slots__ = ("count", "total_time", "slowest", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest: List[Tuple[float, str]] = []
+        # SQL 문별 실행 횟수 (파라미터는 바인드 변수이므로 같은 조회는 같은 문자열)
+        self.statements: Counter = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        self.statements[statement] += 1
+        if len(self.slowest) < MAX_SLOWEST or elapsed > self.slowest[-1][0]:
+            self.slowest.append((elapsed, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[MAX_SLOWEST:]
+
+    def repeated(self, threshold: int) -> List[Tuple[int, str]]:
+        """threshold번 이상 실행된 SQL 문 (N+1 의심, 많이 실행된 순)"""
+        if threshold <= 0:
+            return []
+        return [(count, statement) for statement, count in self.statements.most_common() if count >= threshold]
+
+    def to_dict(self) -> dict:
+        return {
+            "queries": self.count,
+            "time_ms": round(self.total_time * 1000, 3),
+            "slowest": [
+                {"time_ms": round(elapsed * 1000, 3), "statement": _compact(statement)}
+                for elapsed, statement in self.slowest
+            ],
+            "repeated": [
+                {"count": count, "statement": _compact(statement)}
+                for count, statement in self.repeated(settings.n_plus_one_threshold)
+            ],
+        }
+
+
+def _compact(statement: str, limit: int = 500) -> str:
+    return " ".join(statement.split())[:limit]
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+# capture() 블록에서 수집 중인 통계 (요청 컨텍스트와 무관하게 모든 스레드의 SQL 문 집계)
+_captures: List[QueryStats] = []
+_captures_lock = threading.Lock()
+
+
+def start() -> Tuple[QueryStats, object]:
+    """현재 컨텍스트(요청)에 새 통계 시작"""
+    stats = QueryStats()
+    return stats, _current.set(stats)
+
+
+def stop(token) -> None:
+    _current.reset(token)
+
+
+def current() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_times = conn.info.get("query_start_time")
+    if not start_times:
+        return
+    elapsed = time.perf_counter() - start_times.pop()
+    stats = _current.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+    if _captures:
+        with _captures_lock:
+            for capture_stats in _captures:
+                capture_stats.record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # 실패한 SQL 문은 after_cursor_execute가 호출되지 않으므로 시작 시간 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def install(engine: Engine) -> None:
+    """엔진에 SQL 실행 시간 측정 이벤트 등록"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+def check_request(scope, stats: QueryStats) -> None:
+    """요청 종료 시 SQL 문 수 초과/N+1 의심 경고 로그"""
+    too_many = 0 < settings.query_count_warning_threshold < stats.count
+    repeated = stats.repeated(settings.n_plus_one_threshold)
+    if not too_many and not repeated:
+        return
+    route = scope.get("route")
+    extra = {
+        "method": scope["method"],
+        "path": scope["path"],
+        "route": route.path if route is not None else scope["path"],
+        "queries": stats.count,
+        "query_time_ms": round(stats.total_time * 1000, 3),
+    }
+    if repeated:
+        count, statement = repeated[0]
+        extra["repeated_count"] = count
+        extra["repeated_statement"] = _compact(statement, 300)
+        logger.warning(
+            f"Possible N+1 query: {count} identical statements in {scope['method']} {extra['route']}",
+            extra=extra
+        )
+    else:
+        logger.warning(f"{stats.count} queries in {scope['method']} {extra['route']}", extra=extra)
+
+
+def debug_headers(stats: QueryStats) -> List[Tuple[bytes, bytes]]:
+    """응답 헤더용 SQL 실행 통계 (QUERY_DEBUG_HEADERS)"""
+    return [
+        (b"x-query-count", str(stats.count).encode("latin-1")),
+        (b"x-query-time-ms", f"{stats.total_time * 1000:.3f}".encode("latin-1")),
+    ]
+
+
+class QueryBudgetExceeded(AssertionError):
+    """SQL 문 수 상한 초과 또는 N+1 조회 감지 (assert_query_budget)"""
+
+
+@contextmanager
+def capture() -> Iterator[QueryStats]:
+    """블록 안에서 실행된 모든 SQL 문 집계 (TestClient처럼 다른 스레드에서 처리되는 요청 포함)"""
+    stats = QueryStats()
+    with _captures_lock:
+        _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        with _captures_lock:
+            _captures.remove(stats)
+
+
+@contextmanager
+def assert_query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Iterator[QueryStats]:
+    """
+    블록 안의 SQL 문 수가 max_queries를 넘거나 같은 SQL 문이 max_repeats번 넘게 반복되면
+    QueryBudgetExceeded 발생 (max_repeats 미지정 시 N_PLUS_ONE_THRESHOLD - 1)
+
+    N+1 검사는 블록 안의 전체 SQL 문 기준이므로 블록 하나에 요청 하나만 보낸다.
+
+    사용 예시:
+        with assert_query_budget(2):
+            response = client.get(f"/api/apps/{app_id}/versions", headers=headers)
+    """
+    if max_repeats is None:
+        max_repeats = settings.n_plus_one_threshold - 1 if settings.n_plus_one_threshold > 0 else 0
+    with capture() as stats:
+        yield stats
+
+    problems = []
+    if stats.count > max_queries:
+        problems.append(f"{stats.count} queries executed (budget {max_queries})")
+    if max_repeats > 0:
+        for count, statement in stats.repeated(max_repeats + 1):
+            problems.append(f"statement repeated {count} times (possible N+1): {_compact(statement, 300)}")
+    if problems:
+        executed = "\n".join(
+            f"  {count}x {_compact(statement, 200)}" for statement, count in stats.statements.most_common()
+        )
+        raise QueryBudgetExceeded("; ".join(problems) + "\nexecuted statements:\n" + executed)
@@ -0,0 +1,99 @@
+"""
+설치 파일 부분 다운로드 (HTTP Range, 이어받기용)
+
+단일 구간 요청(bytes=시작-끝, bytes=시작-, bytes=-길이)만 206으로 응답하고,
+Range가 없거나 해석할 수 없는 요청(여러 구간 등)은 전체 파일(200)로 응답한다.
+"""
+import os
+import re
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+import anyio
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """요청한 구간이 파일 크기를 벗어남 (416)"""
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Range 헤더 → (시작, 끝) 바이트 위치 (끝 포함), 없거나 해석할 수 없으면 None"""
+    if not header:
+        return None
+    match = _RANGE_RE.match(header.strip())
+    if match is None or not (match.group(1) or match.group(2)):
+        return None
+    if match.group(1):
+        start = int(match.group(1))
+        end = int(match.group(2)) if match.group(2) else size - 1
+        if start >= size:
+            raise RangeNotSatisfiable()
+        if end < start:
+            return None
+        return start, min(end, size - 1)
+    length = int(match.group(2))
+    if length == 0 or size == 0:
+        raise RangeNotSatisfiable()
+    return max(0, size - length), size - 1
+
+
+def range_start(header: Optional[str]) -> int:
+    """Range 요청의 시작 위치 (이어받기 요청이면 0보다 큼, 다운로드 수 집계용)"""
+    match = _RANGE_RE.match(header.strip()) if header else None
+    if match is None or not match.group(1):
+        return 0
+    return int(match.group(1))
+
+
+def _content_disposition(filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+async def _iter_file(path: str, start: int, length: int):
+    async with await anyio.open_file(path, "rb") as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def file_response(
+    path: str,
+    filename: str,
+    range_header: Optional[str] = None,
+    media_type: str = "application/octet-stream"
+) -> Response:
+    """파일 응답 (Range 요청이면 206 부분 응답)"""
+    size = os.path.getsize(path)
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"})
+
+    if byte_range is None:
+        return FileResponse(path=path, filename=filename, media_type=media_type, headers={"Accept-Ranges": "bytes"})
+
+    start, end = byte_range
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Range": f"bytes {start}-{end}/{size}",
+        "Content-Length": str(end - start + 1),
+        "Content-Disposition": _content_disposition(filename),
+    }
+    return StreamingResponse(
+        _iter_file(path, start, end - start + 1),
+        status_code=206,
+        media_type=media_type,
+        headers=headers
+    )
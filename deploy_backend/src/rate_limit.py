@@ -0,0 +1,161 @@
+"""
+업데이트 확인/다운로드 요청 속도 제한 (토큰 버킷)
+
+필수 업데이트 배포 직후 모든 클라이언트가 동시에 확인/다운로드를 요청해도
+DB 커넥션 풀이 고갈되지 않도록 클라이언트별, 앱별로 요청을 제한한다.
+제한을 넘은 요청은 DB에 접근하기 전에 429 + Retry-After로 응답한다.
+
+상태는 프로세스 메모리(TTLCache)에만 보관하므로 워커별로 독립적으로 계산된다.
+"""
+import math
+import threading
+import time
+from typing import Optional
+
+from fastapi import HTTPException, Request, status
+
+from .cache import get_cache
+from .config import get_settings
+
+settings = get_settings()
+
+CLIENT_ID_HEADER = "X-Client-ID"
+MAX_CLIENT_ID_LENGTH = 128
+
+
+class TokenBucketLimiter:
+    """키별 토큰 버킷 (초당 rate개 충전, 최대 burst개 보관)"""
+
+    def __init__(self, name: str, rate: float, burst: int, max_keys: int):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.rejected = 0
+        # 버킷이 가득 차는 시간이 지나면 기본 상태와 같으므로 그 뒤에는 버려도 됨
+        ttl = burst / rate if rate > 0 else 60.0
+        self._buckets = get_cache(f"rate_limit_{name}", maxsize=max_keys, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.rate > 0 and self.burst > 0
+
+    def acquire(self, key) -> float:
+        """
+        토큰 1개 사용 시도
+
+        Returns:
+            0이면 허용, 양수이면 다음 토큰까지 기다려야 하는 시간(초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens = float(self.burst)
+            else:
+                tokens, updated_at = bucket
+                tokens = min(float(self.burst), tokens + (now - updated_at) * self.rate)
+
+            if tokens >= 1.0:
+                self._buckets.set(key, (tokens - 1.0, now))
+                return 0.0
+
+            self._buckets.set(key, (tokens, now))
+            self.rejected += 1
+            return (1.0 - tokens) / self.rate
+
+
+def get_ip_key(request: Request) -> Optional[str]:
+    """
+    클라이언트 IP 키
+
+    프록시(nginx) 뒤에서는 uvicorn --proxy-headers가 신뢰하는 프록시의 X-Forwarded-For로
+    request.client를 실제 클라이언트 주소로 바꿔 두므로, 모든 요청이 프록시 IP 하나로 묶이지 않는다.
+    """
+    return "ip:" + request.client.host if request.client else None
+
+
+def get_client_key(request: Request) -> Optional[str]:
+    """
+    클라이언트 식별자 (IP + X-Client-ID 헤더, 헤더가 없으면 IP)
+
+    헤더 값은 클라이언트가 임의로 정하므로 IP와 함께 키로 사용한다.
+    다른 클라이언트의 ID를 복사해도 그 클라이언트의 한도를 소모하지 못한다.
+    """
+    ip_key = get_ip_key(request)
+    client_id = request.headers.get(CLIENT_ID_HEADER)
+    if not client_id:
+        return ip_key
+    id_key = "id:" + client_id[:MAX_CLIENT_ID_LENGTH]
+    return f"{ip_key}|{id_key}" if ip_key else id_key
+
+
+def _too_many_requests(wait: float) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": str(max(1, math.ceil(wait)))},
+    )
+
+
+class RateLimit:
+    """
+    클라이언트별 + 앱별 제한을 함께 적용하는 FastAPI 의존성
+
+    X-Client-ID를 보내는 요청은 IP별 한도(클라이언트 한도 × RATE_LIMIT_CLIENTS_PER_IP)도 적용하므로
+    헤더 값을 바꿔 가며 보내도 IP 하나가 쓸 수 있는 양은 제한된다.
+    """
+
+    def __init__(self, name: str, client_rate: float, client_burst: int, app_rate: float, app_burst: int):
+        max_keys = settings.rate_limit_max_keys
+        per_ip = settings.rate_limit_clients_per_ip
+        self.client_limiter = TokenBucketLimiter(f"{name}_client", client_rate, client_burst, max_keys)
+        self.ip_limiter = TokenBucketLimiter(f"{name}_ip", client_rate * per_ip, client_burst * per_ip, max_keys)
+        self.app_limiter = TokenBucketLimiter(f"{name}_app", app_rate, app_burst, max_keys)
+
+    async def __call__(self, request: Request) -> None:
+        if not settings.rate_limit_enabled:
+            return
+
+        # 클라이언트 제한 먼저 확인 (한 클라이언트가 앱 전체 한도를 소모하지 않도록)
+        client_key = get_client_key(request)
+        if client_key and self.client_limiter.enabled:
+            wait = self.client_limiter.acquire(client_key)
+            if wait:
+                raise _too_many_requests(wait)
+
+        # 헤더가 없으면 클라이언트 키가 곧 IP 키이므로 한 번만 적용
+        ip_key = get_ip_key(request)
+        if ip_key and ip_key != client_key and self.ip_limiter.enabled:
+            wait = self.ip_limiter.acquire(ip_key)
+            if wait:
+                raise _too_many_requests(wait)
+
+        app_key = request.path_params.get("app_id") or request.query_params.get("app_id")
+        if app_key is None and "version_id" in request.path_params:
+            app_key = f"version:{request.path_params['version_id']}"
+        if app_key and self.app_limiter.enabled:
+            wait = self.app_limiter.acquire(app_key)
+            if wait:
+                raise _too_many_requests(wait)
+
+    @property
+    def limiters(self):
+        return (self.client_limiter, self.ip_limiter, self.app_limiter)
+
+
+update_check_rate_limit = RateLimit(
+    "update_check",
+    client_rate=settings.update_check_client_rate,
+    client_burst=settings.update_check_client_burst,
+    app_rate=settings.update_check_app_rate,
+    app_burst=settings.update_check_app_burst,
+)
+
+download_rate_limit = RateLimit(
+    "download",
+    client_rate=settings.download_client_rate,
+    client_burst=settings.download_client_burst,
+    app_rate=settings.download_app_rate,
+    app_burst=settings.download_app_burst,
+)
@@ -0,0 +1,144 @@
+"""
+릴리스 상태 캐시 (업데이트 확인용)
+
+앱별로 채널마다 활성 버전 목록을 버전 번호 내림차순으로 보관한다.
+업데이트 확인은 캐시 적중 시 DB를 조회하지 않는다.
+
+앱/버전 변경 이벤트(다른 워커 포함)를 받으면 해당 앱 항목을 즉시 무효화한다.
+등록되지 않은 앱 ID도 짧은 시간 동안 캐시하여 잘못된 요청이 몰려도 DB에 부담을 주지 않는다.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from . import events
+from .cache import get_cache
+from .config import get_settings
+from .models import App, AppVersion, ReleaseChannel
+from .semver import version_key
+
+settings = get_settings()
+
+# 등록되지 않은 앱 표시 (None은 캐시 미스와 구분되지 않으므로 별도 값 사용)
+_NOT_FOUND = object()
+
+# 무효화 세대 번호 (DB 조회 중에 무효화되면 조회 결과를 캐시에 넣지 않음)
+_generation = 0
+
+
+@dataclass(frozen=True)
+class ReleaseVersion:
+    """업데이트 확인 응답에 필요한 버전 정보"""
+    id: int
+    version: str
+    sort_key: tuple
+    is_mandatory: bool
+    release_notes: Optional[str]
+    file_size: int
+    file_hash: str
+
+
+@dataclass
+class ReleaseState:
+    """앱 하나의 채널별 활성 버전 (버전 번호 내림차순)"""
+    app_db_id: int
+    channels: Dict[ReleaseChannel, List[ReleaseVersion]] = field(default_factory=dict)
+
+    def latest(self, channel: ReleaseChannel) -> Optional[ReleaseVersion]:
+        versions = self.channels.get(channel)
+        return versions[0] if versions else None
+
+    def mandatory_between(self, channel: ReleaseChannel, current_key: tuple, latest_key: tuple) -> bool:
+        """현재 버전 초과 ~ 최신 버전 이하 구간에 필수 업데이트가 있는지 확인"""
+        return any(
+            v.is_mandatory and current_key < v.sort_key <= latest_key
+            for v in self.channels.get(channel, ())
+        )
+
+
+release_cache = get_cache(
+    "release_state",
+    maxsize=settings.release_state_cache_max_size,
+    ttl=settings.release_state_cache_ttl_seconds,
+)
+
+
+def load_release_state(db: Session, app_id: str) -> Optional[ReleaseState]:
+    """DB에서 앱의 릴리스 상태 조회 (캐시 사용 안 함)"""
+    app_db_id = db.query(App.id).filter(App.app_id == app_id).scalar()
+    if app_db_id is None:
+        return None
+
+    rows = db.query(
+        AppVersion.id,
+        AppVersion.version,
+        AppVersion.channel,
+        AppVersion.is_mandatory,
+        AppVersion.release_notes,
+        AppVersion.file_size,
+        AppVersion.file_hash,
+    ).filter(
+        AppVersion.app_id == app_db_id,
+        AppVersion.is_active == True
+    ).all()
+
+    state = ReleaseState(app_db_id=app_db_id)
+    for row in rows:
+        state.channels.setdefault(row.channel, []).append(ReleaseVersion(
+            id=row.id,
+            version=row.version,
+            sort_key=version_key(row.version),
+            is_mandatory=bool(row.is_mandatory),
+            release_notes=row.release_notes,
+            file_size=row.file_size,
+            file_hash=row.file_hash,
+        ))
+    for versions in state.channels.values():
+        versions.sort(key=lambda v: v.sort_key, reverse=True)
+    return state
+
+
+def get_release_state(db: Session, app_id: str) -> Optional[ReleaseState]:
+    """앱의 릴리스 상태 (캐시, 등록되지 않은 앱이면 None)"""
+    state = release_cache.get(app_id)
+    if state is not None:
+        return None if state is _NOT_FOUND else state
+
+    generation = _generation
+    state = load_release_state(db, app_id)
+    if generation == _generation:
+        if state is None:
+            release_cache.set(app_id, _NOT_FOUND, ttl=settings.release_state_not_found_ttl_seconds)
+        else:
+            release_cache.set(app_id, state)
+    return state
+
+
+def warm(db: Session) -> int:
+    """전체 앱의 릴리스 상태를 미리 적재 (시작 시 호출, 적재한 앱 수 반환)"""
+    generation = _generation
+    states = [(app_id, load_release_state(db, app_id)) for (app_id,) in db.query(App.app_id).all()]
+    if generation == _generation:
+        for app_id, state in states:
+            if state is not None:
+                release_cache.set(app_id, state)
+    return len(states)
+
+
+def _invalidate(app_id: str) -> None:
+    global _generation
+    _generation += 1
+    release_cache.invalidate(app_id)
+
+
+def _clear(key: str) -> None:
+    global _generation
+    _generation += 1
+    release_cache.clear()
+
+
+# 앱 생성/수정/삭제, 버전 변경 시 (다른 워커 포함) 해당 앱 무효화
+events.subscribe(events.APP_CHANGED, _invalidate)
+events.subscribe(events.VERSION_CHANGED, _invalidate)
+events.subscribe(events.RESYNC, _clear)
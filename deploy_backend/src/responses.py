@@ -0,0 +1,34 @@
+"""
+JSON 응답 직렬화
+
+orjson이 설치되어 있으면 기본 json 모듈 대신 사용한다 (미설치 시 표준 JSONResponse와 동일).
+자주 조회되는 응답은 serialize()로 미리 bytes로 만들어 캐시해 두고 json_bytes_response()로 그대로 반환한다.
+"""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
+
+
+def serialize(content: Any) -> bytes:
+    """JSON 호환 값(dict, list 등)을 UTF-8 JSON bytes로 변환"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 기반 JSON 응답 (애플리케이션 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return serialize(content)
+
+
+def json_bytes_response(body: bytes, status_code: int = 200) -> Response:
+    """미리 직렬화된 JSON bytes 응답"""
+    return Response(content=body, status_code=status_code, media_type="application/json")
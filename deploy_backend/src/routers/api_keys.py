@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from ..database import get_db
+from ..models import ApiKey, App, User
+from ..schemas import ApiKeyCreate, ApiKeyResponse, ApiKeyCreatedResponse
+from ..auth import (
+    generate_api_key,
+    hash_api_key,
+    invalidate_api_key_cache,
+    get_current_admin_user,
+)
+
+router = APIRouter(prefix="/api/apps/{app_id}/api-keys", tags=["API 키"])
+
+
+@router.get("", response_model=List[ApiKeyResponse])
+async def get_api_keys(
+    app_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """앱의 API 키 목록 조회 (관리자 전용)"""
+    app = db.query(App).filter(App.app_id == app_id).first()
+    if not app:
+        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
+
+    return db.query(ApiKey).filter(ApiKey.app_id == app.id).order_by(ApiKey.id).all()
+
+
+@router.post("", response_model=ApiKeyCreatedResponse, status_code=status.HTTP_201_CREATED)
+async def create_api_key(
+    app_id: str,
+    key_data: ApiKeyCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    API 키 발급 (관리자 전용)
+
+    평문 키는 이 응답에서만 확인할 수 있음
+    """
+    app = db.query(App).filter(App.app_id == app_id).first()
+    if not app:
+        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
+
+    if not key_data.scopes:
+        raise HTTPException(status_code=400, detail="최소 하나의 권한 범위가 필요합니다")
+
+    plain_key = generate_api_key()
+    api_key = ApiKey(
+        app_id=app.id,
+        name=key_data.name,
+        key_prefix=plain_key[:10],
+        key_hash=hash_api_key(plain_key),
+        scopes=",".join(sorted({scope.value for scope in key_data.scopes})),
+        expires_at=key_data.expires_at,
+        created_by=current_user.id,
+        is_active=True
+    )
+    db.add(api_key)
+    db.commit()
+    db.refresh(api_key)
+
+    response = ApiKeyResponse.model_validate(api_key)
+    return ApiKeyCreatedResponse(**response.model_dump(), api_key=plain_key)
+
+
+@router.delete("/{key_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_api_key(
+    app_id: str,
+    key_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """API 키 폐기 (관리자 전용)"""
+    app = db.query(App).filter(App.app_id == app_id).first()
+    if not app:
+        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
+
+    api_key = db.query(ApiKey).filter(ApiKey.id == key_id, ApiKey.app_id == app.id).first()
+    if not api_key:
+        raise HTTPException(status_code=404, detail="API 키를 찾을 수 없습니다")
+
+    key_hash = api_key.key_hash
+    db.delete(api_key)
+    db.commit()
+    invalidate_api_key_cache(key_hash)
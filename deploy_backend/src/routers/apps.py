@@ -1,15 +1,22 @@
 import os
 import shutil
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from bisect import bisect_right
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query, Header
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_, exists
+from sqlalchemy import func, desc
 
 from ..database import get_db
 from ..models import App, AppVersion, User, ReleaseChannel
 from ..schemas import AppCreate, AppUpdate, AppResponse, AppListResponse, AppPublicResponse
 from ..auth import get_current_active_user
 from ..config import get_settings
+from ..pagination import TotalMode, count_total, paginate, encode_cursor, decode_cursor
+from ..responses import json_bytes_response
+from ..projections import parse_fields, app_summary_columns, sparse_list_response
+from .. import events, icons, public_pages
 
 settings = get_settings()
 
@@ -18,15 +25,26 @@ router = APIRouter(prefix="/api/apps", tags=["앱 관리"])
 
 @router.get("", response_model=AppListResponse)
 async def get_apps(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 skip 무시)"),
+    total: TotalMode = Query(TotalMode.EXACT, description="전체 개수 계산 방식"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (콤마 구분, 예: id,app_id,name)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """앱 목록 조회"""
-    total = db.query(func.count(App.id)).scalar()
-    apps = db.query(App).offset(skip).limit(limit).all()
-    return AppListResponse(apps=apps, total=total)
+    """
+    앱 목록 조회 (id 순, 커서 페이지네이션 지원)
+    
+    상세 HTML/CSS는 포함하지 않음 (단건 조회 API 사용)
+    """
+    selected = parse_fields(fields)
+    query = db.query(App)
+    total_count = count_total(db, query, total, App.__tablename__)
+    apps, next_cursor = paginate(query.options(app_summary_columns(selected)), App.id, skip, limit, cursor)
+    if selected:
+        return sparse_list_response(apps, selected, total_count, next_cursor)
+    return AppListResponse(apps=apps, total=total_count, next_cursor=next_cursor)
 
 
 @router.post("", response_model=AppResponse, status_code=status.HTTP_201_CREATED)
@@ -49,6 +67,10 @@ async def create_app(
     db.commit()
     db.refresh(new_app)
     
+    public_pages.compile_template(new_app.id, new_app.detail_html)
+    # 등록되지 않은 앱으로 캐시된 상태 무효화
+    events.publish(events.APP_CHANGED, new_app.app_id)
+    
     return new_app
 
 
@@ -97,6 +119,8 @@ async def upload_manual(
     db.commit()
     db.refresh(app)
     
+    events.publish(events.APP_CHANGED, app_id)
+    
     return {"message": "설명서 파일이 업로드되었습니다", "file_name": file.filename, "file_path": file_path}
 
 
@@ -137,6 +161,8 @@ async def delete_manual(
     db.commit()
     db.refresh(app)
     
+    events.publish(events.APP_CHANGED, app_id)
+    
     return {"message": "설명서 파일이 삭제되었습니다"}
 
 
@@ -156,56 +182,50 @@ async def upload_icon(
         )
     
     # 이미지 파일 확장자 확인
-    allowed_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.webp', '.svg', '.ico'}
     file_ext = os.path.splitext(file.filename)[1].lower()
-    if file_ext not in allowed_extensions:
+    if file_ext not in icons.ICON_MIME_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(allowed_extensions)}"
-        )
-    
-    # 파일 크기 확인 (최대 5MB)
-    max_size = 5 * 1024 * 1024  # 5MB
-    file_content = await file.read()
-    if len(file_content) > max_size:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="파일 크기가 너무 큽니다. 최대 5MB까지 업로드 가능합니다."
+            detail=f"지원하지 않는 파일 형식입니다. 허용된 형식: {', '.join(icons.ICON_MIME_TYPES)}"
         )
     
     # 아이콘 파일 저장 디렉토리
     icon_dir = os.path.join(settings.upload_dir, app_id, "icon")
     os.makedirs(icon_dir, exist_ok=True)
     
-    # 기존 아이콘 파일이 있으면 삭제
-    if app.icon_url and app.icon_url.startswith('/api/apps/'):
-        # 기존 업로드된 파일 경로 추출
-        old_icon_path = os.path.join(icon_dir, os.path.basename(app.icon_url))
-        if os.path.exists(old_icon_path):
-            try:
-                os.remove(old_icon_path)
-            except Exception:
-                pass  # 삭제 실패해도 계속 진행
-    
-    # 새 파일 저장 (확장자 유지)
+    # 새 파일 저장 (청크 단위, 최대 5MB, 저장하면서 해시 계산)
     file_name = f"icon{file_ext}"
     file_path = os.path.join(icon_dir, file_name)
     
     try:
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)
+        file_hash, file_size = await icons.save_icon_upload(file, file_path + ".new")
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"파일 저장 실패: {str(e)}"
         )
     
-    # 앱 정보 업데이트 (서빙 URL로 저장)
-    app.icon_url = f"/api/apps/{app_id}/icon"
+    # 기존 아이콘 파일(원본 + 변형) 삭제 후 교체
+    try:
+        icons.remove_icon_files(icon_dir, keep=file_name + ".new")
+    except Exception:
+        pass  # 삭제 실패해도 계속 진행
+    os.replace(file_path + ".new", file_path)
+    
+    # 메타데이터 및 리사이즈 변형 생성
+    variants = await run_in_threadpool(icons.generate_variants, file_path)
+    icons.build_icon_record(app, file_path, file_hash, file_size, variants)
+    
+    # 앱 정보 업데이트 (해시로 버전이 지정된 서빙 URL로 저장)
+    app.icon_url = icons.icon_url(app_id, file_hash)
     
     db.commit()
     db.refresh(app)
     
+    events.publish(events.APP_CHANGED, app_id)
+    
     return {"message": "아이콘이 업로드되었습니다", "icon_url": app.icon_url}
 
 
@@ -229,85 +249,39 @@ async def delete_icon(
             detail="등록된 아이콘이 없습니다"
         )
     
-    # 파일 삭제
+    # 파일 삭제 (원본 + 변형)
     icon_dir = os.path.join(settings.upload_dir, app_id, "icon")
-    if os.path.exists(icon_dir):
-        try:
-            # 디렉토리 내 모든 파일 삭제
-            for file_name in os.listdir(icon_dir):
-                file_path = os.path.join(icon_dir, file_name)
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"파일 삭제 실패: {str(e)}"
-            )
+    try:
+        icons.remove_icon_files(icon_dir)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"파일 삭제 실패: {str(e)}"
+        )
     
     # 앱 정보 업데이트
     app.icon_url = None
+    app.icon = None
     
     db.commit()
     db.refresh(app)
     
+    events.publish(events.APP_CHANGED, app_id)
+    
     return {"message": "아이콘이 삭제되었습니다"}
 
 
 @router.get("/{app_id}/icon")
 async def get_icon(
     app_id: str,
+    size: Optional[int] = Query(None, ge=1, le=1024, description="요청 크기(px), 가장 가까운 리사이즈 변형 반환"),
+    v: Optional[str] = Query(None, description="아이콘 해시 버전"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """앱 아이콘 이미지 서빙"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="앱을 찾을 수 없습니다"
-        )
-    
-    if not app.icon_url or not app.icon_url.startswith('/api/apps/'):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="등록된 아이콘이 없습니다"
-        )
-    
-    # 아이콘 파일 찾기
-    icon_dir = os.path.join(settings.upload_dir, app_id, "icon")
-    if not os.path.exists(icon_dir):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="아이콘 파일을 찾을 수 없습니다"
-        )
-    
-    # 디렉토리에서 첫 번째 이미지 파일 찾기
-    icon_file = None
-    for file_name in os.listdir(icon_dir):
-        file_path = os.path.join(icon_dir, file_name)
-        if os.path.isfile(file_path) and file_name.startswith('icon.'):
-            icon_file = file_path
-            break
-    
-    if not icon_file or not os.path.exists(icon_file):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="아이콘 파일을 찾을 수 없습니다"
-        )
-    
-    # 파일 확장자로 MIME 타입 결정
-    ext = os.path.splitext(icon_file)[1].lower()
-    mime_types = {
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.gif': 'image/gif',
-        '.webp': 'image/webp',
-        '.svg': 'image/svg+xml',
-        '.ico': 'image/x-icon'
-    }
-    media_type = mime_types.get(ext, 'image/png')
-    
-    return FileResponse(icon_file, media_type=media_type)
+    info = await icons.get_icon_info(db, app_id)
+    return icons.icon_response(info, size, v, if_none_match)
 
 
 @router.get("/{app_id}", response_model=AppResponse)
@@ -358,6 +332,12 @@ async def update_app(
     db.commit()
     db.refresh(app)
     
+    # 상세 페이지 템플릿은 저장 시 한 번만 컴파일
+    public_pages.compile_template(app.id, app.detail_html)
+    events.publish(events.APP_CHANGED, app_id)
+    if app.app_id != app_id:
+        events.publish(events.APP_CHANGED, app.app_id)
+    
     return app
 
 
@@ -368,29 +348,29 @@ public_router = APIRouter(prefix="/api/apps", tags=["공개 앱"])
 
 @public_router.get("/public", response_model=AppListResponse)
 async def get_public_apps_list(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 skip 무시)"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (콤마 구분, 예: app_id,name,icon_url)"),
     db: Session = Depends(get_db)
 ):
     """
     공개 앱 목록 조회 (인증 불필요)
     활성화된 버전이 있는 앱만 반환
+    
+    전체 목록은 캐시되며 앱/버전 변경 시 무효화됨
     """
-    # EXISTS를 사용하여 활성화된 버전이 있는 공개 앱만 조회 (중복 방지)
-    query = db.query(App).filter(
-        App.is_public == True,
-        exists().where(
-            and_(
-                AppVersion.app_id == App.id,
-                AppVersion.is_active == True,
-                AppVersion.channel == ReleaseChannel.STABLE
-            )
-        )
-    )
+    selected = parse_fields(fields)
+    apps = public_pages.get_public_apps(db)
     
-    total = query.count()
-    apps = query.offset(skip).limit(limit).all()
-    return AppListResponse(apps=apps, total=total)
+    start = skip
+    if cursor:
+        start = bisect_right([app.id for app in apps], decode_cursor(cursor))
+    page = apps[start:start + limit]
+    next_cursor = encode_cursor(page[-1].id) if page and start + limit < len(apps) else None
+    if selected:
+        return sparse_list_response(page, selected, len(apps), next_cursor)
+    return AppListResponse(apps=page, total=len(apps), next_cursor=next_cursor)
 
 
 @public_router.get("/public/{app_id}", response_model=AppPublicResponse)
@@ -404,6 +384,10 @@ async def get_public_app(
     - 앱 정보, 상세 HTML, 커스텀 CSS 반환
     - 최신 버전 다운로드 URL 포함
     """
+    cached = public_pages.page_cache.get(app_id)
+    if cached is not None:
+        return json_bytes_response(cached)
+    
     app = db.query(App).filter(App.app_id == app_id).first()
     if not app:
         raise HTTPException(
@@ -417,159 +401,25 @@ async def get_public_app(
             detail="비공개 앱입니다"
         )
     
-    # 최신 활성 버전 조회 (버전 번호 기준)
-    active_versions = db.query(AppVersion).filter(
-        AppVersion.app_id == app.id,
-        AppVersion.channel == ReleaseChannel.STABLE,
-        AppVersion.is_active == True
-    ).all()
-    
-    # 버전 번호 기준으로 최신 버전 선택
-    def parse_version(version: str) -> tuple:
-        try:
-            return tuple(int(p) for p in version.split("."))
-        except (ValueError, AttributeError):
-            return (0, 0, 0)
-    
-    latest_version = max(active_versions, key=lambda v: parse_version(v.version)) if active_versions else None
-    
-    # 설명서 다운로드 URL 생성
-    manual_download_url = None
-    if app.manual_file_path:
-        manual_download_url = f"/api/apps/public/{app.app_id}/manual"
-    
-    # 플레이스홀더 치환
-    detail_html = app.detail_html or ""
-    if detail_html:
-        # 다운로드 버튼 HTML 생성
-        download_button = ""
-        if latest_version:
-            download_button = f'<a href="/api/update/download/{latest_version.id}" class="inline-flex items-center justify-center px-8 py-3 bg-blue-600 hover:bg-blue-700 text-white rounded-lg font-semibold transition">다운로드</a>'
-        
-        # 설명서 다운로드 버튼 HTML 생성
-        manual_download_button = ""
-        if manual_download_url:
-            manual_download_button = f'<a href="{manual_download_url}" class="inline-flex items-center justify-center px-8 py-3 bg-gray-600 hover:bg-gray-700 text-white rounded-lg font-semibold transition">[사용설명서]</a>'
-        
-        # 플레이스홀더 치환 (모든 플레이스홀더를 한 번에 처리)
-        icon_url = app.icon_url or ""
-        replacements = {
-            "{{APP_NAME}}": app.name or "",
-            "{{APP_DESCRIPTION}}": app.description or "",
-            "{{APP_ID}}": app.app_id or "",
-            "{{ICON_URL}}": icon_url or "",
-            "{{DOWNLOAD_URL}}": f"/api/update/download/{latest_version.id}" if latest_version else "",
-            "{{DOWNLOAD_BUTTON}}": download_button,
-            "{{MANUAL_DOWNLOAD_URL}}": manual_download_url or "",
-            "{{MANUAL_DOWNLOAD_BUTTON}}": manual_download_button,
-            "{{LATEST_VERSION}}": latest_version.version if latest_version else ""
-        }
-        
-        for placeholder, value in replacements.items():
-            detail_html = detail_html.replace(placeholder, value)
-        
-        # 아이콘 URL이 없거나 유효하지 않으면 아이콘 영역 제거 (플레이스홀더 치환 후)
-        if not icon_url or icon_url.strip() == "":
-            import re
-            # 아이콘 영역을 포함한 div 블록 제거 (id="app-icon-container"가 있는 div)
-            detail_html = re.sub(
-                r'<div[^>]*id="app-icon-container"[^>]*>.*?</div>',
-                '',
-                detail_html,
-                flags=re.DOTALL | re.IGNORECASE
-            )
-            # 또는 mb-8 클래스를 가진 div 중 img 태그가 있고 src가 비어있는 경우
-            detail_html = re.sub(
-                r'<div[^>]*class="[^"]*mb-8[^"]*"[^>]*>\s*<!--\s*앱 아이콘\s*-->.*?<img[^>]*src=""[^>]*>.*?</div>',
-                '',
-                detail_html,
-                flags=re.DOTALL | re.IGNORECASE
-            )
-            # 일반적인 패턴: mb-8 클래스를 가진 div 안에 빈 src를 가진 img가 있는 경우
-            detail_html = re.sub(
-                r'<div[^>]*class="[^"]*mb-8[^"]*"[^>]*>.*?<img[^>]*src=""[^>]*>.*?</div>',
-                '',
-                detail_html,
-                flags=re.DOTALL | re.IGNORECASE
-            )
-    
-    return AppPublicResponse(
-        app_id=app.app_id,
-        name=app.name,
-        description=app.description,
-        group=app.group,
-        detail_html=detail_html,
-        custom_css=app.custom_css,
-        icon_url=app.icon_url,
-        latest_version=latest_version.version if latest_version else None,
-        download_url=f"/api/update/download/{latest_version.id}" if latest_version else None,
-        file_size=latest_version.file_size if latest_version else None,
-        manual_download_url=manual_download_url,
-        manual_file_name=app.manual_file_name
-    )
+    return json_bytes_response(public_pages.render_public_page(db, app))
 
 
 @public_router.get("/public/{app_id}/icon")
 async def get_public_icon(
     app_id: str,
+    size: Optional[int] = Query(None, ge=1, le=1024, description="요청 크기(px), 가장 가까운 리사이즈 변형 반환"),
+    v: Optional[str] = Query(None, description="아이콘 해시 버전"),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
     """공개 앱 아이콘 이미지 서빙 (인증 불필요)"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="앱을 찾을 수 없습니다"
-        )
-    
-    if not app.is_public:
+    info = await icons.get_icon_info(db, app_id)
+    if not info.is_public:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="비공개 앱입니다"
         )
-    
-    if not app.icon_url or not app.icon_url.startswith('/api/apps/'):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="등록된 아이콘이 없습니다"
-        )
-    
-    # 아이콘 파일 찾기
-    icon_dir = os.path.join(settings.upload_dir, app_id, "icon")
-    if not os.path.exists(icon_dir):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="아이콘 파일을 찾을 수 없습니다"
-        )
-    
-    # 디렉토리에서 첫 번째 이미지 파일 찾기
-    icon_file = None
-    for file_name in os.listdir(icon_dir):
-        file_path = os.path.join(icon_dir, file_name)
-        if os.path.isfile(file_path) and file_name.startswith('icon.'):
-            icon_file = file_path
-            break
-    
-    if not icon_file or not os.path.exists(icon_file):
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="아이콘 파일을 찾을 수 없습니다"
-        )
-    
-    # 파일 확장자로 MIME 타입 결정
-    ext = os.path.splitext(icon_file)[1].lower()
-    mime_types = {
-        '.png': 'image/png',
-        '.jpg': 'image/jpeg',
-        '.jpeg': 'image/jpeg',
-        '.gif': 'image/gif',
-        '.webp': 'image/webp',
-        '.svg': 'image/svg+xml',
-        '.ico': 'image/x-icon'
-    }
-    media_type = mime_types.get(ext, 'image/png')
-    
-    return FileResponse(icon_file, media_type=media_type)
+    return icons.icon_response(info, size, v, if_none_match)
 
 
 @public_router.get("/public/{app_id}/manual")
@@ -640,3 +490,5 @@ async def delete_app(
     # 데이터베이스에서 앱 삭제 (cascade로 버전도 자동 삭제됨)
     db.delete(app)
     db.commit()
+    
+    events.publish(events.APP_CHANGED, app_id)
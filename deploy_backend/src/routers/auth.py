@@ -1,5 +1,5 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
@@ -9,9 +9,10 @@ from ..schemas import Token, UserCreate, UserResponse
 from ..auth import (
     authenticate_user,
     create_access_token,
-    get_password_hash,
+    get_password_hash_async,
     get_current_active_user,
     get_current_admin_user,
+    password_hash_executor,
 )
 from ..config import get_settings
 
@@ -21,11 +22,14 @@ settings = get_settings()
 
 @router.post("/login", response_model=Token)
 async def login(
+    request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """로그인하여 액세스 토큰 발급"""
-    user = authenticate_user(db, form_data.username, form_data.password)
+    # 프록시(nginx) 뒤에서는 uvicorn --proxy-headers가 X-Forwarded-For로 바꿔 둔 실제 클라이언트 IP
+    client_ip = request.client.host if request.client else None
+    user = await authenticate_user(db, form_data.username, form_data.password, client_ip)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -65,7 +69,7 @@ async def create_user(
     # 사용자 생성
     new_user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash_async(user_data.password),
         is_active=True,
         is_admin=False
     )
@@ -74,3 +78,9 @@ async def create_user(
     db.refresh(new_user)
     
     return new_user
+
+
+@router.get("/hash-stats")
+async def get_hash_stats(current_user: User = Depends(get_current_admin_user)):
+    """비밀번호 해시 스레드 풀 상태 조회 (관리자 전용)"""
+    return password_hash_executor.stats()
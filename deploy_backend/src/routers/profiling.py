@@ -0,0 +1,62 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from ..models import User
+from ..auth import get_current_admin_user
+from ..profiling import profiler
+
+router = APIRouter(prefix="/api/admin/profiling", tags=["프로파일링"])
+
+
+@router.post("/start")
+async def start_profiling(
+    duration_seconds: float = Query(10, gt=0, le=300, description="샘플링 시간(초)"),
+    interval_ms: float = Query(5, ge=1, le=100, description="샘플링 간격(ms)"),
+    sample_rate: Optional[float] = Query(
+        None, gt=0, le=1, description="요청 샘플링 비율 (미지정 시 전체 스레드 샘플링)"
+    ),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """샘플링 프로파일러 시작 (관리자 전용, 이전 결과는 초기화됨)"""
+    session = profiler.start_session(duration_seconds, interval_ms / 1000, sample_rate)
+    return session.status()
+
+
+@router.post("/stop")
+async def stop_profiling(current_user: User = Depends(get_current_admin_user)):
+    """샘플링 프로파일러 중지 (관리자 전용)"""
+    session = profiler.stop_session()
+    if session is None:
+        raise HTTPException(status_code=404, detail="실행된 프로파일링 세션이 없습니다")
+    return session.status()
+
+
+@router.get("/status")
+async def get_profiling_status(current_user: User = Depends(get_current_admin_user)):
+    """프로파일링 세션 상태 조회 (관리자 전용)"""
+    if profiler.session is None:
+        return {"active": False}
+    return profiler.session.status()
+
+
+@router.get("/result", response_class=PlainTextResponse)
+async def get_profiling_result(current_user: User = Depends(get_current_admin_user)):
+    """
+    프로파일링 결과 (관리자 전용)
+
+    folded stack 형식 ("frame;frame;frame count") - flamegraph.pl, speedscope 등에서 사용
+    """
+    if profiler.session is None:
+        raise HTTPException(status_code=404, detail="실행된 프로파일링 세션이 없습니다")
+    return PlainTextResponse(profiler.session.folded())
+
+
+@router.get("/slow-requests")
+async def get_slow_requests(current_user: User = Depends(get_current_admin_user)):
+    """임계 시간을 넘긴 최근 요청 목록 (스택 샘플 + SQL 실행 내역, 관리자 전용)"""
+    return {
+        "threshold_ms": profiler.slow_threshold * 1000,
+        "requests": list(reversed(profiler.slow_requests)),
+    }
@@ -6,8 +6,11 @@ from ..database import get_db
 from ..models import App, AppVersion, User
 from ..schemas import DashboardStats, AppStats
 from ..auth import get_current_active_user
+from ..admission import Priority, admit
+from ..semver import version_key
 
-router = APIRouter(prefix="/api/stats", tags=["통계"])
+# 통계 집계는 저우선순위 (DB 풀 포화 시 대기열에서 대기하거나 503)
+router = APIRouter(prefix="/api/stats", tags=["통계"], dependencies=[Depends(admit(Priority.LOW))])
 
 
 @router.get("/dashboard", response_model=DashboardStats)
@@ -17,40 +20,41 @@ async def get_dashboard_stats(
 ):
     """대시보드 통계 조회"""
     
-    # 전체 앱 수
-    total_apps = db.query(func.count(App.id)).scalar()
+    # 앱별 버전 수/다운로드 수 (앱마다 버전을 조회하지 않고 한 번에 집계)
+    totals = {
+        app_db_id: (version_count, downloads)
+        for app_db_id, version_count, downloads in db.query(
+            AppVersion.app_id,
+            func.count(AppVersion.id),
+            func.coalesce(func.sum(AppVersion.download_count), 0)
+        ).group_by(AppVersion.app_id).all()
+    }
     
-    # 전체 버전 수
-    total_versions = db.query(func.count(AppVersion.id)).scalar()
-    
-    # 전체 다운로드 수
-    total_downloads = db.query(func.sum(AppVersion.download_count)).scalar() or 0
+    # 앱별 최신 버전 (버전 번호 기준, 버전 문자열만 조회)
+    latest_versions = {}
+    for app_db_id, version in db.query(AppVersion.app_id, AppVersion.version).all():
+        latest = latest_versions.get(app_db_id)
+        if latest is None or version_key(version) > version_key(latest):
+            latest_versions[app_db_id] = version
     
     # 앱별 통계
-    apps = db.query(App).all()
+    apps = db.query(App.id, App.app_id, App.name).all()
     app_stats = []
     
     for app in apps:
-        versions = db.query(AppVersion).filter(AppVersion.app_id == app.id).all()
-        
-        # 최신 버전 찾기
-        latest = None
-        if versions:
-            sorted_versions = sorted(
-                versions,
-                key=lambda v: tuple(int(p) for p in v.version.split(".") if p.isdigit()),
-                reverse=True
-            )
-            latest = sorted_versions[0].version if sorted_versions else None
-        
+        version_count, downloads = totals.get(app.id, (0, 0))
         app_stats.append(AppStats(
             app_id=app.app_id,
             app_name=app.name,
-            total_versions=len(versions),
-            total_downloads=sum(v.download_count for v in versions),
-            latest_version=latest
+            total_versions=version_count,
+            total_downloads=downloads,
+            latest_version=latest_versions.get(app.id)
         ))
     
+    total_apps = len(apps)
+    total_versions = sum(version_count for version_count, _ in totals.values())
+    total_downloads = sum(downloads for _, downloads in totals.values())
+    
     return DashboardStats(
         total_apps=total_apps,
         total_versions=total_versions,
@@ -1,6 +1,7 @@
 import os
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import FileResponse, RedirectResponse
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
@@ -8,26 +9,17 @@ from ..database import get_db
 from ..models import App, AppVersion, ReleaseChannel
 from ..schemas import UpdateCheckRequest, UpdateCheckResponse
 from ..config import get_settings
+from ..rate_limit import update_check_rate_limit, download_rate_limit
+from ..admission import Priority, admit
+from ..release_state import get_release_state
+from ..semver import version_key
+from ..ranges import file_response, range_start
 
 router = APIRouter(prefix="/api/update", tags=["업데이트"])
 settings = get_settings()
 
 
-def parse_version(version: str) -> tuple:
-    """버전 문자열을 비교 가능한 튜플로 변환"""
-    try:
-        parts = version.split(".")
-        return tuple(int(p) for p in parts)
-    except (ValueError, AttributeError):
-        return (0, 0, 0)
-
-
-def is_newer_version(current: str, latest: str) -> bool:
-    """최신 버전이 현재 버전보다 새로운지 확인"""
-    return parse_version(latest) > parse_version(current)
-
-
-@router.get("/check", response_model=UpdateCheckResponse)
+@router.get("/check", response_model=UpdateCheckResponse, dependencies=[Depends(update_check_rate_limit), Depends(admit(Priority.HIGH))])
 async def check_update(
     app_id: str = Query(..., description="앱 고유 ID"),
     current_version: str = Query(..., description="현재 설치된 버전"),
@@ -37,48 +29,42 @@ async def check_update(
     """
     업데이트 확인 API (클라이언트 호출용)
     
-    인증 없이 호출 가능
+    인증 없이 호출 가능 (클라이언트/앱별 요청 수 제한, 초과 시 429 + Retry-After)
     """
-    # 앱 확인
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
+    # 앱 확인 (릴리스 상태 캐시, 변경 시 모든 워커에서 즉시 무효화)
+    state = get_release_state(db, app_id)
+    if state is None:
         raise HTTPException(
             status_code=404,
             detail="등록되지 않은 앱입니다"
         )
     
-    # 최신 활성 버전 조회 (버전 번호 기준)
-    latest_version = get_latest_active_version(db, app.id, channel)
+    poll_interval = settings.update_poll_interval_seconds or None
+    
+    # 최신 활성 버전 (버전 번호 기준)
+    latest_version = state.latest(channel)
     
     if not latest_version:
         return UpdateCheckResponse(
             update_available=False,
-            current_version=current_version
+            current_version=current_version,
+            poll_interval_seconds=poll_interval
         )
     
     # 버전 비교
-    update_available = is_newer_version(current_version, latest_version.version)
+    current_key = version_key(current_version)
+    update_available = latest_version.sort_key > current_key
     
     if not update_available:
         return UpdateCheckResponse(
             update_available=False,
             current_version=current_version,
-            latest_version=latest_version.version
+            latest_version=latest_version.version,
+            poll_interval_seconds=poll_interval
         )
     
     # 필수 업데이트 확인 (현재 버전과 최신 버전 사이에 필수 업데이트가 있는지)
-    mandatory_updates = db.query(AppVersion).filter(
-        AppVersion.app_id == app.id,
-        AppVersion.channel == channel,
-        AppVersion.is_active == True,
-        AppVersion.is_mandatory == True
-    ).all()
-    
-    is_mandatory = any(
-        is_newer_version(current_version, v.version) and 
-        (parse_version(v.version) <= parse_version(latest_version.version))
-        for v in mandatory_updates
-    )
+    is_mandatory = state.mandatory_between(channel, current_key, latest_version.sort_key)
     
     return UpdateCheckResponse(
         update_available=True,
@@ -88,7 +74,8 @@ async def check_update(
         release_notes=latest_version.release_notes,
         download_url=f"/api/update/download/{latest_version.id}",
         file_size=latest_version.file_size,
-        file_hash=latest_version.file_hash
+        file_hash=latest_version.file_hash,
+        poll_interval_seconds=poll_interval
     )
 
 
@@ -104,19 +91,20 @@ def get_latest_active_version(db: Session, app_db_id: int, channel: ReleaseChann
         return None
     
     # 버전 번호 기준으로 정렬하여 최신 버전 반환
-    return max(versions, key=lambda v: parse_version(v.version))
+    return max(versions, key=lambda v: version_key(v.version))
 
 
-@router.get("/download/latest/{app_id}")
+@router.get("/download/latest/{app_id}", dependencies=[Depends(download_rate_limit), Depends(admit(Priority.HIGH))])
 async def download_latest(
     app_id: str,
     channel: ReleaseChannel = Query(ReleaseChannel.STABLE),
+    range_header: Optional[str] = Header(None, alias="Range"),
     db: Session = Depends(get_db)
 ):
     """
     최신 버전 다운로드 (공개 페이지용)
     
-    앱 ID로 최신 활성 버전을 바로 다운로드 (버전 번호 기준)
+    앱 ID로 최신 활성 버전을 바로 다운로드 (버전 번호 기준, Range 요청 시 이어받기)
     """
     app = db.query(App).filter(App.app_id == app_id).first()
     if not app:
@@ -130,26 +118,24 @@ async def download_latest(
     if not os.path.exists(latest_version.file_path):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
     
-    # 다운로드 카운트 증가
-    latest_version.download_count += 1
-    db.commit()
+    # 다운로드 카운트 증가 (이어받기 요청은 이미 집계됨)
+    if range_start(range_header) == 0:
+        latest_version.download_count += 1
+        db.commit()
     
-    return FileResponse(
-        path=latest_version.file_path,
-        filename=latest_version.file_name,
-        media_type="application/octet-stream"
-    )
+    return file_response(latest_version.file_path, latest_version.file_name, range_header)
 
 
-@router.get("/download/{version_id}")
+@router.get("/download/{version_id}", dependencies=[Depends(download_rate_limit), Depends(admit(Priority.HIGH))])
 async def download_update(
     version_id: int,
+    range_header: Optional[str] = Header(None, alias="Range"),
     db: Session = Depends(get_db)
 ):
     """
     업데이트 파일 다운로드 (클라이언트 호출용)
     
-    인증 없이 호출 가능
+    인증 없이 호출 가능, Range 요청 시 해당 구간만 응답 (SDK 백그라운드 다운로드 이어받기)
     """
     version = db.query(AppVersion).filter(AppVersion.id == version_id).first()
     
@@ -162,18 +148,15 @@ async def download_update(
     if not os.path.exists(version.file_path):
         raise HTTPException(status_code=404, detail="파일을 찾을 수 없습니다")
     
-    # 다운로드 카운트 증가
-    version.download_count += 1
-    db.commit()
+    # 다운로드 카운트 증가 (이어받기 요청은 이미 집계됨)
+    if range_start(range_header) == 0:
+        version.download_count += 1
+        db.commit()
     
-    return FileResponse(
-        path=version.file_path,
-        filename=version.file_name,
-        media_type="application/octet-stream"
-    )
+    return file_response(version.file_path, version.file_name, range_header)
 
 
-@router.get("/history/{app_id}")
+@router.get("/history/{app_id}", dependencies=[Depends(admit(Priority.LOW))])
 async def get_version_history(
     app_id: str,
     channel: ReleaseChannel = Query(ReleaseChannel.STABLE),
@@ -196,7 +179,7 @@ async def get_version_history(
     ).all()
     
     # 버전 번호 기준 내림차순 정렬
-    sorted_versions = sorted(versions, key=lambda v: parse_version(v.version), reverse=True)[:limit]
+    sorted_versions = sorted(versions, key=lambda v: version_key(v.version), reverse=True)[:limit]
     
     return {
         "app_id": app_id,
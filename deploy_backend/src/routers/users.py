@@ -5,7 +5,7 @@ from typing import List
 from ..database import get_db
 from ..models import User
 from ..schemas import UserCreate, UserResponse, UserUpdate
-from ..auth import get_password_hash, get_current_admin_user
+from ..auth import get_password_hash_async, get_current_admin_user, invalidate_user_cache
 
 router = APIRouter(prefix="/api/users", tags=["사용자"])
 
@@ -23,7 +23,7 @@ async def create_user(
     if db_user:
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
     
-    hashed_password = get_password_hash(user.password)
+    hashed_password = await get_password_hash_async(user.password)
     db_user = User(email=user.email, hashed_password=hashed_password, is_admin=False)
     db.add(db_user)
     db.commit()
@@ -33,7 +33,7 @@ async def create_user(
 
 @router.get("/", response_model=List[UserResponse])
 async def read_users(
-    skip: int = 0,
+    skip: int = Query(0, ge=0),
     limit: int = 100,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user)
@@ -74,6 +74,8 @@ async def update_user(
     if db_user is None:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
+    old_email = db_user.email
+    
     if user_update.email and user_update.email != db_user.email:
         existing_user = db.query(User).filter(User.email == user_update.email).first()
         if existing_user:
@@ -81,7 +83,7 @@ async def update_user(
         db_user.email = user_update.email
     
     if user_update.password:
-        db_user.hashed_password = get_password_hash(user_update.password)
+        db_user.hashed_password = await get_password_hash_async(user_update.password)
     
     if user_update.is_active is not None:
         db_user.is_active = user_update.is_active
@@ -91,6 +93,11 @@ async def update_user(
     
     db.commit()
     db.refresh(db_user)
+    
+    # 권한/활성 상태 변경이 즉시 반영되도록 캐시 무효화
+    invalidate_user_cache(old_email)
+    if db_user.email != old_email:
+        invalidate_user_cache(db_user.email)
     return db_user
 
 
@@ -107,7 +114,9 @@ async def delete_user(
     if db_user is None:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
+    email = db_user.email
     db.delete(db_user)
     db.commit()
+    invalidate_user_cache(email)
     return {"ok": True}
 
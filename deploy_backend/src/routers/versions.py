@@ -2,17 +2,20 @@ import os
 import hashlib
 import shutil
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
-from typing import Optional
+from typing import Optional, Union
 
 from ..database import get_db
-from ..models import App, AppVersion, User, ReleaseChannel
+from ..models import App, AppVersion, User, ReleaseChannel, ApiKey, ApiKeyScope
 from ..schemas import VersionResponse, VersionListResponse, VersionUpdate
-from ..auth import get_current_active_user
+from ..auth import get_current_active_user, require_app_scope
 from ..config import get_settings
+from ..pagination import TotalMode, count_total, paginate
+from ..semver import try_parse, version_key
+from .. import events
 
 router = APIRouter(prefix="/api/apps/{app_id}/versions", tags=["버전 관리"])
 settings = get_settings()
@@ -27,52 +30,53 @@ def calculate_file_hash(file_path: str) -> str:
     return sha256_hash.hexdigest()
 
 
-def parse_version(version: str) -> tuple:
-    """버전 문자열을 비교 가능한 튜플로 변환"""
-    try:
-        parts = version.split(".")
-        return tuple(int(p) for p in parts)
-    except (ValueError, AttributeError):
-        return (0, 0, 0)
+def _app_exists(db: Session, app_id: str) -> bool:
+    return db.query(App.id).filter(App.app_id == app_id).first() is not None
 
 
-def compare_versions(v1: str, v2: str) -> int:
-    """버전 비교: v1 > v2 이면 1, v1 < v2 이면 -1, 같으면 0"""
-    t1 = parse_version(v1)
-    t2 = parse_version(v2)
-    if t1 > t2:
-        return 1
-    elif t1 < t2:
-        return -1
-    return 0
+def _get_app_version(db: Session, app_id: str, version_id: int) -> AppVersion:
+    """앱 ID와 버전 ID로 버전 조회 (앱 조회 없이 JOIN 한 번, 없을 때만 어느 쪽이 없는지 확인)"""
+    version = db.query(AppVersion).join(App, AppVersion.app_id == App.id).filter(
+        App.app_id == app_id,
+        AppVersion.id == version_id
+    ).first()
+    if version is None:
+        if not _app_exists(db, app_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="앱을 찾을 수 없습니다")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="버전을 찾을 수 없습니다")
+    return version
 
 
 @router.get("", response_model=VersionListResponse)
 async def get_versions(
     app_id: str,
     channel: Optional[ReleaseChannel] = None,
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (지정 시 skip 무시)"),
+    total: TotalMode = Query(TotalMode.EXACT, description="전체 개수 계산 방식"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    """앱의 버전 목록 조회"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="앱을 찾을 수 없습니다"
-        )
-    
-    query = db.query(AppVersion).filter(AppVersion.app_id == app.id)
+    """앱의 버전 목록 조회 (최신 등록 순, 커서 페이지네이션 지원)"""
+    # 앱 조회를 따로 하지 않고 서브쿼리로 (앱 존재 여부는 결과가 비었을 때만 확인)
+    app_db_id = db.query(App.id).filter(App.app_id == app_id).scalar_subquery()
+    query = db.query(AppVersion).filter(AppVersion.app_id == app_db_id)
     
     if channel:
         query = query.filter(AppVersion.channel == channel)
     
-    total = query.count()
-    versions = query.order_by(desc(AppVersion.created_at)).offset(skip).limit(limit).all()
+    # 필터가 있는 쿼리이므로 estimated도 정확한 개수로 계산됨
+    total_count = count_total(db, query, total)
+    # id는 등록 순으로 증가하므로 id 내림차순 = 최신 등록 순 (동일 시각 등록도 안정적으로 정렬)
+    versions, next_cursor = paginate(query, AppVersion.id, skip, limit, cursor, descending=True)
+    if not versions and not _app_exists(db, app_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="앱을 찾을 수 없습니다"
+        )
     
-    return VersionListResponse(versions=versions, total=total)
+    return VersionListResponse(versions=versions, total=total_count, next_cursor=next_cursor)
 
 
 @router.post("", response_model=VersionResponse, status_code=status.HTTP_201_CREATED)
@@ -84,9 +88,13 @@ async def upload_version(
     is_mandatory: bool = Form(False),
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    principal: Union[User, ApiKey] = Depends(require_app_scope(ApiKeyScope.PUBLISH.value))
 ):
-    """새 버전 업로드"""
+    """
+    새 버전 업로드
+    
+    관리자 로그인 토큰 또는 publish 권한의 API 키로 호출 가능 (CI 배포용)
+    """
     # 앱 확인
     app = db.query(App).filter(App.app_id == app_id).first()
     if not app:
@@ -95,13 +103,20 @@ async def upload_version(
             detail="앱을 찾을 수 없습니다"
         )
     
-    # 버전 중복 체크
-    existing = db.query(AppVersion).filter(
+    # 버전 형식 확인 (비교할 수 없는 버전은 최신 버전으로 선택되지 않음)
+    parsed = try_parse(version)
+    if parsed is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="올바른 버전 형식이 아닙니다 (예: 1.2.0, 1.2.0-beta.1)"
+        )
+    
+    # 버전 중복 체크 (문자열이 달라도 우선순위가 같은 버전은 중복: 1.2 = 1.2.0 = v1.2.0+build.5)
+    existing = db.query(AppVersion.version).filter(
         AppVersion.app_id == app.id,
-        AppVersion.version == version,
         AppVersion.channel == channel
-    ).first()
-    if existing:
+    ).all()
+    if any(version_key(existing_version) == parsed.key for (existing_version,) in existing):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 등록된 버전입니다"
@@ -144,6 +159,7 @@ async def upload_version(
     db.add(new_version)
     db.commit()
     db.refresh(new_version)
+    events.publish(events.VERSION_CHANGED, app_id)
     
     return new_version
 
@@ -156,25 +172,7 @@ async def get_version(
     current_user: User = Depends(get_current_active_user)
 ):
     """버전 상세 조회"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="앱을 찾을 수 없습니다"
-        )
-    
-    version = db.query(AppVersion).filter(
-        AppVersion.id == version_id,
-        AppVersion.app_id == app.id
-    ).first()
-    
-    if not version:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="버전을 찾을 수 없습니다"
-        )
-    
-    return version
+    return _get_app_version(db, app_id, version_id)
 
 
 @router.patch("/{version_id}", response_model=VersionResponse)
@@ -183,20 +181,10 @@ async def update_version(
     version_id: int,
     version_update: VersionUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    principal: Union[User, ApiKey] = Depends(require_app_scope(ApiKeyScope.MANAGE.value))
 ):
     """버전 정보 수정 (릴리즈 노트 등)"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
-    
-    version = db.query(AppVersion).filter(
-        AppVersion.id == version_id,
-        AppVersion.app_id == app.id
-    ).first()
-    
-    if not version:
-        raise HTTPException(status_code=404, detail="버전을 찾을 수 없습니다")
+    version = _get_app_version(db, app_id, version_id)
     
     update_data = version_update.dict(exclude_unset=True)
     for key, value in update_data.items():
@@ -204,6 +192,7 @@ async def update_version(
     
     db.commit()
     db.refresh(version)
+    events.publish(events.VERSION_CHANGED, app_id)
     
     return version
 
@@ -213,23 +202,14 @@ async def activate_version(
     app_id: str,
     version_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    principal: Union[User, ApiKey] = Depends(require_app_scope(ApiKeyScope.MANAGE.value))
 ):
     """버전 활성화"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
-    
-    version = db.query(AppVersion).filter(
-        AppVersion.id == version_id,
-        AppVersion.app_id == app.id
-    ).first()
-    
-    if not version:
-        raise HTTPException(status_code=404, detail="버전을 찾을 수 없습니다")
+    version = _get_app_version(db, app_id, version_id)
     
     version.is_active = True
     db.commit()
+    events.publish(events.VERSION_CHANGED, app_id)
     
     return {"message": "버전이 활성화되었습니다"}
 
@@ -239,23 +219,14 @@ async def deactivate_version(
     app_id: str,
     version_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    principal: Union[User, ApiKey] = Depends(require_app_scope(ApiKeyScope.MANAGE.value))
 ):
     """버전 비활성화 (롤백용)"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
-    
-    version = db.query(AppVersion).filter(
-        AppVersion.id == version_id,
-        AppVersion.app_id == app.id
-    ).first()
-    
-    if not version:
-        raise HTTPException(status_code=404, detail="버전을 찾을 수 없습니다")
+    version = _get_app_version(db, app_id, version_id)
     
     version.is_active = False
     db.commit()
+    events.publish(events.VERSION_CHANGED, app_id)
     
     return {"message": "버전이 비활성화되었습니다"}
 
@@ -268,17 +239,7 @@ async def delete_version(
     current_user: User = Depends(get_current_active_user)
 ):
     """버전 삭제"""
-    app = db.query(App).filter(App.app_id == app_id).first()
-    if not app:
-        raise HTTPException(status_code=404, detail="앱을 찾을 수 없습니다")
-    
-    version = db.query(AppVersion).filter(
-        AppVersion.id == version_id,
-        AppVersion.app_id == app.id
-    ).first()
-    
-    if not version:
-        raise HTTPException(status_code=404, detail="버전을 찾을 수 없습니다")
+    version = _get_app_version(db, app_id, version_id)
     
     # 파일 삭제
     if os.path.exists(version.file_path):
@@ -286,3 +247,4 @@ async def delete_version(
     
     db.delete(version)
     db.commit()
+    events.publish(events.VERSION_CHANGED, app_id)
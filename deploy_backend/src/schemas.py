@@ -1,7 +1,7 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from datetime import datetime
 from typing import Optional, List
-from .models import ReleaseChannel
+from .models import ReleaseChannel, ApiKeyScope
 
 
 # ============ Auth Schemas ============
@@ -65,10 +65,9 @@ class AppUpdate(AppBase):
     group: Optional[str] = None
 
 
-class AppResponse(AppBase):
+class AppSummaryResponse(AppBase):
+    """목록용 앱 정보 (상세 HTML/CSS 제외)"""
     id: int
-    detail_html: Optional[str] = None
-    custom_css: Optional[str] = None
     icon_url: Optional[str] = None
     is_public: bool = True
     manual_file_path: Optional[str] = None
@@ -81,6 +80,11 @@ class AppResponse(AppBase):
         from_attributes = True
 
 
+class AppResponse(AppSummaryResponse):
+    detail_html: Optional[str] = None
+    custom_css: Optional[str] = None
+
+
 class AppPublicResponse(BaseModel):
     """공개 페이지용 앱 정보"""
     app_id: str
@@ -101,8 +105,9 @@ class AppPublicResponse(BaseModel):
 
 
 class AppListResponse(BaseModel):
-    apps: List[AppResponse]
-    total: int
+    apps: List[AppSummaryResponse]
+    total: Optional[int] = None  # total=none 요청 시 생략
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
 
 
 # ============ Version Schemas ============
@@ -142,7 +147,42 @@ class VersionResponse(VersionBase):
 
 class VersionListResponse(BaseModel):
     versions: List[VersionResponse]
-    total: int
+    total: Optional[int] = None  # total=none 요청 시 생략
+    next_cursor: Optional[str] = None  # 다음 페이지가 없으면 None
+
+
+# ============ API Key Schemas ============
+
+class ApiKeyCreate(BaseModel):
+    name: str
+    scopes: List[ApiKeyScope] = [ApiKeyScope.PUBLISH]
+    expires_at: Optional[datetime] = None
+
+
+class ApiKeyResponse(BaseModel):
+    id: int
+    name: str
+    key_prefix: str
+    scopes: List[ApiKeyScope]
+    is_active: bool
+    expires_at: Optional[datetime] = None
+    created_at: datetime
+    
+    @field_validator("scopes", mode="before")
+    @classmethod
+    def split_scopes(cls, value):
+        # DB에는 콤마 구분 문자열로 저장됨
+        if isinstance(value, str):
+            return [scope for scope in value.split(",") if scope]
+        return value
+    
+    class Config:
+        from_attributes = True
+
+
+class ApiKeyCreatedResponse(ApiKeyResponse):
+    """생성 직후에만 평문 키를 포함하여 반환"""
+    api_key: str
 
 
 # ============ Update Check Schemas ============
@@ -162,6 +202,7 @@ class UpdateCheckResponse(BaseModel):
     download_url: Optional[str] = None
     file_size: Optional[int] = None
     file_hash: Optional[str] = None
+    poll_interval_seconds: Optional[int] = None  # 권장 자동 확인 주기 (초)
 
 
 # ============ Statistics Schemas ============
@@ -0,0 +1,157 @@
+"""
+버전 번호 파싱/비교 (SemVer 2.0.0 우선순위)
+
+- 1.2.0-beta.1 < 1.2.0-beta.2 < 1.2.0-rc.1 < 1.2.0 (프리릴리스는 정식 버전보다 낮음)
+- 프리릴리스 식별자: 숫자는 숫자로, 문자는 사전순으로 비교, 숫자 식별자가 문자 식별자보다 낮음
+- 빌드 메타데이터(+build.5)는 비교에 사용하지 않음
+- 기존 데이터 호환: 앞의 v 허용, 1.2 → 1.2.0, Windows 4자리 버전(1.2.3.4) 허용
+
+version_key()는 정렬/bisect에 바로 쓸 수 있는 튜플 키를 반환하며, 해석할 수 없는 문자열은
+어떤 버전보다도 낮은 키가 된다. 파싱 결과는 크기 제한 LRU 캐시에 보관하여 같은 문자열은
+같은 객체를 재사용한다.
+
+    sorted(versions, key=lambda v: version_key(v.version), reverse=True)
+    bisect.bisect_right(sorted_keys, version_key("1.2.0"))
+"""
+import re
+import sys
+from functools import lru_cache, total_ordering
+from typing import Optional, Tuple, Union
+
+from .config import get_settings
+
+settings = get_settings()
+
+_VERSION_RE = re.compile(
+    r"^[vV]?"
+    r"(?P<core>\d+(?:\.\d+)*)"
+    r"(?:-(?P<pre>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?"
+    r"(?:\+(?P<build>[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*))?$",
+    re.ASCII  # \d가 전각/아라비아 숫자 등 유니코드 숫자와 일치하지 않도록
+)
+
+# 프리릴리스 식별자 키: 숫자 (0, n), 문자 (1, s) → 숫자가 항상 낮음
+PrereleaseKey = Tuple[Tuple[int, Union[int, str]], ...]
+# (핵심 번호, 정식 여부 0/1, 프리릴리스 식별자)
+VersionKey = Tuple[Tuple[int, ...], int, PrereleaseKey]
+
+# 해석할 수 없는 버전의 키 (모든 유효한 버전보다 낮음)
+INVALID_KEY: VersionKey = ((), 0, ())
+
+
+@total_ordering
+class Version:
+    """파싱된 버전 (불변, 비교는 key 기준)"""
+
+    __slots__ = ("core", "prerelease", "build", "key")
+
+    def __init__(self, core: Tuple[int, ...], prerelease: Tuple[str, ...] = (), build: Optional[str] = None):
+        # 1.2 == 1.2.0, 1.2.3.0 == 1.2.3 (4번째 이후의 0은 의미 없음)
+        core = tuple(core) + (0,) * (3 - len(core))
+        while len(core) > 3 and core[-1] == 0:
+            core = core[:-1]
+        object.__setattr__(self, "core", core)
+        object.__setattr__(self, "prerelease", prerelease)
+        object.__setattr__(self, "build", build)
+        object.__setattr__(self, "key", (
+            core,
+            0 if prerelease else 1,
+            tuple((0, int(part)) if part.isdigit() else (1, part) for part in prerelease),
+        ))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Version은 변경할 수 없습니다")
+
+    @property
+    def major(self) -> int:
+        return self.core[0]
+
+    @property
+    def minor(self) -> int:
+        return self.core[1]
+
+    @property
+    def patch(self) -> int:
+        return self.core[2]
+
+    @property
+    def is_prerelease(self) -> bool:
+        return bool(self.prerelease)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self.key == other.key
+
+    def __lt__(self, other) -> bool:
+        if not isinstance(other, Version):
+            return NotImplemented
+        return self.key < other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __str__(self) -> str:
+        text = ".".join(str(part) for part in self.core)
+        if self.prerelease:
+            text += "-" + ".".join(self.prerelease)
+        if self.build:
+            text += "+" + self.build
+        return text
+
+    def __repr__(self) -> str:
+        return f"Version('{self}')"
+
+
+@lru_cache(maxsize=settings.version_parse_cache_size)
+def _parse_cached(version: str) -> Optional[Version]:
+    match = _VERSION_RE.match(version)
+    if match is None:
+        return None
+    pre = match.group("pre")
+    # 식별자 문자열은 intern하여 같은 프리릴리스 이름(beta, rc 등)이 메모리를 공유하도록 함
+    prerelease = tuple(sys.intern(part) for part in pre.split(".")) if pre else ()
+    return Version(
+        tuple(int(part) for part in match.group("core").split(".")),
+        prerelease,
+        match.group("build"),
+    )
+
+
+def parse(version: str) -> Version:
+    """버전 문자열 파싱 (형식이 잘못되면 ValueError)"""
+    if not isinstance(version, str):
+        raise ValueError("버전은 문자열이어야 합니다")
+    parsed = _parse_cached(version.strip())
+    if parsed is None:
+        raise ValueError(f"올바른 버전 형식이 아닙니다: {version}")
+    return parsed
+
+
+def try_parse(version: Optional[str]) -> Optional[Version]:
+    """버전 문자열 파싱 (형식이 잘못되면 None)"""
+    if not isinstance(version, str):
+        return None
+    return _parse_cached(version.strip())
+
+
+def version_key(version: Optional[str]) -> VersionKey:
+    """정렬/비교용 키 (형식이 잘못된 버전은 INVALID_KEY)"""
+    parsed = try_parse(version)
+    return parsed.key if parsed is not None else INVALID_KEY
+
+
+def compare(v1: str, v2: str) -> int:
+    """버전 비교: v1 > v2 이면 1, v1 < v2 이면 -1, 같으면 0"""
+    k1, k2 = version_key(v1), version_key(v2)
+    return (k1 > k2) - (k1 < k2)
+
+
+def is_newer(current: str, latest: str) -> bool:
+    """latest가 current보다 새로운 버전인지 확인"""
+    return version_key(latest) > version_key(current)
+
+
+def cache_info():
+    """파싱 캐시 통계 (functools.lru_cache)"""
+    return _parse_cached.cache_info()
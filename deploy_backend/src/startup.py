@@ -0,0 +1,162 @@
+"""
+서버 시작 작업
+
+lifespan은 즉시 반환하여 워커가 바로 /health/live에 응답하도록 하고,
+나머지 작업은 백그라운드에서 수행한다.
+
+- 준비(readiness) 경로: (선택) 마이그레이션 → 변경 알림 연결 대기 → 릴리스 상태/공개 페이지 캐시 예열
+  완료되어야 /health/ready가 200을 반환한다. DB 연결 실패 시 재시도한다.
+- 백그라운드: 관리자 계정 생성(bcrypt), 정적 내보내기 전체 갱신
+"""
+import asyncio
+import logging
+import threading
+import time
+from typing import Optional
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.exc import IntegrityError
+
+from . import events, public_pages, release_state, static_export
+from .auth import get_password_hash
+from .config import get_settings
+from .database import SessionLocal, engine
+from .models import User
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# 준비 작업 재시도 간격 (초, 실패할 때마다 두 배, 최대값)
+RETRY_INITIAL_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+
+class StartupState:
+    """준비 상태 (/health/ready 응답용)"""
+
+    def __init__(self):
+        self.ready = False
+        self.started_at = time.monotonic()
+        self.warmup_seconds: Optional[float] = None
+        self.warmed_release_states = 0
+        self.warmed_pages = 0
+        self.last_error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "ready": self.ready,
+            "warmup_ms": round(self.warmup_seconds * 1000, 1) if self.warmup_seconds is not None else None,
+            "release_states": self.warmed_release_states,
+            "public_pages": self.warmed_pages,
+            "last_error": self.last_error,
+        }
+
+
+state = StartupState()
+
+
+def ensure_admin_user() -> None:
+    """관리자 계정 확인 및 생성"""
+    db = SessionLocal()
+    try:
+        admin = db.query(User).filter(User.email == settings.admin_email).first()
+        if not admin:
+            admin = User(
+                email=settings.admin_email,
+                hashed_password=get_password_hash(settings.admin_password),
+                is_active=True,
+                is_admin=True
+            )
+            db.add(admin)
+            try:
+                db.commit()
+            except IntegrityError:
+                # 다른 워커가 먼저 생성함
+                db.rollback()
+                return
+            logger.info(f"관리자 계정 생성됨: {settings.admin_email}")
+    finally:
+        db.close()
+
+
+def warm_caches() -> None:
+    """업데이트 확인용 릴리스 상태와 공개 페이지 캐시 예열"""
+    db = SessionLocal()
+    try:
+        state.warmed_release_states = release_state.warm(db)
+        state.warmed_pages = public_pages.warm(db)
+    finally:
+        db.close()
+
+
+def _background_tasks() -> None:
+    """준비 상태와 무관한 시작 작업"""
+    try:
+        ensure_admin_user()
+    except Exception as e:
+        logger.error(f"Failed to ensure admin user: {str(e)}")
+    if settings.static_export_dir:
+        try:
+            static_export.export_all()
+        except Exception as e:
+            logger.error(f"Initial static export failed: {str(e)}")
+
+
+async def _prepare() -> None:
+    if settings.run_migrations_on_startup:
+        from .migrate import run_migrations
+
+        await run_in_threadpool(run_migrations, False)
+
+    if settings.cache_warmup_enabled:
+        # 알림 연결 직후 RESYNC로 캐시가 비워지므로 연결 이후에 예열
+        if not await run_in_threadpool(events.wait_until_listening, settings.startup_listener_wait_seconds):
+            logger.warning("Change event listener not connected yet, warming caches anyway")
+        await run_in_threadpool(warm_caches)
+
+
+def _start_background_tasks() -> None:
+    threading.Thread(target=_background_tasks, name="startup-background", daemon=True).start()
+
+
+async def run_startup_tasks() -> None:
+    """준비 작업 (성공할 때까지 재시도) 및 백그라운드 작업 실행"""
+    # 마이그레이션을 여기서 실행하는 경우에만 스키마 준비 후 백그라운드 작업 시작
+    if not settings.run_migrations_on_startup:
+        _start_background_tasks()
+
+    delay = RETRY_INITIAL_DELAY
+    while True:
+        started = time.monotonic()
+        try:
+            await _prepare()
+            break
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            state.last_error = str(e)
+            logger.error(f"Startup preparation failed, retrying in {delay:.0f}s: {str(e)}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RETRY_MAX_DELAY)
+
+    state.warmup_seconds = time.monotonic() - started
+    state.last_error = None
+    state.ready = True
+    logger.info(
+        f"Ready in {state.warmup_seconds * 1000:.0f}ms "
+        f"(release states: {state.warmed_release_states}, public pages: {state.warmed_pages})"
+    )
+
+    if settings.run_migrations_on_startup:
+        _start_background_tasks()
+
+
+def check_database() -> bool:
+    """DB 연결 확인 (/health/ready)"""
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except Exception:
+        return False
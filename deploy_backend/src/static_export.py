@@ -0,0 +1,213 @@
+"""
+공개 카탈로그/업데이트 피드 정적 내보내기
+
+배포 변경 후 미리 렌더링된 JSON을 STATIC_EXPORT_DIR에 기록한다.
+nginx 등에서 파일을 직접 서빙할 수 있으며, API는 그대로 원본이자 대체 경로로 동작한다.
+
+    {export_dir}/catalog.json                       # 공개 앱 목록 (/api/apps/public)
+    {export_dir}/apps/{app_id}.json                 # 공개 상세 페이지 (/api/apps/public/{app_id})
+    {export_dir}/feeds/{app_id}/{channel}.json      # 채널별 최신 버전 피드
+
+모든 파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽은 항상 완전한 파일을 본다.
+
+전체 내보내기:
+    python -m src.static_export
+"""
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Optional, Set, Tuple
+
+from . import events, public_pages
+from .config import get_settings
+from .database import SessionLocal
+from .models import App, AppVersion, ReleaseChannel
+from .schemas import AppListResponse
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# 연속된 변경을 한 번에 처리하기 위한 대기 시간
+DEBOUNCE_SECONDS = 0.5
+# 변경이 계속 이어져도 첫 변경 후 이 시간 안에는 내보냄
+MAX_DELAY_SECONDS = 5.0
+
+# 파일/디렉토리 이름으로 쓸 수 있는 앱 ID (경로 구분자, 상위 디렉토리 참조 불가)
+_SAFE_APP_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$", re.ASCII)
+
+
+def _write_json_atomic(path: str, data) -> None:
+    """임시 파일에 기록 후 원자적으로 교체"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".json")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _remove(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def build_feed(db, app: App, channel: ReleaseChannel) -> dict:
+    """채널별 업데이트 피드 (클라이언트가 버전 비교/필수 여부를 직접 판단할 수 있는 정보)"""
+    from .routers.update import get_latest_active_version
+
+    latest = get_latest_active_version(db, app.id, channel)
+    mandatory_versions = [
+        v.version for v in db.query(AppVersion.version).filter(
+            AppVersion.app_id == app.id,
+            AppVersion.channel == channel,
+            AppVersion.is_active == True,
+            AppVersion.is_mandatory == True
+        ).all()
+    ]
+    return {
+        "app_id": app.app_id,
+        "channel": channel.value,
+        "latest_version": latest.version if latest else None,
+        "release_notes": latest.release_notes if latest else None,
+        "download_url": f"/api/update/download/{latest.id}" if latest else None,
+        "file_size": latest.file_size if latest else None,
+        "file_hash": latest.file_hash if latest else None,
+        "mandatory_versions": mandatory_versions,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+    }
+
+
+def export_catalog(db, export_dir: str) -> None:
+    """공개 앱 목록 내보내기"""
+    apps = public_pages.public_apps_query(db).order_by(App.id).all()
+    catalog = AppListResponse(apps=apps, total=len(apps))
+    _write_json_atomic(os.path.join(export_dir, "catalog.json"), catalog.model_dump(mode="json"))
+
+
+def _app_paths(export_dir: str, app_id: str) -> Optional[Tuple[str, str]]:
+    """앱 상세 페이지 파일과 피드 디렉토리 경로 (내보내기 디렉토리를 벗어나는 앱 ID면 None)"""
+    if not _SAFE_APP_ID_RE.match(app_id):
+        return None
+    root = os.path.realpath(export_dir)
+    page_path = os.path.realpath(os.path.join(root, "apps", f"{app_id}.json"))
+    feed_dir = os.path.realpath(os.path.join(root, "feeds", app_id))
+    for path, parent in ((page_path, "apps"), (feed_dir, "feeds")):
+        if os.path.dirname(path) != os.path.join(root, parent):
+            return None
+    return page_path, feed_dir
+
+
+def export_app(db, export_dir: str, app_id: str) -> None:
+    """앱 상세 페이지와 채널별 피드 내보내기 (삭제/비공개 앱은 파일 제거)"""
+    paths = _app_paths(export_dir, app_id)
+    if paths is None:
+        logger.warning(f"Static export skipped for unsafe app id: {app_id!r}")
+        return
+    page_path, feed_dir = paths
+
+    app = db.query(App).filter(App.app_id == app_id).first()
+    if not app:
+        _remove(page_path)
+        _remove(feed_dir)
+        return
+
+    if app.is_public:
+        page = public_pages.build_public_page(db, app)
+        _write_json_atomic(page_path, page.model_dump(mode="json"))
+    else:
+        _remove(page_path)
+
+    for channel in ReleaseChannel:
+        _write_json_atomic(os.path.join(feed_dir, f"{channel.value}.json"), build_feed(db, app, channel))
+
+
+def export_all(export_dir: Optional[str] = None) -> int:
+    """전체 내보내기 (카탈로그 + 모든 앱)"""
+    export_dir = export_dir or settings.static_export_dir
+    db = SessionLocal()
+    try:
+        app_ids = [row.app_id for row in db.query(App.app_id).all()]
+        for app_id in app_ids:
+            export_app(db, export_dir, app_id)
+        export_catalog(db, export_dir)
+        return len(app_ids)
+    finally:
+        db.close()
+
+
+class StaticExporter:
+    """변경된 앱을 모아 백그라운드 스레드에서 내보내기"""
+
+    def __init__(self, export_dir: str):
+        self.export_dir = export_dir
+        self._pending: Set[str] = set()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, app_id: str) -> None:
+        with self._condition:
+            self._pending.add(app_id)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="static-export", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                # 마지막 변경 후 잠시 기다렸다가 한 번에 처리 (변경이 끊이지 않아도 최대 MAX_DELAY_SECONDS)
+                deadline = time.monotonic() + MAX_DELAY_SECONDS
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(timeout=min(DEBOUNCE_SECONDS, remaining)):
+                        break
+                app_ids, self._pending = self._pending, set()
+                if not app_ids:
+                    self._thread = None
+                    return
+
+            db = SessionLocal()
+            try:
+                for app_id in app_ids:
+                    export_app(db, self.export_dir, app_id)
+                export_catalog(db, self.export_dir)
+            except Exception as e:
+                logger.error(f"Static export failed: {str(e)}")
+            finally:
+                db.close()
+
+
+_exporter: Optional[StaticExporter] = None
+
+
+def setup() -> None:
+    """정적 내보내기 활성화 (STATIC_EXPORT_DIR 설정 시)"""
+    global _exporter
+    if not settings.static_export_dir or _exporter is not None:
+        return
+    _exporter = StaticExporter(settings.static_export_dir)
+    # 이 워커에서 발생한 변경만 처리 (다른 워커의 변경은 해당 워커가 내보냄)
+    events.subscribe(events.APP_CHANGED, _exporter.schedule, local_only=True)
+    events.subscribe(events.VERSION_CHANGED, _exporter.schedule, local_only=True)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    if not settings.static_export_dir:
+        raise SystemExit("STATIC_EXPORT_DIR 환경 변수를 설정해주세요")
+    count = export_all()
+    logger.info(f"Exported {count} apps to {settings.static_export_dir}")
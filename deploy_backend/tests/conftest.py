@@ -0,0 +1,121 @@
+"""
+테스트 공통 설정
+
+src 모듈은 최초 import 시 설정이 고정되므로, 테스트용 DB/업로드 경로를 먼저 환경 변수로 지정한다.
+
+실행 (deploy_backend 디렉토리에서):
+    pip install -r requirements-dev.txt
+    python -m pytest tests
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+WORK_DIR = tempfile.mkdtemp(prefix="deploy-helper-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(WORK_DIR, 'test.db')}"
+os.environ["UPLOAD_DIR"] = os.path.join(WORK_DIR, "uploads")
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["ACCESS_LOG_ENABLED"] = "false"
+os.environ["LOG_LEVEL"] = "WARNING"
+os.environ.pop("STATIC_EXPORT_DIR", None)
+
+TEST_APP_PREFIX = "test.app"
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from src.main import app
+    from src.migrate import run_migrations
+    from src.startup import ensure_admin_user
+
+    run_migrations(configure_logging=False)
+    ensure_admin_user()
+    with TestClient(app) as test_client:
+        # 시작 작업(캐시 예열)의 SQL 문이 측정에 섞이지 않도록 준비 완료까지 대기
+        deadline = time.monotonic() + 30
+        while test_client.get("/health/ready").status_code != 200:
+            assert time.monotonic() < deadline, "서버가 준비되지 않았습니다 (/health/ready)"
+            time.sleep(0.05)
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def auth_headers(client):
+    from src.config import get_settings
+
+    settings = get_settings()
+    response = client.post(
+        "/api/auth/login",
+        data={"username": settings.admin_email, "password": settings.admin_password}
+    )
+    assert response.status_code == 200, response.text
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    # 사용자 조회 캐시를 채워 두어 요청별 SQL 문 수가 캐시 상태에 따라 달라지지 않도록
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+    return headers
+
+
+@pytest.fixture
+def db(client):
+    from src.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def make_apps(db):
+    """앱 count개 × 버전 versions개 생성 (테스트가 끝나면 삭제)"""
+    from src.models import App, AppVersion, ReleaseChannel
+
+    created = []
+
+    def make(count: int, versions: int = 3):
+        from src.config import get_settings
+
+        upload_dir = get_settings().upload_dir
+        os.makedirs(upload_dir, exist_ok=True)
+        file_path = os.path.join(upload_dir, "test-setup.bin")
+        payload = b"deploy-helper-test"
+        with open(file_path, "wb") as f:
+            f.write(payload)
+
+        apps = []
+        for i in range(count):
+            app = App(app_id=f"{TEST_APP_PREFIX}{len(created)}", name=f"Test App {len(created)}", is_public=True)
+            db.add(app)
+            db.flush()
+            for j in range(versions):
+                db.add(AppVersion(
+                    app_id=app.id,
+                    version=f"1.{j}.0",
+                    channel=ReleaseChannel.STABLE,
+                    file_name="test-setup.bin",
+                    file_path=file_path,
+                    file_size=len(payload),
+                    file_hash=hashlib.sha256(payload).hexdigest(),
+                    is_active=True,
+                ))
+            created.append(app.id)
+            apps.append(app.app_id)
+        db.commit()
+        return apps
+
+    yield make
+
+    if created:
+        db.query(AppVersion).filter(AppVersion.app_id.in_(created)).delete(synchronize_session=False)
+        db.query(App).filter(App.id.in_(created)).delete(synchronize_session=False)
+        db.commit()
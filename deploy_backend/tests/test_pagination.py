@@ -0,0 +1,16 @@
+"""목록 API 페이지네이션 파라미터 검증"""
+import pytest
+
+
+@pytest.mark.parametrize("path", ["/api/apps/public", "/api/apps", "/api/apps/test.app0/versions"])
+def test_negative_skip_rejected(client, auth_headers, make_apps, path):
+    make_apps(1)
+    response = client.get(path, params={"skip": -1, "limit": 1}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_public_list_skip_past_end(client):
+    response = client.get("/api/apps/public", params={"skip": 100000, "limit": 1})
+    assert response.status_code == 200
+    assert response.json()["apps"] == []
+    assert response.json()["next_cursor"] is None
@@ -0,0 +1,88 @@
+"""
+엔드포인트별 SQL 문 수 상한 (query_stats.assert_query_budget)
+
+상한은 현재 구현의 SQL 문 수이며 (연결 확인 SELECT 1 포함, 사용자 조회는 캐시),
+앱/버전 수가 늘어도 같아야 한다. 상한을 넘으면 예외 메시지에 실행된 SQL 문 목록이 출력된다.
+"""
+import pytest
+
+from src import query_stats
+from src.query_stats import QueryBudgetExceeded, assert_query_budget
+
+
+def _measure(client, *args, **kwargs) -> int:
+    with query_stats.capture() as stats:
+        response = client.get(*args, **kwargs)
+    assert response.status_code == 200, response.text
+    return stats.count
+
+
+def test_update_check_budget(client, make_apps):
+    app_id = make_apps(1)[0]
+    params = {"app_id": app_id, "current_version": "1.0.0"}
+    client.get("/api/update/check", params=params)  # 릴리즈 상태 캐시 적재
+
+    # 연결 확인만 (최신 버전은 릴리즈 상태 캐시에서)
+    with assert_query_budget(1):
+        response = client.get("/api/update/check", params=params)
+    assert response.status_code == 200
+    assert response.json()["latest_version"] == "1.2.0"
+
+
+def test_dashboard_budget_does_not_grow_with_apps(client, auth_headers, make_apps):
+    make_apps(1)
+    # 연결 확인 + 앱별 버전 수/다운로드 수 + 앱별 버전 문자열 + 앱 목록
+    assert _measure(client, "/api/stats/dashboard", headers=auth_headers) == 4
+
+    # 앱마다 버전을 조회하던 N+1이 다시 생기면 앱 수만큼 SQL 문이 늘어남
+    make_apps(10)
+    with assert_query_budget(4):
+        response = client.get("/api/stats/dashboard", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["total_apps"] >= 11
+
+
+def test_version_routes_budget(client, auth_headers, make_apps):
+    app_id = make_apps(1, versions=5)[0]
+
+    # 연결 확인 + 전체 개수 + 버전 목록 (앱은 서브쿼리로)
+    with assert_query_budget(3):
+        response = client.get(f"/api/apps/{app_id}/versions", headers=auth_headers)
+    assert response.status_code == 200
+    versions = response.json()["versions"]
+    assert len(versions) == 5
+
+    # 연결 확인 + 버전 조회 (앱 조회를 따로 하지 않고 JOIN)
+    with assert_query_budget(2):
+        response = client.get(f"/api/apps/{app_id}/versions/{versions[0]['id']}", headers=auth_headers)
+    assert response.status_code == 200
+
+
+def test_version_routes_not_found(client, auth_headers, make_apps):
+    app_id = make_apps(1)[0]
+    response = client.get(f"/api/apps/{app_id}/versions/999999", headers=auth_headers)
+    assert response.status_code == 404
+    assert response.json()["detail"] == "버전을 찾을 수 없습니다"
+
+    for path in ("/api/apps/test.missing/versions", "/api/apps/test.missing/versions/1"):
+        response = client.get(path, headers=auth_headers)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "앱을 찾을 수 없습니다"
+
+
+def test_budget_exceeded(client, auth_headers, make_apps):
+    app_id = make_apps(1)[0]
+    with pytest.raises(QueryBudgetExceeded, match="budget 1"):
+        with assert_query_budget(1):
+            client.get(f"/api/apps/{app_id}/versions", headers=auth_headers)
+
+
+def test_lazy_loaded_versions_detected_as_n_plus_one(db, make_apps):
+    from src.models import App
+
+    make_apps(6)
+    # 앱마다 App.versions를 지연 로딩하면 같은 SQL 문이 앱 수만큼 반복됨
+    with pytest.raises(QueryBudgetExceeded, match="possible N\\+1"):
+        with assert_query_budget(100, max_repeats=3):
+            for app in db.query(App).all():
+                len(app.versions)
@@ -0,0 +1,51 @@
+"""업데이트 확인/다운로드 요청 속도 제한 키"""
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from src import rate_limit
+from src.rate_limit import RateLimit, get_client_key
+
+
+def _request(ip: str, client_id: str = None) -> Request:
+    headers = [(b"x-client-id", client_id.encode())] if client_id else []
+    return Request({
+        "type": "http", "method": "GET", "path": "/api/update/check", "headers": headers,
+        "query_string": b"", "client": (ip, 50000), "path_params": {},
+    })
+
+
+def _allowed(limit: RateLimit, request: Request) -> bool:
+    try:
+        asyncio.run(limit(request))
+        return True
+    except HTTPException as e:
+        assert e.status_code == 429
+        return False
+
+
+@pytest.fixture
+def limit(monkeypatch):
+    monkeypatch.setattr(rate_limit.settings, "rate_limit_enabled", True)
+    monkeypatch.setattr(rate_limit.settings, "rate_limit_clients_per_ip", 3)
+    return RateLimit("test", client_rate=0.001, client_burst=2, app_rate=0, app_burst=0)
+
+
+def test_client_key_includes_ip():
+    assert get_client_key(_request("10.0.0.1")) == "ip:10.0.0.1"
+    assert get_client_key(_request("10.0.0.1", "pc-1")) == "ip:10.0.0.1|id:pc-1"
+
+
+def test_copied_client_id_does_not_share_bucket(limit):
+    assert all(_allowed(limit, _request("10.0.0.1", "pc-1")) for _ in range(2))
+    assert not _allowed(limit, _request("10.0.0.1", "pc-1"))
+    # 다른 IP에서 같은 ID를 보내도 별도 버킷
+    assert _allowed(limit, _request("10.0.0.2", "pc-1"))
+
+
+def test_rotating_client_id_limited_per_ip(limit):
+    # IP 한도 = 클라이언트 burst 2 × 3
+    results = [_allowed(limit, _request("10.0.0.3", f"pc-{i}")) for i in range(10)]
+    assert results.count(True) == 6
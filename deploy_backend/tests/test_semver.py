@@ -0,0 +1,76 @@
+"""SemVer 우선순위 (release_state, 업데이트 확인, 통계의 최신 버전 선택 기준)"""
+import bisect
+import itertools
+
+import pytest
+
+from src.semver import INVALID_KEY, compare, is_newer, version_key
+
+# SemVer 2.0.0 §11 예시 (낮은 순)
+SEMVER_SPEC_CHAIN = [
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "2.0.0",
+    "2.1.0",
+    "2.1.1",
+]
+
+
+@pytest.mark.parametrize("lower,higher", list(zip(SEMVER_SPEC_CHAIN, SEMVER_SPEC_CHAIN[1:])))
+def test_spec_precedence_chain(lower, higher):
+    assert version_key(lower) < version_key(higher)
+    assert compare(lower, higher) == -1
+    assert compare(higher, lower) == 1
+    assert is_newer(lower, higher)
+    assert not is_newer(higher, lower)
+
+
+def test_sort_matches_spec_chain():
+    shuffled = list(reversed(SEMVER_SPEC_CHAIN))
+    assert sorted(shuffled, key=version_key) == SEMVER_SPEC_CHAIN
+    # 모든 쌍에 대해서도 일관 (추이성)
+    for a, b in itertools.combinations(SEMVER_SPEC_CHAIN, 2):
+        assert version_key(a) < version_key(b)
+
+
+@pytest.mark.parametrize("lower,higher", [
+    ("1.0.0-rc.1", "1.0.0"),  # 프리릴리스 < 정식
+    ("1.0.0-1", "1.0.0-alpha"),  # 숫자 식별자 < 문자 식별자
+    ("1.0.0-2", "1.0.0-10"),  # 숫자 식별자는 숫자로 비교
+    ("1.0.0-alpha", "1.0.0-alpha.0"),  # 앞부분이 같으면 식별자가 많은 쪽이 높음
+    ("1.9.0", "1.10.0"),
+    ("1.2.3", "1.2.3.1"),  # Windows 4자리 버전
+])
+def test_precedence_rules(lower, higher):
+    assert version_key(lower) < version_key(higher)
+
+
+@pytest.mark.parametrize("a,b", [
+    ("1.0.0+build.1", "1.0.0+build.2"),  # 빌드 메타데이터 무시
+    ("1.0.0-beta+exp.sha.5114f85", "1.0.0-beta"),
+    ("v1.2.0", "1.2.0"),
+    ("1.2", "1.2.0"),
+    ("1.2.3.0", "1.2.3"),
+])
+def test_equal_precedence(a, b):
+    assert version_key(a) == version_key(b)
+    assert compare(a, b) == 0
+
+
+@pytest.mark.parametrize("invalid", ["", "abc", "1.0.0-", "1.0.0-beta..1", "1..0", None])
+def test_invalid_sorts_below_everything(invalid):
+    assert version_key(invalid) == INVALID_KEY
+    assert version_key(invalid) < version_key("0.0.0-0")
+    assert is_newer(invalid, "0.0.1")
+
+
+def test_bisect_on_keys():
+    keys = [version_key(v) for v in SEMVER_SPEC_CHAIN]
+    assert bisect.bisect_right(keys, version_key("1.0.0")) == SEMVER_SPEC_CHAIN.index("1.0.0") + 1
+    assert bisect.bisect_left(keys, version_key("1.0.0-beta.3")) == SEMVER_SPEC_CHAIN.index("1.0.0-beta.11")
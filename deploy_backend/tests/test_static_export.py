@@ -0,0 +1,26 @@
+"""정적 내보내기 경로 검증"""
+import os
+
+import pytest
+
+from src.static_export import _app_paths, export_app
+
+
+@pytest.mark.parametrize("app_id", ["../outside", "a/b", "..", "/etc/passwd", "a\\b", ".hidden", ""])
+def test_unsafe_app_id_is_not_exported(tmp_path, db, app_id):
+    export_dir = tmp_path / "export"
+    export_dir.mkdir()
+    victim = tmp_path / "outside"
+    victim.mkdir()
+
+    assert _app_paths(str(export_dir), app_id) is None
+    # 삭제된 앱처럼 처리되어도 내보내기 디렉토리 밖은 지우지 않음
+    export_app(db, str(export_dir), app_id)
+    assert victim.exists()
+
+
+def test_app_paths_stay_under_export_dir(tmp_path):
+    page_path, feed_dir = _app_paths(str(tmp_path), "com.company.app")
+    root = os.path.realpath(str(tmp_path))
+    assert page_path == os.path.join(root, "apps", "com.company.app.json")
+    assert feed_dir == os.path.join(root, "feeds", "com.company.app")
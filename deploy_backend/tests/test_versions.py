@@ -0,0 +1,34 @@
+"""버전 업로드 검증"""
+import pytest
+
+from src.semver import try_parse
+
+
+def _upload(client, auth_headers, app_id: str, version: str):
+    return client.post(
+        f"/api/apps/{app_id}/versions",
+        headers=auth_headers,
+        data={"version": version, "channel": "stable"},
+        files={"file": ("setup.exe", b"installer", "application/octet-stream")},
+    )
+
+
+@pytest.mark.parametrize("duplicate", ["1.2.0", "1.2", "v1.2.0", "1.2.0+build.5", "1.2.0.0"])
+def test_upload_rejects_same_precedence(client, auth_headers, make_apps, duplicate):
+    # make_apps는 1.0.0, 1.1.0, 1.2.0 생성
+    app_id = make_apps(1)[0]
+    response = _upload(client, auth_headers, app_id, duplicate)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "이미 등록된 버전입니다"
+
+
+def test_upload_accepts_prerelease_of_existing_core(client, auth_headers, make_apps):
+    app_id = make_apps(1)[0]
+    response = _upload(client, auth_headers, app_id, "1.3.0-beta.1")
+    assert response.status_code == 201, response.text
+
+
+def test_version_digits_are_ascii_only():
+    assert try_parse("1.2.0") is not None
+    assert try_parse("１.２.０") is None
+    assert try_parse("1.2.٣") is None
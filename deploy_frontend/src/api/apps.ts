@@ -16,9 +16,13 @@ export interface App {
   updated_at: string | null
 }
 
+// 목록 응답에는 상세 HTML/CSS가 포함되지 않음 (getApp으로 조회)
+export type AppSummary = Omit<App, 'detail_html' | 'custom_css'>
+
 export interface AppListResponse {
-  apps: App[]
+  apps: AppSummary[]
   total: number
+  next_cursor?: string | null
 }
 
 export interface CreateAppRequest {
@@ -73,6 +77,7 @@ export interface Version {
 export interface VersionListResponse {
   versions: Version[]
   total: number
+  next_cursor?: string | null
 }
 
 export interface UpdateVersionRequest {
@@ -147,6 +147,12 @@ export default function PublicAppsPage() {
 }
 
 // 앱 카드 컴포넌트
+// 업로드된 아이콘은 카드 크기(64px, 고해상도 2배)에 맞는 리사이즈 이미지를 요청
+function cardIconUrl(iconUrl: string) {
+  if (!iconUrl.startsWith('/api/apps/')) return iconUrl
+  return `${iconUrl}${iconUrl.includes('?') ? '&' : '?'}size=128`
+}
+
 function AppCard({ app }: { app: { app_id: string; name: string; description: string | null; icon_url: string | null } }) {
   return (
     <Link
@@ -158,7 +164,7 @@ function AppCard({ app }: { app: { app_id: string; name: string; description: st
         <div className="relative w-16 h-16 rounded-xl mr-4 flex-shrink-0 shadow-sm overflow-hidden">
           {app.icon_url ? (
             <img 
-              src={app.icon_url} 
+              src={cardIconUrl(app.icon_url)} 
               alt={`${app.name} 아이콘`} 
               className="w-full h-full object-cover"
               onError={(e) => {
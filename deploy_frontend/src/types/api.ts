@@ -82,6 +82,7 @@ export interface AppPublicResponse {
 export interface AppListResponse {
   apps: AppResponse[];
   total: number;
+  next_cursor?: string | null;
 }
 
 // Version Schemas
@@ -109,6 +110,7 @@ export interface VersionResponse extends VersionBase {
 export interface VersionListResponse {
   versions: VersionResponse[];
   total: number;
+  next_cursor?: string | null;
 }
 
 // Update Check Schemas
@@ -127,6 +129,7 @@ export interface UpdateCheckResponse {
   download_url?: string;
   file_size?: number;
   file_hash?: string;
+  poll_interval_seconds?: number;
 }
 
 // Statistics Schemas
@@ -5,7 +5,9 @@ Deploy Helper Python SDK
 """
 
 from .auto_updater import AutoUpdater
-from .models import UpdateInfo, UpdaterConfig, DownloadProgress
+from .async_updater import AsyncAutoUpdater
+from .models import UpdateInfo, UpdaterConfig, DownloadProgress, StagedUpdate
+from .exceptions import ServerBusyError
 
 __version__ = "1.0.0"
-__all__ = ["AutoUpdater", "UpdateInfo", "UpdaterConfig", "DownloadProgress"]
+__all__ = ["AutoUpdater", "AsyncAutoUpdater", "UpdateInfo", "UpdaterConfig", "DownloadProgress", "StagedUpdate", "ServerBusyError"]
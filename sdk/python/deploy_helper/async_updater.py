@@ -0,0 +1,402 @@
+"""
+비동기 자동 업데이트 클라이언트 (asyncio)
+
+httpx.AsyncClient 기반이며 AutoUpdater와 같은 메서드를 코루틴으로 제공한다.
+여러 업데이터가 하나의 클라이언트(연결 풀)를 공유하면 여러 구성 요소를 동시에 확인/다운로드할 수 있다.
+
+설치: pip install deploy-helper-sdk[async]
+"""
+
+import asyncio
+import functools
+import inspect
+import os
+import time
+from typing import Any, Callable, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # 비동기 클라이언트를 쓰지 않으면 필요 없음
+    httpx = None
+
+from .auto_updater import _api_url, _download_cache, _download_file_path, _parse_retry_after, _parse_update_info
+from .cache import DownloadCache, FileLock
+from .download import AdaptiveChunkSize, HashingWriter, ProgressThrottle, verify_hash
+from .exceptions import ServerBusyError
+from .models import DownloadProgress, UpdateInfo, UpdaterConfig
+from .scheduler import PollScheduler
+
+
+async def _call(callback: Optional[Callable], *args: Any) -> None:
+    """콜백 호출 (일반 함수/코루틴 함수 모두 지원)"""
+    if callback is None:
+        return
+    result = callback(*args)
+    if inspect.isawaitable(result):
+        await result
+
+
+async def _acquire_cache_lock(cache: DownloadCache, file_hash: str) -> Optional[FileLock]:
+    """
+    캐시 항목 잠금 획득 (DownloadCache.acquire의 코루틴 버전)
+
+    스레드 풀에서 기다리면 태스크가 취소되어도 스레드는 나중에 잠금을 잡고 아무도 풀지 않으므로,
+    이벤트 루프에서 기다리지 않는 시도(timeout=0)를 짧은 간격으로 반복한다.
+    """
+    lock = cache.lock(file_hash)
+    deadline = None if cache.lock_timeout is None else time.monotonic() + cache.lock_timeout
+    while True:
+        try:
+            if lock.acquire(timeout=0):
+                return lock
+        except OSError:
+            return None
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        await asyncio.sleep(lock.poll_interval)
+
+
+class AsyncAutoUpdater:
+    """
+    Deploy Helper 비동기 자동 업데이트 클라이언트
+
+    사용 예시:
+        async with AsyncAutoUpdater(
+            server_url="http://localhost:8000",
+            app_id="com.company.myapp",
+            current_version="1.0.0"
+        ) as updater:
+            info, file_path = await updater.check_and_download()
+
+    여러 구성 요소를 연결 풀 하나로 동시에 확인:
+        async with httpx.AsyncClient() as client:
+            updaters = [AsyncAutoUpdater(config=c, client=client) for c in configs]
+            results = await asyncio.gather(*(u.check_and_download() for u in updaters))
+    """
+
+    def __init__(
+        self,
+        server_url: str = None,
+        app_id: str = None,
+        current_version: str = None,
+        config: UpdaterConfig = None,
+        client: "httpx.AsyncClient" = None,
+        **kwargs
+    ):
+        """
+        Args:
+            server_url: 서버 URL
+            app_id: 앱 고유 ID
+            current_version: 현재 앱 버전
+            config: UpdaterConfig 객체 (위 파라미터 대신 사용 가능)
+            client: 공유할 httpx.AsyncClient (미지정 시 자체 생성, aclose()에서 닫음)
+            **kwargs: UpdaterConfig 추가 옵션
+        """
+        if httpx is None:
+            raise ImportError("AsyncAutoUpdater를 사용하려면 httpx가 필요합니다: pip install deploy-helper-sdk[async]")
+
+        if config:
+            self.config = config
+        else:
+            self.config = UpdaterConfig(
+                server_url=server_url,
+                app_id=app_id,
+                current_version=current_version,
+                **kwargs
+            )
+
+        self._client = client
+        self._owns_client = client is None
+        # 공유 클라이언트를 쓰므로 클라이언트별 헤더는 요청마다 지정
+        self._headers = {"X-Client-ID": self.config.client_id} if self.config.client_id else {}
+        # 서버가 Retry-After로 지정한 시각 전에는 요청하지 않음 (time.monotonic 기준)
+        self._retry_not_before = 0.0
+        self._auto_check_task: Optional[asyncio.Task] = None
+
+        # 콜백 함수들 (일반 함수 또는 코루틴 함수)
+        self.on_update_available: Optional[Callable[[UpdateInfo], Any]] = None
+        self.on_download_progress: Optional[Callable[[DownloadProgress], Any]] = None
+        self.on_download_complete: Optional[Callable[[str], Any]] = None
+        self.on_error: Optional[Callable[[Exception], Any]] = None
+
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.config.timeout_seconds)
+        return self._client
+
+    async def check_for_update(self) -> UpdateInfo:
+        """
+        서버에서 업데이트 확인
+
+        Raises:
+            ServerBusyError: 서버가 요청을 제한함 (retry_after초 후 다시 시도)
+            httpx.HTTPError: 서버 연결 실패
+        """
+        try:
+            params = {
+                "app_id": self.config.app_id,
+                "current_version": self.config.current_version,
+                "channel": self.config.channel
+            }
+
+            self._ensure_not_throttled()
+            response = await self.client.get(
+                _api_url(self.config, "api/update/check"),
+                params=params,
+                headers=self._headers,
+                timeout=self.config.timeout_seconds
+            )
+            self._raise_for_status(response)
+
+            info = _parse_update_info(self.config, response.json())
+            if info.update_available:
+                await _call(self.on_update_available, info)
+            return info
+
+        except Exception as e:
+            await _call(self.on_error, e)
+            raise
+
+    async def download_update(
+        self,
+        update_info: UpdateInfo,
+        progress_callback: Optional[Callable[[DownloadProgress], Any]] = None
+    ) -> str:
+        """
+        업데이트 파일 다운로드
+
+        받는 동안 해시를 계산하며, 파일 쓰기와 해시 계산은 스레드 풀에서 실행하여 이벤트 루프를 막지 않는다.
+        cache_dir을 설정하면 머신 공용 캐시를 거친다 (같은 파일은 한 번만 받음).
+        태스크가 취소되면 받던 파일을 삭제하고 CancelledError를 그대로 전파한다.
+
+        Raises:
+            ValueError: 다운로드할 업데이트가 없음 / 파일 무결성 검증 실패
+            ServerBusyError: 재시도 후에도 서버가 요청을 제한함
+            httpx.HTTPError: 다운로드 실패
+        """
+        if not update_info.update_available or not update_info.download_url:
+            raise ValueError("다운로드할 업데이트가 없습니다.")
+
+        loop = asyncio.get_running_loop()
+        file_path = _download_file_path(self.config, update_info)
+        try:
+            if os.path.exists(file_path):
+                await loop.run_in_executor(None, os.remove, file_path)
+
+            download_url = _api_url(self.config, update_info.download_url)
+            cache = _download_cache(self.config)
+            if cache is not None and update_info.file_hash:
+                # 같은 파일을 이미 받았거나 다른 프로세스가 받는 중이면 재사용
+                if await self._fetch_cached(cache, download_url, file_path, update_info, progress_callback):
+                    size = os.path.getsize(file_path)
+                    progress = DownloadProgress(bytes_received=size, total_bytes=size)
+                    await _call(progress_callback, progress)
+                    await _call(self.on_download_progress, progress)
+            else:
+                await self._download_verified(download_url, file_path, update_info, progress_callback)
+
+            await _call(self.on_download_complete, file_path)
+            return file_path
+
+        except BaseException as e:
+            # 실패/취소 시 받다 만 파일 삭제
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            if isinstance(e, Exception):
+                await _call(self.on_error, e)
+            raise
+
+    async def _download_verified(
+        self,
+        url: str,
+        file_path: str,
+        update_info: UpdateInfo,
+        progress_callback: Optional[Callable[[DownloadProgress], Any]]
+    ) -> None:
+        """file_path로 받은 후 해시 검증 (실패 시 파일 삭제)"""
+        calculated_hash = await self._stream_to_file(url, file_path, update_info, progress_callback)
+        try:
+            verify_hash(calculated_hash, update_info.file_hash)
+        except ValueError:
+            os.remove(file_path)
+            raise
+
+    async def _fetch_cached(
+        self,
+        cache: DownloadCache,
+        url: str,
+        file_path: str,
+        update_info: UpdateInfo,
+        progress_callback: Optional[Callable[[DownloadProgress], Any]]
+    ) -> bool:
+        """DownloadCache.fetch와 같은 순서로 처리 (링크/복사는 스레드 풀에서), 캐시 적중 여부 반환"""
+        loop = asyncio.get_running_loop()
+        file_hash = update_info.file_hash
+        lock = await _acquire_cache_lock(cache, file_hash)
+        if lock is None:
+            await self._download_verified(url, file_path, update_info, progress_callback)
+            return False
+        try:
+            if await loop.run_in_executor(None, cache.try_export, file_hash, file_path):
+                return True
+            temp_path = cache.temp_path(file_hash)
+            if temp_path is None:
+                await self._download_verified(url, file_path, update_info, progress_callback)
+                return False
+            try:
+                await self._download_verified(url, temp_path, update_info, progress_callback)
+                await loop.run_in_executor(None, cache.store, file_hash, temp_path, file_path)
+            finally:
+                cache.remove_temp(temp_path)
+            return False
+        finally:
+            lock.release()
+            await loop.run_in_executor(None, functools.partial(cache.evict, keep=file_hash))
+
+    async def _stream_to_file(
+        self,
+        url: str,
+        file_path: str,
+        update_info: UpdateInfo,
+        progress_callback: Optional[Callable[[DownloadProgress], Any]]
+    ) -> str:
+        """다운로드 후 SHA256 반환 (서버가 요청을 제한하면 Retry-After만큼 기다린 후 재시도)"""
+        loop = asyncio.get_running_loop()
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                self._ensure_not_throttled()
+                async with self.client.stream(
+                    "GET", url, headers=self._headers, timeout=self.config.timeout_seconds
+                ) as response:
+                    self._raise_for_status(response)
+
+                    total_size = int(response.headers.get("content-length", 0)) or update_info.file_size or 0
+                    chunk_size = AdaptiveChunkSize(self.config.download_chunk_size)
+                    throttle = ProgressThrottle(
+                        total_size, self.config.progress_interval_seconds, self.config.progress_step_percent
+                    )
+                    writer = await loop.run_in_executor(None, HashingWriter, file_path)
+                    try:
+                        # 네트워크에서 받은 조각을 읽기 크기만큼 모아서 쓰기 (스레드 풀 전환 횟수 감소)
+                        buffer = bytearray()
+                        started = time.monotonic()
+                        async for chunk in response.aiter_bytes():
+                            buffer += chunk
+                            if len(buffer) < chunk_size.size:
+                                continue
+                            chunk_size.observe(len(buffer), time.monotonic() - started)
+                            await self._write(writer, buffer, total_size, throttle, progress_callback)
+                            buffer = bytearray()
+                            started = time.monotonic()
+                        if buffer:
+                            await self._write(writer, buffer, total_size, throttle, progress_callback)
+                    finally:
+                        await loop.run_in_executor(None, writer.close)
+                return writer.hexdigest()
+            except ServerBusyError as e:
+                if attempt >= self.config.max_retries or e.retry_after > self.config.max_retry_wait_seconds:
+                    raise
+                await asyncio.sleep(e.retry_after)
+
+    async def _write(
+        self,
+        writer: HashingWriter,
+        data: bytearray,
+        total_size: int,
+        throttle: ProgressThrottle,
+        progress_callback: Optional[Callable[[DownloadProgress], Any]]
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, writer.write, bytes(data))
+        if throttle.should_report(writer.bytes_written):
+            progress = DownloadProgress(bytes_received=writer.bytes_written, total_bytes=total_size)
+            await _call(progress_callback, progress)
+            await _call(self.on_download_progress, progress)
+
+    async def check_and_download(
+        self,
+        progress_callback: Optional[Callable[[DownloadProgress], Any]] = None
+    ) -> Tuple[UpdateInfo, Optional[str]]:
+        """
+        업데이트 확인 및 다운로드를 한번에 수행
+
+        Returns:
+            tuple: (UpdateInfo, 파일 경로 또는 None)
+        """
+        info = await self.check_for_update()
+
+        if not info.update_available:
+            return info, None
+
+        file_path = await self.download_update(info, progress_callback)
+        return info, file_path
+
+    def start_auto_check(self) -> Optional[asyncio.Task]:
+        """
+        주기적 자동 업데이트 확인 시작 (현재 이벤트 루프의 태스크 1개)
+
+        주기 계산은 AutoUpdater.start_auto_check()와 같다 (무작위 편차, 서버 권장 주기, 실패 시 주기 증가).
+        """
+        if self.config.auto_check_interval_minutes <= 0:
+            return None
+        if self._auto_check_task is not None:
+            self._auto_check_task.cancel()
+        scheduler = PollScheduler(
+            self.config.auto_check_interval_minutes * 60,
+            jitter=self.config.auto_check_jitter,
+            max_backoff_seconds=self.config.auto_check_max_backoff_minutes * 60,
+            check_on_start=self.config.auto_check_on_start
+        )
+        self._auto_check_task = asyncio.get_running_loop().create_task(self._auto_check_loop(scheduler))
+        return self._auto_check_task
+
+    async def _auto_check_loop(self, scheduler: PollScheduler) -> None:
+        """자동 확인 반복 (오류는 on_error 콜백으로 전달되고 태스크는 계속 실행)"""
+        delay = scheduler.initial_delay()
+        while True:
+            await asyncio.sleep(delay)
+            try:
+                info = await self.check_for_update()
+                delay = scheduler.success(info.poll_interval_seconds)
+            except ServerBusyError as e:
+                delay = scheduler.failure(e.retry_after)
+            except Exception:
+                delay = scheduler.failure()
+
+    async def stop_auto_check(self) -> None:
+        """자동 업데이트 확인 중지"""
+        task, self._auto_check_task = self._auto_check_task, None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _ensure_not_throttled(self) -> None:
+        """Retry-After로 지정된 시간이 지나기 전에는 서버에 요청하지 않음"""
+        wait = self._retry_not_before - time.monotonic()
+        if wait > 0:
+            raise ServerBusyError(wait)
+
+    def _raise_for_status(self, response: "httpx.Response") -> None:
+        """429/503 응답 시 Retry-After를 기록하고 ServerBusyError 발생"""
+        if response.status_code in (429, 503):
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            self._retry_not_before = time.monotonic() + retry_after
+            raise ServerBusyError(retry_after, response=response)
+        response.raise_for_status()
+
+    async def aclose(self) -> None:
+        """자동 확인 중지 및 자체 생성한 HTTP 클라이언트 종료 (공유 클라이언트는 닫지 않음)"""
+        await self.stop_auto_check()
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
@@ -2,18 +2,112 @@
 자동 업데이트 클라이언트
 """
 
+import json
 import os
+import shutil
 import sys
-import hashlib
 import tempfile
 import subprocess
 import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from dataclasses import asdict, fields
 from typing import Optional, Callable
 from urllib.parse import urljoin, urlencode
 
 import requests
 
-from .models import UpdaterConfig, UpdateInfo, DownloadProgress
+from .models import UpdaterConfig, UpdateInfo, DownloadProgress, StagedUpdate
+from .exceptions import ServerBusyError
+from .download import (
+    MAX_CHUNK_SIZE, AdaptiveChunkSize, DownloadPaused, HashingWriter, ProgressThrottle, RateLimiter,
+    file_sha256, verify_hash
+)
+from .scheduler import PollScheduler
+from .cache import PART_SUFFIX, DownloadCache
+
+# 서버가 Retry-After 없이 429/503을 반환할 때 기다릴 시간(초)
+DEFAULT_RETRY_AFTER = 60
+
+# 미리 받은 업데이트 정보 파일 (staging 디렉토리 안)
+STAGED_MANIFEST = "staged.json"
+
+
+def _api_url(config: UpdaterConfig, path: str) -> str:
+    """서버 기준 URL (download_url처럼 이미 절대 URL이면 그대로)"""
+    if path.startswith("http"):
+        return path
+    return urljoin(config.server_url.rstrip("/") + "/", path.lstrip("/"))
+
+
+def _parse_update_info(config: UpdaterConfig, data: dict) -> UpdateInfo:
+    """업데이트 확인 응답(JSON) → UpdateInfo"""
+    return UpdateInfo(
+        update_available=data.get("update_available", False),
+        current_version=data.get("current_version", config.current_version),
+        latest_version=data.get("latest_version"),
+        is_mandatory=data.get("is_mandatory", False),
+        release_notes=data.get("release_notes"),
+        download_url=data.get("download_url"),
+        file_size=data.get("file_size"),
+        file_hash=data.get("file_hash"),
+        poll_interval_seconds=data.get("poll_interval_seconds")
+    )
+
+
+def _download_file_path(config: UpdaterConfig, update_info: UpdateInfo) -> str:
+    """다운로드 파일 경로 (플랫폼별 확장자)"""
+    download_dir = config.download_path or tempfile.gettempdir()
+    filename = f"update_{config.app_id}_{update_info.latest_version}"
+    
+    if sys.platform == "win32":
+        filename += ".exe"
+    elif sys.platform == "darwin":
+        filename += ".dmg"
+    else:
+        filename += ".tar.gz"
+    
+    return os.path.join(download_dir, filename)
+
+
+def _download_cache(config: UpdaterConfig) -> Optional[DownloadCache]:
+    """머신 공용 다운로드 캐시 (cache_dir 미설정 또는 캐시 디렉토리를 만들 수 없으면 None)"""
+    if not config.cache_dir:
+        return None
+    try:
+        return DownloadCache(
+            config.cache_dir,
+            max_bytes=config.cache_max_bytes,
+            lock_timeout=config.cache_lock_timeout_seconds,
+            verify_on_hit=config.cache_verify_on_hit
+        )
+    except OSError:
+        return None
+
+
+def _staging_dir(config: UpdaterConfig) -> str:
+    """미리 받은 설치 파일 보관 위치 (앱별)"""
+    if config.staging_path:
+        return config.staging_path
+    return os.path.join(config.download_path or tempfile.gettempdir(), f"deploy_helper_staged_{config.app_id}")
+
+
+def _parse_retry_after(value: Optional[str]) -> float:
+    """Retry-After 헤더 (초 또는 HTTP 날짜) 해석"""
+    if not value:
+        return DEFAULT_RETRY_AFTER
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
 
 
 class AutoUpdater:
@@ -60,13 +154,20 @@ class AutoUpdater:
             )
         
         self._session = requests.Session()
-        self._session.timeout = self.config.timeout_seconds
-        self._auto_check_timer: Optional[threading.Timer] = None
+        if self.config.client_id:
+            self._session.headers["X-Client-ID"] = self.config.client_id
+        self._auto_check_thread: Optional[threading.Thread] = None
+        self._auto_check_stop: Optional[threading.Event] = None
+        self._background_thread: Optional[threading.Thread] = None
+        self._background_stop: Optional[threading.Event] = None
+        # 서버가 Retry-After로 지정한 시각 전에는 요청하지 않음 (time.monotonic 기준)
+        self._retry_not_before = 0.0
         
         # 콜백 함수들
         self.on_update_available: Optional[Callable[[UpdateInfo], None]] = None
         self.on_download_progress: Optional[Callable[[DownloadProgress], None]] = None
         self.on_download_complete: Optional[Callable[[str], None]] = None
+        self.on_update_staged: Optional[Callable[[StagedUpdate], None]] = None
         self.on_error: Optional[Callable[[Exception], None]] = None
     
     def check_for_update(self) -> UpdateInfo:
@@ -77,6 +178,7 @@ class AutoUpdater:
             UpdateInfo: 업데이트 정보
         
         Raises:
+            ServerBusyError: 서버가 요청을 제한함 (retry_after초 후 다시 시도)
             requests.RequestException: 서버 연결 실패
         """
         try:
@@ -86,21 +188,10 @@ class AutoUpdater:
                 "channel": self.config.channel
             }
             
-            url = urljoin(self.config.server_url.rstrip("/") + "/", "api/update/check")
-            response = self._session.get(url, params=params)
-            response.raise_for_status()
+            url = _api_url(self.config, "api/update/check")
+            response = self._get(url, params=params)
             
-            data = response.json()
-            info = UpdateInfo(
-                update_available=data.get("update_available", False),
-                current_version=data.get("current_version", self.config.current_version),
-                latest_version=data.get("latest_version"),
-                is_mandatory=data.get("is_mandatory", False),
-                release_notes=data.get("release_notes"),
-                download_url=data.get("download_url"),
-                file_size=data.get("file_size"),
-                file_hash=data.get("file_hash")
-            )
+            info = _parse_update_info(self.config, response.json())
             
             if self.on_update_available and info.update_available:
                 self.on_update_available(info)
@@ -120,6 +211,8 @@ class AutoUpdater:
         """
         업데이트 파일 다운로드
         
+        cache_dir을 설정하면 머신 공용 캐시를 거친다 (같은 파일은 한 번만 받음).
+        
         Args:
             update_info: 업데이트 정보
             progress_callback: 진행률 콜백 함수
@@ -129,6 +222,7 @@ class AutoUpdater:
         
         Raises:
             ValueError: 다운로드할 업데이트가 없음
+            ServerBusyError: 재시도 후에도 서버가 요청을 제한함
             requests.RequestException: 다운로드 실패
             ValueError: 파일 무결성 검증 실패
         """
@@ -137,57 +231,25 @@ class AutoUpdater:
         
         try:
             # 다운로드 경로 설정
-            download_dir = self.config.download_path or tempfile.gettempdir()
-            filename = f"update_{self.config.app_id}_{update_info.latest_version}"
-            
-            # 플랫폼별 확장자
-            if sys.platform == "win32":
-                filename += ".exe"
-            elif sys.platform == "darwin":
-                filename += ".dmg"
-            else:
-                filename += ".tar.gz"
-            
-            file_path = os.path.join(download_dir, filename)
+            file_path = _download_file_path(self.config, update_info)
             
             # 기존 파일 삭제
             if os.path.exists(file_path):
                 os.remove(file_path)
             
-            # 다운로드
-            download_url = update_info.download_url
-            if not download_url.startswith("http"):
-                download_url = urljoin(self.config.server_url.rstrip("/") + "/", download_url.lstrip("/"))
+            download_url = _api_url(self.config, update_info.download_url)
             
-            response = self._session.get(download_url, stream=True)
-            response.raise_for_status()
+            def download(path: str):
+                self._download_verified(download_url, path, update_info, progress_callback)
             
-            total_size = int(response.headers.get("content-length", 0)) or update_info.file_size or 0
-            downloaded = 0
-            
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if total_size > 0:
-                            progress = DownloadProgress(
-                                bytes_received=downloaded,
-                                total_bytes=total_size
-                            )
-                            
-                            if progress_callback:
-                                progress_callback(progress)
-                            if self.on_download_progress:
-                                self.on_download_progress(progress)
-            
-            # 해시 검증
-            if update_info.file_hash:
-                calculated_hash = self._calculate_file_hash(file_path)
-                if calculated_hash.lower() != update_info.file_hash.lower():
-                    os.remove(file_path)
-                    raise ValueError("다운로드된 파일의 무결성 검증에 실패했습니다.")
+            cache = _download_cache(self.config)
+            if cache is not None and update_info.file_hash:
+                # 같은 파일을 이미 받았거나 다른 프로세스가 받는 중이면 재사용
+                if cache.fetch(update_info.file_hash, file_path, download):
+                    size = os.path.getsize(file_path)
+                    self._report_progress(DownloadProgress(bytes_received=size, total_bytes=size), progress_callback)
+            else:
+                download(file_path)
             
             if self.on_download_complete:
                 self.on_download_complete(file_path)
@@ -199,6 +261,91 @@ class AutoUpdater:
                 self.on_error(e)
             raise
     
+    def _download_verified(
+        self,
+        url: str,
+        file_path: str,
+        update_info: UpdateInfo,
+        progress_callback: Optional[Callable[[DownloadProgress], None]]
+    ):
+        """file_path로 받으면서 해시 계산 후 검증 (실패 시 파일 삭제)"""
+        response = self._get_with_retry(url, stream=True)
+        
+        total_size = int(response.headers.get("content-length", 0)) or update_info.file_size or 0
+        downloaded = 0
+        chunk_size = AdaptiveChunkSize(self.config.download_chunk_size)
+        throttle = ProgressThrottle(
+            total_size, self.config.progress_interval_seconds, self.config.progress_step_percent
+        )
+        
+        # 받는 동안 해시 계산 (다운로드 후 파일을 다시 읽지 않음)
+        writer = HashingWriter(file_path)
+        try:
+            with response:
+                while True:
+                    started = time.monotonic()
+                    chunk = response.raw.read(chunk_size.size, decode_content=True)
+                    if not chunk:
+                        break
+                    chunk_size.observe(len(chunk), time.monotonic() - started)
+                    writer.write(chunk)
+                    downloaded += len(chunk)
+                    
+                    if throttle.should_report(downloaded):
+                        self._report_progress(
+                            DownloadProgress(bytes_received=downloaded, total_bytes=total_size),
+                            progress_callback
+                        )
+        finally:
+            writer.close()
+        
+        # 해시 검증
+        try:
+            verify_hash(writer.hexdigest(), update_info.file_hash)
+        except ValueError:
+            os.remove(file_path)
+            raise
+    
+    def _report_progress(
+        self,
+        progress: DownloadProgress,
+        progress_callback: Optional[Callable[[DownloadProgress], None]]
+    ):
+        if progress_callback:
+            progress_callback(progress)
+        if self.on_download_progress:
+            self.on_download_progress(progress)
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET 요청 (429/503 응답 시 Retry-After를 기록하고 ServerBusyError 발생)
+
+        Retry-After로 지정된 시간이 지나기 전에는 서버에 요청하지 않는다.
+        """
+        wait = self._retry_not_before - time.monotonic()
+        if wait > 0:
+            raise ServerBusyError(wait)
+        
+        response = self._session.get(url, timeout=self.config.timeout_seconds, **kwargs)
+        if response.status_code in (429, 503):
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            self._retry_not_before = time.monotonic() + retry_after
+            response.close()
+            raise ServerBusyError(retry_after, response=response)
+        
+        response.raise_for_status()
+        return response
+    
+    def _get_with_retry(self, url: str, **kwargs) -> requests.Response:
+        """서버가 요청을 제한하면 Retry-After만큼 기다린 후 재시도"""
+        for attempt in range(self.config.max_retries + 1):
+            try:
+                return self._get(url, **kwargs)
+            except ServerBusyError as e:
+                if attempt >= self.config.max_retries or e.retry_after > self.config.max_retry_wait_seconds:
+                    raise
+                time.sleep(e.retry_after)
+    
     def check_and_download(
         self,
         progress_callback: Optional[Callable[[DownloadProgress], None]] = None
@@ -217,6 +364,273 @@ class AutoUpdater:
         file_path = self.download_update(info, progress_callback)
         return info, file_path
     
+    def predownload_update(
+        self,
+        update_info: UpdateInfo,
+        stop_event: Optional[threading.Event] = None,
+        progress_callback: Optional[Callable[[DownloadProgress], None]] = None
+    ) -> Optional[StagedUpdate]:
+        """
+        업데이트를 미리 받아 검증한 후 staging 위치에 보관 (다음 실행 시 install_staged_update()로 바로 설치)
+        
+        background_download_rate_limit 속도로 받으며, 중지되거나 앱이 종료되어도 다음 호출 시
+        받은 부분부터 이어받는다 (HTTP Range). cache_dir을 설정하면 머신 공용 캐시를 거친다.
+        
+        Args:
+            update_info: 업데이트 정보
+            stop_event: 설정되면 받던 부분을 남겨 두고 중지
+            progress_callback: 진행률 콜백 함수
+        
+        Returns:
+            StagedUpdate: 보관된 업데이트 (중지되면 None)
+        
+        Raises:
+            ValueError: 다운로드할 업데이트가 없음 / 파일 무결성 검증 실패
+            ServerBusyError: 재시도 후에도 서버가 요청을 제한함
+            requests.RequestException: 다운로드 실패
+        """
+        if not update_info.update_available or not update_info.download_url:
+            raise ValueError("다운로드할 업데이트가 없습니다.")
+        stop_event = stop_event or threading.Event()
+        
+        try:
+            staged = self.get_staged_update()
+            if staged is not None and staged.update_info.file_hash == update_info.file_hash:
+                return staged
+            
+            stage_dir = _staging_dir(self.config)
+            os.makedirs(stage_dir, exist_ok=True)
+            file_path = os.path.join(stage_dir, os.path.basename(_download_file_path(self.config, update_info)))
+            part_path = file_path + PART_SUFFIX
+            # 이전 버전의 보관 파일/받다 만 파일 정리 (이번 파일의 받던 부분은 유지)
+            self._clear_staging(keep=part_path)
+            
+            download_url = _api_url(self.config, update_info.download_url)
+            
+            def download(path: str):
+                # 이어받기는 항상 이 사용자의 staging 위치에서 (공용 캐시의 임시 파일은 프로세스별)
+                self._download_resumable(download_url, part_path, update_info, stop_event, progress_callback)
+                if path != part_path:
+                    if os.path.exists(path):
+                        os.remove(path)
+                    shutil.move(part_path, path)
+            
+            cache = _download_cache(self.config)
+            if cache is not None and update_info.file_hash:
+                cache.fetch(update_info.file_hash, file_path, download)
+            else:
+                download(part_path)
+                os.replace(part_path, file_path)
+            
+            staged = StagedUpdate(update_info=update_info, file_path=file_path)
+            stat = os.stat(file_path)
+            manifest = {
+                "base_version": self.config.current_version,
+                "file_path": file_path,
+                # 자동 확인마다 전체 해시를 다시 계산하지 않도록 검증 당시의 크기/수정 시각 기록
+                "file_size": stat.st_size,
+                "file_mtime_ns": stat.st_mtime_ns,
+                "update_info": asdict(update_info)
+            }
+            manifest_path = os.path.join(stage_dir, STAGED_MANIFEST)
+            with open(manifest_path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(manifest_path + ".tmp", manifest_path)
+            
+            if self.on_update_staged:
+                self.on_update_staged(staged)
+            return staged
+            
+        except DownloadPaused:
+            return None
+        except Exception as e:
+            if self.on_error:
+                self.on_error(e)
+            raise
+    
+    def _download_resumable(
+        self,
+        url: str,
+        part_path: str,
+        update_info: UpdateInfo,
+        stop_event: threading.Event,
+        progress_callback: Optional[Callable[[DownloadProgress], None]]
+    ):
+        """
+        part_path에 이어받은 후 해시 검증 (실패 시 파일 삭제)
+        
+        Raises:
+            DownloadPaused: stop_event가 설정됨 (받은 부분은 남겨 둠)
+        """
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if offset and update_info.file_size and offset >= update_info.file_size:
+            # 다 받은 후 보관 전에 종료된 경우
+            if offset == update_info.file_size and (
+                not update_info.file_hash or file_sha256(part_path) == update_info.file_hash.lower()
+            ):
+                return
+            os.remove(part_path)
+            offset = 0
+        
+        try:
+            response = self._get_with_retry(url, stream=True, headers={"Range": f"bytes={offset}-"} if offset else {})
+        except requests.HTTPError as e:
+            if not offset or e.response is None or e.response.status_code != 416:
+                raise
+            # 받은 부분이 서버 파일보다 큼 → 처음부터
+            os.remove(part_path)
+            offset = 0
+            response = self._get_with_retry(url, stream=True)
+        
+        # 서버가 Range를 무시하고 전체 파일(200)을 보내면 처음부터 다시 씀
+        resumed = (
+            offset > 0
+            and response.status_code == 206
+            and response.headers.get("Content-Range", "").startswith(f"bytes {offset}-")
+        )
+        total_size = update_info.file_size or (
+            (offset if resumed else 0) + int(response.headers.get("content-length", 0))
+        )
+        rate = self.config.background_download_rate_limit
+        limiter = RateLimiter(rate) if rate > 0 else None
+        chunk_size = AdaptiveChunkSize(
+            self.config.download_chunk_size,
+            max_size=limiter.chunk_size if limiter else MAX_CHUNK_SIZE
+        )
+        throttle = ProgressThrottle(
+            total_size, self.config.progress_interval_seconds, self.config.progress_step_percent
+        )
+        
+        writer = HashingWriter(part_path, append=resumed)
+        try:
+            with response:
+                while True:
+                    if stop_event.is_set():
+                        raise DownloadPaused()
+                    started = time.monotonic()
+                    chunk = response.raw.read(chunk_size.size, decode_content=True)
+                    if not chunk:
+                        break
+                    chunk_size.observe(len(chunk), time.monotonic() - started)
+                    writer.write(chunk)
+                    
+                    if throttle.should_report(writer.bytes_written):
+                        self._report_progress(
+                            DownloadProgress(bytes_received=writer.bytes_written, total_bytes=total_size),
+                            progress_callback
+                        )
+                    
+                    # 대역폭 제한: 읽기를 쉬는 동안 TCP 흐름 제어로 서버 송신도 느려짐
+                    if limiter is not None:
+                        wait = limiter.reserve(len(chunk))
+                        if wait and stop_event.wait(wait):
+                            raise DownloadPaused()
+        finally:
+            writer.close()
+        
+        try:
+            verify_hash(writer.hexdigest(), update_info.file_hash)
+        except ValueError:
+            os.remove(part_path)
+            raise
+    
+    def get_staged_update(self, verify: bool = False) -> Optional[StagedUpdate]:
+        """
+        미리 받아 둔 업데이트 (없거나 현재 버전 기준으로 받은 것이 아니면 None)
+        
+        설치 후 재시작하여 current_version이 바뀌었거나 파일이 손상되었으면 보관 파일을 정리한다.
+        해시는 verify이거나 파일 크기/수정 시각이 보관할 때와 다를 때만 다시 계산한다.
+        
+        Args:
+            verify: 크기/수정 시각이 같아도 해시 재확인 (설치 직전)
+        """
+        manifest_path = os.path.join(_staging_dir(self.config), STAGED_MANIFEST)
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        known = {field.name for field in fields(UpdateInfo)}
+        info = UpdateInfo(**{key: value for key, value in manifest.get("update_info", {}).items() if key in known})
+        file_path = manifest.get("file_path", "")
+        try:
+            stat = os.stat(file_path) if manifest.get("base_version") == self.config.current_version else None
+        except OSError:
+            stat = None
+        valid = stat is not None
+        if valid and info.file_hash:
+            unchanged = (
+                stat.st_size == manifest.get("file_size")
+                and stat.st_mtime_ns == manifest.get("file_mtime_ns")
+            )
+            if verify or not unchanged:
+                valid = file_sha256(file_path) == info.file_hash.lower()
+        if not valid:
+            self._clear_staging()
+            return None
+        return StagedUpdate(update_info=info, file_path=file_path)
+    
+    def install_staged_update(self, arguments: str = None) -> bool:
+        """
+        미리 받아 둔 업데이트가 있으면 설치 후 현재 앱 종료 (앱 시작 시 호출)
+        
+        Returns:
+            bool: 미리 받아 둔 업데이트가 없으면 False (있으면 설치 후 종료하므로 반환하지 않음)
+        """
+        staged = self.get_staged_update(verify=True)
+        if staged is None:
+            return False
+        self.install_and_restart(staged.file_path, arguments)
+        return True
+    
+    def _clear_staging(self, keep: Optional[str] = None):
+        """staging 디렉토리의 파일 삭제 (keep 제외)"""
+        stage_dir = _staging_dir(self.config)
+        if not os.path.isdir(stage_dir):
+            return
+        for name in os.listdir(stage_dir):
+            path = os.path.join(stage_dir, name)
+            if path != keep and os.path.isfile(path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def start_background_download(self, update_info: Optional[UpdateInfo] = None):
+        """
+        백그라운드 스레드에서 업데이트 미리 받기 시작 (update_info 미지정 시 먼저 업데이트 확인)
+        
+        완료되면 on_update_staged 콜백이 호출되고, 오류는 on_error 콜백으로 전달된다.
+        """
+        self.stop_background_download()
+        stop_event = threading.Event()
+        self._background_stop = stop_event
+        self._background_thread = threading.Thread(
+            target=self._background_download,
+            args=(update_info, stop_event),
+            name=f"deploy-helper-predownload-{self.config.app_id}",
+            daemon=True
+        )
+        self._background_thread.start()
+    
+    def _background_download(self, update_info: Optional[UpdateInfo], stop_event: threading.Event):
+        try:
+            info = update_info or self.check_for_update()
+            if info.update_available:
+                self.predownload_update(info, stop_event)
+        except Exception:
+            pass  # on_error 콜백으로 전달됨
+    
+    def stop_background_download(self):
+        """백그라운드 미리 받기 중지 (받은 부분은 다음에 이어받음)"""
+        if self._background_stop is not None:
+            self._background_stop.set()
+            self._background_stop = None
+        thread, self._background_thread = self._background_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.config.timeout_seconds)
+    
     def install_and_restart(self, installer_path: str, arguments: str = None):
         """
         설치 파일 실행 후 현재 앱 종료
@@ -250,46 +664,61 @@ class AutoUpdater:
         sys.exit(0)
     
     def start_auto_check(self):
-        """주기적 자동 업데이트 확인 시작"""
+        """
+        주기적 자동 업데이트 확인 시작 (백그라운드 스레드 1개)
+        
+        첫 확인은 [0, 주기) 사이의 무작위 시점에 실행하고 (auto_check_on_start이면 바로 확인),
+        이후 주기에도 ±auto_check_jitter 비율의 편차를 주어 같은 시각에 시작한 클라이언트들이
+        한꺼번에 서버에 몰리지 않도록 한다.
+        서버가 권장 주기를 알려주면 그 주기를 따르고, 실패가 이어지면 주기를 점점 늘린다.
+        """
         if self.config.auto_check_interval_minutes <= 0:
             return
         
         self.stop_auto_check()
-        
-        def check():
-            try:
-                self.check_for_update()
-            except:
-                pass
-            self._schedule_next_check()
-        
-        self._schedule_next_check()
+        scheduler = PollScheduler(
+            self.config.auto_check_interval_minutes * 60,
+            jitter=self.config.auto_check_jitter,
+            max_backoff_seconds=self.config.auto_check_max_backoff_minutes * 60,
+            check_on_start=self.config.auto_check_on_start
+        )
+        stop_event = threading.Event()
+        self._auto_check_stop = stop_event
+        self._auto_check_thread = threading.Thread(
+            target=self._auto_check_loop,
+            args=(scheduler, stop_event),
+            name=f"deploy-helper-auto-check-{self.config.app_id}",
+            daemon=True
+        )
+        self._auto_check_thread.start()
     
-    def _schedule_next_check(self):
-        """다음 자동 확인 예약"""
-        interval = self.config.auto_check_interval_minutes * 60
-        self._auto_check_timer = threading.Timer(interval, self.check_for_update)
-        self._auto_check_timer.daemon = True
-        self._auto_check_timer.start()
+    def _auto_check_loop(self, scheduler: PollScheduler, stop_event: threading.Event):
+        """자동 확인 반복 (오류는 on_error 콜백으로 전달되고 스레드는 계속 실행)"""
+        delay = scheduler.initial_delay()
+        while not stop_event.wait(delay):
+            try:
+                info = self.check_for_update()
+                if self.config.auto_predownload and info.update_available:
+                    self.predownload_update(info, stop_event)
+                delay = scheduler.success(info.poll_interval_seconds)
+            except ServerBusyError as e:
+                delay = scheduler.failure(e.retry_after)
+            except Exception:
+                delay = scheduler.failure()
     
     def stop_auto_check(self):
         """자동 업데이트 확인 중지"""
-        if self._auto_check_timer:
-            self._auto_check_timer.cancel()
-            self._auto_check_timer = None
-    
-    @staticmethod
-    def _calculate_file_hash(file_path: str) -> str:
-        """SHA256 해시 계산"""
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        if self._auto_check_stop is not None:
+            self._auto_check_stop.set()
+            self._auto_check_stop = None
+        thread, self._auto_check_thread = self._auto_check_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.config.timeout_seconds)
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop_auto_check()
+        self.stop_background_download()
         self._session.close()
@@ -0,0 +1,353 @@
+"""
+머신 공용 다운로드 캐시 (파일 해시 기준)
+
+터미널 서버의 여러 사용자나 같은 런타임을 포함한 여러 앱이 동시에 업데이트해도 같은 파일은 한 번만 받는다.
+
+- 캐시 항목은 서버가 알려준 SHA256(file_hash)을 파일 이름으로 저장 (검증을 통과한 파일만)
+- 항목별 잠금 파일로 프로세스 간 동기화: 다른 프로세스가 받는 중이면 끝날 때까지 기다렸다가 재사용
+- 호출자에게는 하드 링크(불가능하면 복사)를 넘겨주므로 캐시에서 지워져도 받은 파일은 그대로 남음
+- 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 삭제 (사용 중인 항목은 건너뜀)
+
+디렉토리 구조:
+    <cache_dir>/<sha256>        검증된 파일
+    <cache_dir>/<sha256>.<임의>.part   받는 중인 파일 (프로세스별)
+    <cache_dir>/<sha256>.lock   항목 잠금 파일
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # Windows 외
+    msvcrt = None
+
+from .download import file_sha256
+
+PART_SUFFIX = ".part"
+LOCK_SUFFIX = ".lock"
+
+
+def default_cache_dir() -> str:
+    """모든 사용자가 함께 쓰는 플랫폼별 기본 캐시 위치"""
+    if sys.platform == "win32":
+        root = os.environ.get("PROGRAMDATA", r"C:\ProgramData")
+        return os.path.join(root, "DeployHelper", "cache")
+    if sys.platform == "darwin":
+        return "/Users/Shared/DeployHelper/cache"
+    return "/var/tmp/deploy-helper-cache"
+
+
+class FileLock:
+    """
+    프로세스 간 배타 잠금 (fcntl.flock / msvcrt.locking)
+
+    같은 프로세스의 다른 스레드도 FileLock 객체를 따로 만들면 서로 배제된다.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.1):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        잠금 획득
+
+        Args:
+            timeout: 최대 대기 시간 (None이면 무제한, 0이면 기다리지 않음)
+
+        Returns:
+            bool: 획득 여부
+        """
+        fd = self._open()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            if self._try_lock(fd):
+                self._fd = fd
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                os.close(fd)
+                return False
+            time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+    def _open(self) -> int:
+        try:
+            return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        except PermissionError:
+            # 다른 사용자가 만든 잠금 파일 (읽기 전용으로도 잠글 수 있음)
+            return os.open(self.path, os.O_RDONLY)
+
+    @staticmethod
+    def _try_lock(fd: int) -> bool:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class DownloadCache:
+    """
+    머신 공용 다운로드 캐시
+
+    사용 예시:
+        cache = DownloadCache(default_cache_dir(), max_bytes=2 * 1024 ** 3)
+        hit = cache.fetch(file_hash, "/tmp/update.exe", lambda part: download_and_verify(url, part))
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 0,
+        lock_timeout: Optional[float] = None,
+        verify_on_hit: bool = True
+    ):
+        """
+        Args:
+            directory: 캐시 디렉토리 (없으면 생성)
+            max_bytes: 최대 전체 크기 (0이면 제한 없음)
+            lock_timeout: 다른 프로세스의 다운로드를 기다릴 최대 시간 (넘으면 캐시 없이 직접 받음)
+            verify_on_hit: 캐시에서 꺼낸 파일의 해시를 다시 확인 (다른 사용자와 디렉토리를 공유하므로 기본 사용)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock_timeout = lock_timeout
+        self.verify_on_hit = verify_on_hit
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+            if os.name == "posix":
+                try:
+                    # 모든 사용자가 쓰되 남의 파일은 지우지 못하도록 (/tmp와 같은 sticky 권한)
+                    os.chmod(directory, 0o1777)
+                except OSError:
+                    pass
+
+    def path(self, file_hash: str) -> str:
+        return os.path.join(self.directory, file_hash.lower())
+
+    def lock(self, file_hash: str) -> FileLock:
+        return FileLock(self.path(file_hash) + LOCK_SUFFIX)
+
+    def lookup(self, file_hash: str) -> Optional[str]:
+        """캐시 항목 경로 (없으면 None), 찾으면 최근 사용 시각 갱신 (잠금을 잡은 상태에서 호출)"""
+        path = self.path(file_hash)
+        if not os.path.isfile(path):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # 다른 사용자의 항목
+        return path
+
+    def commit(self, file_hash: str, part_path: str) -> str:
+        """검증을 마친 파일을 캐시 항목으로 등록 (잠금을 잡은 상태에서 호출)"""
+        path = self.path(file_hash)
+        os.replace(part_path, path)
+        if os.name == "posix":
+            try:
+                os.chmod(path, 0o644)
+            except OSError:
+                pass
+        return path
+
+    def discard(self, file_hash: str) -> None:
+        """손상된 캐시 항목 삭제 (잠금을 잡은 상태에서 호출)"""
+        try:
+            os.remove(self.path(file_hash))
+        except OSError:
+            pass
+
+    def export(self, file_hash: str, dest: str, verify: bool = True) -> bool:
+        """
+        캐시 항목을 dest로 하드 링크 (불가능하면 복사)
+
+        Returns:
+            bool: verify이고 verify_on_hit일 때 dest의 해시가 file_hash와 같은지 (다르면 dest를 삭제)
+        """
+        source = self.path(file_hash)
+        if os.path.exists(dest):
+            os.remove(dest)
+        # 다른 사용자의 파일은 권한(chmod 등)을 바꿀 수 없으므로 복사
+        same_owner = not hasattr(os, "getuid") or os.stat(source).st_uid == os.getuid()
+        try:
+            if not same_owner:
+                raise OSError("다른 사용자의 캐시 항목")
+            os.link(source, dest)
+        except OSError:
+            shutil.copyfile(source, dest)
+        if verify and self.verify_on_hit and file_sha256(dest) != file_hash.lower():
+            os.remove(dest)
+            return False
+        return True
+
+    def acquire(self, file_hash: str) -> Optional[FileLock]:
+        """항목 잠금 획득 (lock_timeout 초과 또는 잠금 파일을 만들 수 없으면 None)"""
+        lock = self.lock(file_hash)
+        try:
+            return lock if lock.acquire(self.lock_timeout) else None
+        except OSError:
+            return None
+
+    def try_export(self, file_hash: str, dest: str) -> bool:
+        """캐시 항목이 있으면 dest로 꺼냄 (없거나 손상되었거나 꺼낼 수 없으면 False, 잠금을 잡은 상태에서 호출)"""
+        try:
+            if self.lookup(file_hash) is None:
+                return False
+            if self.export(file_hash, dest):
+                return True
+        except OSError:
+            return False
+        self.discard(file_hash)
+        return False
+
+    def temp_path(self, file_hash: str) -> Optional[str]:
+        """
+        받을 임시 파일 (프로세스마다 따로 생성, 캐시 디렉토리에 쓸 수 없으면 None)
+
+        고정된 이름을 쓰면 다른 사용자의 프로세스가 남긴 파일을 sticky 디렉토리에서 덮어쓰거나 지울 수 없다.
+        """
+        try:
+            fd, path = tempfile.mkstemp(prefix=file_hash.lower() + ".", suffix=PART_SUFFIX, dir=self.directory)
+        except OSError:
+            return None
+        os.close(fd)
+        return path
+
+    def store(self, file_hash: str, temp_path: str, dest: str) -> None:
+        """
+        검증을 마친 임시 파일을 캐시에 등록하고 dest로 꺼냄 (잠금을 잡은 상태에서 호출)
+
+        캐시에 등록할 수 없으면 (다른 사용자의 항목이 남아 있는 등) 받은 파일을 dest로 그대로 옮긴다.
+        """
+        try:
+            self.commit(file_hash, temp_path)
+            self.export(file_hash, dest, verify=False)
+            return
+        except OSError:
+            pass
+        if os.path.exists(dest):
+            os.remove(dest)
+        shutil.move(temp_path, dest)
+
+    def remove_temp(self, temp_path: str) -> None:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+    def fetch(self, file_hash: str, dest: str, download: Callable[[str], None]) -> bool:
+        """
+        캐시에서 dest로 꺼내거나, 없으면 받아서 캐시에 등록한 후 꺼냄
+
+        같은 항목을 다른 프로세스가 받는 중이면 끝날 때까지 기다린다.
+        lock_timeout이 지나도록 끝나지 않거나 캐시 디렉토리를 쓸 수 없으면 캐시를 거치지 않고 dest로 직접 받는다.
+
+        Args:
+            file_hash: 파일 SHA256
+            dest: 받을 파일 경로
+            download: 지정한 경로로 받아서 해시까지 검증하는 함수 (실패 시 예외)
+
+        Returns:
+            bool: 캐시 적중 여부
+        """
+        lock = self.acquire(file_hash)
+        if lock is None:
+            download(dest)
+            return False
+        try:
+            if self.try_export(file_hash, dest):
+                return True
+            temp_path = self.temp_path(file_hash)
+            if temp_path is None:
+                download(dest)
+                return False
+            try:
+                download(temp_path)
+                self.store(file_hash, temp_path, dest)
+            finally:
+                self.remove_temp(temp_path)
+            return False
+        finally:
+            lock.release()
+            self.evict(keep=file_hash)
+
+    def entries(self) -> List[Tuple[str, int, float]]:
+        """캐시 파일 목록 (이름, 크기, 최근 사용 시각), 받는 중인 파일 포함"""
+        result = []
+        for name in os.listdir(self.directory):
+            if name.endswith(LOCK_SUFFIX):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            result.append((name, stat.st_size, stat.st_mtime))
+        return result
+
+    def evict(self, keep: Optional[str] = None) -> int:
+        """
+        전체 크기가 max_bytes 이하가 될 때까지 가장 오래 쓰지 않은 항목 삭제
+
+        다른 프로세스가 쓰고 있는(잠긴) 항목과 keep 항목은 건너뛴다.
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        if self.max_bytes <= 0:
+            return 0
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        keep = keep.lower() if keep else None
+        for name, size, _ in sorted(entries, key=lambda entry: entry[2]):
+            if total <= self.max_bytes:
+                break
+            # <sha256>.<임의>.part → 해당 항목의 잠금 (받는 중이면 잠겨 있음)
+            file_hash = name.split(".", 1)[0]
+            if file_hash == keep:
+                continue
+            lock = self.lock(file_hash)
+            if not lock.acquire(timeout=0):
+                continue
+            try:
+                os.remove(os.path.join(self.directory, name))
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+            finally:
+                lock.release()
+        return removed
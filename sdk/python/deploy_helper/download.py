@@ -0,0 +1,137 @@
+"""
+다운로드 스트리밍 보조 기능 (AutoUpdater / AsyncAutoUpdater 공용)
+
+- 받는 동안 SHA256을 함께 계산하여 다운로드 후 파일을 다시 읽지 않음
+- 읽기 크기를 전송 속도에 맞춰 조절 (빠르면 키우고 느리면 줄임)
+- 진행률 콜백은 일정 시간 또는 일정 비율마다만 호출
+- 백그라운드 다운로드용 대역폭 제한 (토큰 버킷)과 이어받기
+"""
+
+import hashlib
+import os
+import time
+from typing import Optional
+
+# 자동 읽기 크기 범위 (bytes)
+MIN_CHUNK_SIZE = 16 * 1024
+INITIAL_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
+
+# 읽기 한 번에 걸리는 목표 시간 (초): 이보다 빠르면 크기를 키우고, 4배 넘게 느리면 줄임
+TARGET_READ_SECONDS = 0.05
+
+
+class AdaptiveChunkSize:
+    """전송 속도에 맞춘 읽기 크기 (fixed_size 지정 시 고정)"""
+
+    def __init__(self, fixed_size: int = 0, max_size: int = MAX_CHUNK_SIZE):
+        self.fixed = fixed_size > 0
+        self.max_size = max(MIN_CHUNK_SIZE, max_size)
+        self.size = fixed_size if self.fixed else min(INITIAL_CHUNK_SIZE, self.max_size)
+
+    def observe(self, received: int, elapsed: float) -> None:
+        """한 번 읽은 결과 반영"""
+        if self.fixed:
+            return
+        if received >= self.size and elapsed < TARGET_READ_SECONDS:
+            self.size = min(self.size * 2, self.max_size)
+        elif elapsed > TARGET_READ_SECONDS * 4:
+            self.size = max(self.size // 2, MIN_CHUNK_SIZE)
+
+
+class ProgressThrottle:
+    """진행률 콜백 호출 간격 제한 (시간 또는 진행 비율 기준, 완료 시에는 항상 호출)"""
+
+    def __init__(self, total_bytes: int, interval_seconds: float, step_percent: float):
+        self.total_bytes = total_bytes
+        self.interval_seconds = interval_seconds
+        self.step_bytes = total_bytes * step_percent / 100 if step_percent > 0 else 0
+        self._last_time = time.monotonic()
+        self._last_bytes = 0
+
+    def should_report(self, received: int) -> bool:
+        if self.total_bytes <= 0:
+            return False
+        now = time.monotonic()
+        if (
+            received >= self.total_bytes
+            or now - self._last_time >= self.interval_seconds
+            or (self.step_bytes and received - self._last_bytes >= self.step_bytes)
+        ):
+            self._last_time = now
+            self._last_bytes = received
+            return True
+        return False
+
+
+class RateLimiter:
+    """
+    읽기 루프 대역폭 제한 (토큰 버킷, bytes/초)
+
+    읽을 때마다 reserve()가 돌려준 시간만큼 쉬면 평균 속도가 rate 이하로 유지된다.
+    읽기를 멈추면 OS 수신 버퍼가 차서 TCP 흐름 제어로 서버 송신 속도도 함께 줄어든다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    @property
+    def chunk_size(self) -> int:
+        """한 번에 읽을 최대 크기 (0.25초 분량, 큰 버스트 후 긴 휴식 방지)"""
+        return max(MIN_CHUNK_SIZE, int(self.rate / 4))
+
+    def reserve(self, amount: int) -> float:
+        """amount 바이트를 쓰고 기다려야 할 시간(초) 반환"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= amount
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class DownloadPaused(Exception):
+    """백그라운드 다운로드가 중지됨 (받은 부분은 이어받기용으로 남아 있음)"""
+
+
+class HashingWriter:
+    """파일에 쓰면서 SHA256 계산 (append=True면 기존 내용 뒤에 이어 씀)"""
+
+    def __init__(self, file_path: str, append: bool = False):
+        self._sha256 = hashlib.sha256()
+        self.bytes_written = 0
+        if append and os.path.exists(file_path):
+            # 이미 받은 부분도 해시에 포함
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    self._sha256.update(block)
+                    self.bytes_written += len(block)
+        self._file = open(file_path, "ab" if append else "wb")
+
+    def write(self, data: bytes) -> None:
+        self._file.write(data)
+        self._sha256.update(data)
+        self.bytes_written += len(data)
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def verify_hash(actual: str, expected: Optional[str]) -> None:
+    """서버가 알려준 해시와 비교 (해시 정보가 없으면 검증 생략)"""
+    if expected and actual.lower() != expected.lower():
+        raise ValueError("다운로드된 파일의 무결성 검증에 실패했습니다.")
+
+
+def file_sha256(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """이미 받은 파일의 SHA256 (공유 캐시 검증용)"""
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
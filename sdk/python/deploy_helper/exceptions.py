@@ -0,0 +1,18 @@
+"""
+예외 정의
+"""
+
+import requests
+
+
+class ServerBusyError(requests.HTTPError):
+    """
+    서버가 요청을 일시적으로 거부함 (429 / 503)
+
+    Attributes:
+        retry_after: 다시 요청하기 전까지 기다려야 하는 시간(초)
+    """
+
+    def __init__(self, retry_after: float, *args, **kwargs):
+        self.retry_after = retry_after
+        super().__init__(f"서버가 요청을 제한하고 있습니다. {retry_after:.0f}초 후 다시 시도하세요.", *args, **kwargs)
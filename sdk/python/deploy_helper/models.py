@@ -16,6 +16,22 @@ class UpdaterConfig:
     timeout_seconds: int = 30
     download_path: Optional[str] = None
     auto_check_interval_minutes: int = 0
+    auto_check_jitter: float = 0.1  # 자동 확인 주기에 더할 무작위 편차 비율 (0.1 → ±10%)
+    auto_check_max_backoff_minutes: int = 0  # 연속 실패 시 최대 확인 주기 (0이면 확인 주기의 8배)
+    auto_check_on_start: bool = False  # 자동 확인 시작 직후 바로 한 번 확인 (기본은 [0, 주기) 사이의 무작위 시점)
+    client_id: Optional[str] = None  # 서버 요청 제한 키 (X-Client-ID 헤더, 미지정 시 IP 기준)
+    max_retries: int = 3  # 다운로드가 429/503으로 거부될 때 재시도 횟수
+    max_retry_wait_seconds: int = 300  # Retry-After가 이보다 길면 기다리지 않고 실패
+    download_chunk_size: int = 0  # 다운로드 읽기 크기 (bytes, 0이면 전송 속도에 맞춰 자동 조절)
+    progress_interval_seconds: float = 0.25  # 진행률 콜백 최소 간격
+    progress_step_percent: float = 1.0  # 이 비율만큼 진행되면 간격과 관계없이 진행률 콜백 호출
+    cache_dir: Optional[str] = None  # 머신 공용 다운로드 캐시 위치 (None이면 사용 안 함, cache.default_cache_dir() 참고)
+    cache_max_bytes: int = 2 * 1024 ** 3  # 캐시 최대 크기 (넘으면 오래 쓰지 않은 항목부터 삭제, 0이면 제한 없음)
+    cache_lock_timeout_seconds: float = 600  # 다른 프로세스의 다운로드를 기다릴 최대 시간 (넘으면 캐시 없이 직접 받음)
+    cache_verify_on_hit: bool = True  # 캐시에서 꺼낸 파일의 해시 재확인
+    auto_predownload: bool = False  # 자동 확인에서 업데이트를 찾으면 백그라운드로 미리 받아 둠
+    background_download_rate_limit: int = 1024 * 1024  # 백그라운드 다운로드 최대 속도 (bytes/초, 0이면 제한 없음)
+    staging_path: Optional[str] = None  # 미리 받은 설치 파일 위치 (미지정 시 download_path 또는 임시 디렉토리 아래)
 
 
 @dataclass
@@ -29,6 +45,14 @@ class UpdateInfo:
     download_url: Optional[str] = None
     file_size: Optional[int] = None
     file_hash: Optional[str] = None
+    poll_interval_seconds: Optional[int] = None  # 서버 권장 자동 확인 주기
+
+
+@dataclass
+class StagedUpdate:
+    """미리 받아 검증까지 마친 업데이트 (다음 실행 시 바로 설치 가능)"""
+    update_info: UpdateInfo
+    file_path: str
 
 
 @dataclass
@@ -0,0 +1,77 @@
+"""
+자동 업데이트 확인 주기 계산 (AutoUpdater / AsyncAutoUpdater 공용)
+
+- 첫 확인은 시작 직후가 아니라 [0, 주기) 사이의 무작위 시점 (check_on_start이면 바로 확인)
+  플릿 전체가 같은 시각에 켜지거나 재시작해도 첫 확인이 주기 전체에 고르게 퍼진다.
+- 매 주기에 ±jitter 비율의 무작위 편차를 주어, 같은 시각에 시작한 클라이언트들도 점차 고르게 흩어짐
+- 서버가 권장 주기(poll_interval_seconds)를 알려주면 설정값 대신 사용
+- 연속 실패 시 주기를 2배씩 늘림 (최대 max_backoff_seconds), 429/503은 Retry-After 이전에 다시 확인하지 않음
+"""
+
+import random
+from typing import Optional
+
+
+class PollScheduler:
+    """다음 자동 확인까지 기다릴 시간(초) 계산"""
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        jitter: float = 0.1,
+        max_backoff_seconds: float = 0,
+        rng: Optional[random.Random] = None,
+        check_on_start: bool = False
+    ):
+        """
+        Args:
+            interval_seconds: 기본 확인 주기 (서버 권장 주기가 없을 때)
+            jitter: 주기에 더할 무작위 편차 비율 (0.1 → ±10%)
+            max_backoff_seconds: 연속 실패 시 최대 주기 (0이면 기본 주기의 8배)
+            rng: 난수 생성기 (시뮬레이션 재현용)
+            check_on_start: 첫 확인을 기다리지 않고 바로 실행 (여러 대가 함께 켜지면 서버에 몰림)
+        """
+        self.interval_seconds = interval_seconds
+        self.jitter = max(0.0, min(jitter, 1.0))
+        self.max_backoff_seconds = max_backoff_seconds
+        self.server_interval_seconds: Optional[float] = None
+        self.check_on_start = check_on_start
+        self.failures = 0
+        self._rng = rng or random.Random()
+
+    @property
+    def base_interval(self) -> float:
+        """현재 확인 주기 (서버 권장 주기 우선)"""
+        return self.server_interval_seconds or self.interval_seconds
+
+    def initial_delay(self) -> float:
+        """첫 확인까지 기다릴 시간"""
+        if self.check_on_start:
+            return 0.0
+        return self._rng.random() * self.base_interval
+
+    def success(self, server_interval_seconds: Optional[float] = None) -> float:
+        """확인 성공 후 다음 확인까지 기다릴 시간"""
+        self.failures = 0
+        if server_interval_seconds and server_interval_seconds > 0:
+            self.server_interval_seconds = server_interval_seconds
+        return self._jittered(self.base_interval)
+
+    def failure(self, retry_after: Optional[float] = None) -> float:
+        """
+        확인 실패 후 다음 확인까지 기다릴 시간
+
+        Args:
+            retry_after: 서버가 Retry-After로 지정한 시간 (429/503)
+        """
+        self.failures += 1
+        max_backoff = self.max_backoff_seconds or self.base_interval * 8
+        backoff = min(self.base_interval * 2 ** (self.failures - 1), max(max_backoff, self.base_interval))
+        delay = self._jittered(backoff)
+        if retry_after is not None and delay < retry_after:
+            # Retry-After 이후에 흩어지도록 편차는 뒤쪽으로만
+            delay = retry_after + self._rng.uniform(0, retry_after * self.jitter)
+        return delay
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * self._rng.uniform(1 - self.jitter, 1 + self.jitter)
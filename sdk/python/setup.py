@@ -9,6 +9,10 @@ setup(
     install_requires=[
         "requests>=2.25.0",
     ],
+    extras_require={
+        # AsyncAutoUpdater (asyncio)
+        "async": ["httpx>=0.23.0"],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 4 - Beta",